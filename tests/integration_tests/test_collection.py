@@ -270,6 +270,50 @@ class TestCollections:
         assert collection.collection_status == "Online"
         assert collection.collection_state == "Active"
 
+    def test_get_collections(
+        self,
+        client: VantageClient,
+        account_params: dict,
+        test_collection_id: str,
+    ) -> None:
+        """
+        Tests if it can retrieve multiple collections, using the
+        collection cache for repeated lookups.
+        """
+        # Given
+        collection_id = test_collection_id
+
+        collection = UserProvidedEmbeddingsCollection(
+            collection_id=collection_id,
+            embeddings_dimension=1536,
+        )
+        create_temporary_upe_collection(
+            client=client,
+            collection=collection,
+            account_id=account_params["id"],
+        )
+        client.enable_collection_cache()
+
+        # When
+        collections = client.get_collections(
+            collection_ids=[collection_id, collection_id],
+            account_id=account_params["id"],
+        )
+        cached_collections = client.get_collections(
+            collection_ids=[collection_id],
+            account_id=account_params["id"],
+        )
+
+        # Then
+        assert [c.collection_id for c in collections] == [
+            collection_id,
+            collection_id,
+        ]
+        assert cached_collections[0].collection_id == collection_id
+        stats = client.collection_cache_stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+
     def test_get_collection_status(
         self,
         client: VantageClient,
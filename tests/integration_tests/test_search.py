@@ -13,6 +13,8 @@ from vantage_sdk.model.search import (
     FacetType,
     Filter,
     MoreLikeTheseItem,
+    Pagination,
+    SemanticSearchRequest,
     TotalCountsOptions,
     VantageVibeImageBase64,
     VantageVibeImageUrl,
@@ -958,4 +960,75 @@ class TestSearch:
         assert result.status == 200
         assert len(result.results) == 3
 
+    def test_batch_search_returns_results_in_order(
+        self,
+        client: VantageClient,
+        account_params: dict,
+        test_collection_id: str,
+    ):
+        """
+        Tests if batch search will return results in order of the queries,
+        capturing errors of failed searches.
+        """
+        # Given
+        collection_id = test_collection_id
+        queries = [
+            SemanticSearchRequest(
+                text="short legs and long body",
+                collection_id=collection_id,
+                accuracy=0.2,
+                account_id=account_params["id"],
+            ),
+            SemanticSearchRequest(
+                text="Test search",
+                collection_id="non-existing-collection",
+                account_id=account_params["id"],
+            ),
+            SemanticSearchRequest(
+                text="short legs and long body",
+                collection_id=collection_id,
+                accuracy=0.2,
+                account_id=account_params["id"],
+            ),
+        ]
+
+        # When
+        results = client.batch_search(queries=queries, max_concurrency=2)
+
+        # Then
+        assert len(results) == 3
+        assert results[0].succeeded
+        assert results[0].result.status == 200
+        assert len(results[0].result.results) == 3
+        assert not results[1].succeeded
+        assert isinstance(results[1].error, UnauthorizedException)
+        assert results[2].result == results[0].result
+
+    def test_iter_semantic_search_returns_all_pages(
+        self,
+        client: VantageClient,
+        account_params: dict,
+        test_collection_id: str,
+    ):
+        """
+        Tests if semantic search iterator will return items from all pages,
+        stopping after a page smaller than the page size.
+        """
+        # Given
+        collection_id = test_collection_id
+        search_text = "short legs and long body"
+
+        # When
+        items = list(
+            client.iter_semantic_search(
+                text=search_text,
+                collection_id=collection_id,
+                pagination=Pagination(count=2),
+                account_id=account_params["id"],
+            )
+        )
+
+        # Then
+        assert [item.id for item in items] == ["id_28", "id_15", "id_22"]
+
     # endregion
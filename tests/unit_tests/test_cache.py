@@ -0,0 +1,125 @@
+import time
+
+from vantage_sdk.core.cache import TTLCache, search_cache_key
+
+
+# Unit tests for SDK caches
+
+
+class TestCache:
+    def test_get_returns_put_value(self):
+        # Given
+        cache = TTLCache(ttl_seconds=60, max_entries=10)
+        cache.put("key", "value")
+
+        # When
+        value = cache.get("key")
+        missing = cache.get("missing")
+
+        # Then
+        assert value == "value"
+        assert missing is None
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.entries == 1
+
+    def test_expired_entry_is_not_returned(self):
+        # Given
+        cache = TTLCache(ttl_seconds=0.01, max_entries=10)
+        cache.put("key", "value")
+
+        # When
+        time.sleep(0.02)
+        value = cache.get("key")
+
+        # Then
+        assert value is None
+        stats = cache.stats()
+        assert stats.expirations == 1
+        assert stats.entries == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        # Given
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # When
+        cache.put("c", 3)
+
+        # Then
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_entries_are_evicted_to_stay_within_size_limit(self):
+        # Given
+        cache = TTLCache(ttl_seconds=60, max_entries=10, max_bytes=100)
+        cache.put("a", 1, size=40)
+        cache.put("b", 2, size=40)
+
+        # When
+        cache.put("c", 3, size=40)
+        cache.put("too-large", 4, size=101)
+
+        # Then
+        assert cache.get("a") is None
+        assert cache.get("too-large") is None
+        stats = cache.stats()
+        assert stats.entries == 2
+        assert stats.size_bytes == 80
+        assert stats.evictions == 1
+
+    def test_invalidate_tag_removes_only_tagged_entries(self):
+        # Given
+        cache = TTLCache(ttl_seconds=60, max_entries=10)
+        cache.put("a", 1, tag="collection-1")
+        cache.put("b", 2, tag="collection-1")
+        cache.put("c", 3, tag="collection-2")
+
+        # When
+        cache.invalidate_tag("collection-1")
+
+        # Then
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats().invalidations == 2
+
+    def test_value_computed_during_invalidation_is_not_stored(self):
+        # Given
+        cache = TTLCache(ttl_seconds=60, max_entries=10)
+        generation = cache.generation("collection-1")
+
+        # When
+        cache.invalidate_tag("collection-1")
+        cache.put("a", 1, tag="collection-1", generation=generation)
+        cache.put(
+            "b",
+            2,
+            tag="collection-1",
+            generation=cache.generation("collection-1"),
+        )
+
+        # Then
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_search_cache_key_does_not_depend_on_field_order(self):
+        # Given
+        query = {"text": "shoes", "collection": {"accuracy": 0.2}}
+        reordered_query = {"collection": {"accuracy": 0.2}, "text": "shoes"}
+
+        # When
+        key = search_cache_key("semantic_search", "a", "c", "k", query)
+        same_key = search_cache_key(
+            "semantic_search", "a", "c", "k", reordered_query
+        )
+        other_key = search_cache_key("semantic_search", "a", "d", "k", query)
+
+        # Then
+        assert key == same_key
+        assert key != other_key
@@ -0,0 +1,84 @@
+import os
+
+from vantage_sdk.core.checkpoint import CheckpointJournal
+
+
+# Unit tests for checkpoint journal
+
+
+class TestCheckpointJournal:
+    def test_resumes_after_contiguous_acknowledged_batches(self, tmp_path):
+        # Given
+        source = tmp_path / "documents.jsonl"
+        source.write_text("x" * 100)
+
+        with CheckpointJournal(str(source)) as journal:
+            journal.acknowledge(0, 0, 10)
+            journal.acknowledge(2, 20, 30)
+            journal.acknowledge(1, 10, 20)
+            journal.acknowledge(4, 40, 50)
+
+        # When
+        resumed = CheckpointJournal(str(source))
+
+        # Then
+        assert resumed.resume_offset == 30
+        assert resumed.resume_batch_index == 3
+        assert not resumed.is_acknowledged(30, 40)
+        assert resumed.is_acknowledged(40, 50)
+
+    def test_journal_is_discarded_when_source_changes(self, tmp_path):
+        # Given
+        source = tmp_path / "documents.jsonl"
+        source.write_text("x" * 100)
+
+        with CheckpointJournal(str(source)) as journal:
+            journal.acknowledge(0, 0, 10)
+
+        # When
+        source.write_text("y" * 200)
+        resumed = CheckpointJournal(str(source))
+
+        # Then
+        assert resumed.resume_offset == 0
+        assert not resumed.is_acknowledged(0, 10)
+
+    def test_incomplete_last_line_is_ignored(self, tmp_path):
+        # Given
+        source = tmp_path / "documents.jsonl"
+        source.write_text("x" * 100)
+
+        with CheckpointJournal(str(source)) as journal:
+            journal.acknowledge(0, 0, 10)
+
+        with open(journal.path, "a") as journal_file:
+            journal_file.write("1 10")
+
+        # When
+        resumed = CheckpointJournal(str(source))
+        resumed.complete()
+
+        # Then
+        assert resumed.resume_offset == 10
+        assert not os.path.exists(journal.path)
+
+    def test_truncated_last_line_is_removed_before_appending(self, tmp_path):
+        # Given
+        source = tmp_path / "documents.jsonl"
+        source.write_text("x" * 5000)
+
+        with CheckpointJournal(str(source)) as journal:
+            journal.acknowledge(0, 0, 1000)
+
+        # The write of "1 1000 2000" was cut short.
+        with open(journal.path, "a") as journal_file:
+            journal_file.write("1 1000 2")
+
+        # When
+        with CheckpointJournal(str(source)) as resumed:
+            resume_offset = resumed.resume_offset
+            resumed.acknowledge(1, 1000, 2000)
+
+        # Then
+        assert resume_offset == 1000
+        assert CheckpointJournal(str(source)).resume_offset == 2000
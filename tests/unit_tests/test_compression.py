@@ -0,0 +1,69 @@
+import gzip
+import io
+import tarfile
+
+from vantage_sdk.core.compression import (
+    decompressed_size,
+    detect_compression,
+    open_jsonl,
+    strip_compression_suffix,
+)
+from vantage_sdk.core.text_util import BatchTextFileReader
+
+
+# Unit tests for reading compressed JSONL files
+
+
+def _add_to_tar(archive: tarfile.TarFile, name: str, content: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    archive.addfile(info, io.BytesIO(content))
+
+
+class TestCompression:
+    def test_gzip_file_is_decompressed_while_batching(self, tmp_path):
+        # Given
+        content = "".join(f'{{"id": "{index}"}}\n' for index in range(10))
+        file_path = tmp_path / "documents.jsonl.gz"
+        file_path.write_bytes(gzip.compress(content.encode("utf-8")))
+
+        # When
+        with BatchTextFileReader(str(file_path), batch_size=4) as reader:
+            batches = list(reader)
+
+        # Then
+        assert detect_compression(str(file_path)) == "gzip"
+        assert decompressed_size(str(file_path)) == len(content)
+        assert [batch.count("\n") for batch in batches] == [4, 4, 2]
+        assert "".join(batches) == content
+
+    def test_tar_members_are_read_as_single_file(self, tmp_path):
+        # Given
+        file_path = tmp_path / "shards.tar.gz"
+        with tarfile.open(file_path, "w:gz") as archive:
+            _add_to_tar(archive, "shard-1.jsonl", b'{"id": "1"}\n')
+            _add_to_tar(archive, "shard-2.jsonl", b'{"id": "2"}')
+            _add_to_tar(archive, "shard-3.jsonl", b'{"id": "3"}\n')
+
+        # When
+        with open_jsonl(str(file_path)) as stream:
+            lines = stream.read().splitlines()
+
+        # Then
+        assert lines == [b'{"id": "1"}', b'{"id": "2"}', b'{"id": "3"}']
+
+    def test_plain_file_is_not_changed(self, tmp_path):
+        # Given
+        file_path = tmp_path / "documents.jsonl"
+        file_path.write_bytes(b'{"id": "1"}\n')
+
+        # When
+        with open_jsonl(str(file_path)) as stream:
+            content = stream.read()
+
+        # Then
+        assert detect_compression(str(file_path)) is None
+        assert content == b'{"id": "1"}\n'
+        assert strip_compression_suffix("shards.jsonl.tar.gz") == (
+            "shards.jsonl"
+        )
@@ -1,5 +1,12 @@
+import json
+
+import numpy
+import pytest
+
 from vantage_sdk.model.document import (
+    DocumentBatch,
     MetadataItem,
+    UserProvidedEmbeddingsDocument,
     VantageDocument,
     Variant,
     VariantItem,
@@ -44,3 +51,63 @@ class TestDocuments:
             assert len(variant.items) == 1
             assert variant.items[0].key.startswith("var_key")
             assert variant.items[0].value.startswith("var_value")
+
+    def test_document_batch_is_encoded_as_jsonl(self):
+        # Given
+        embeddings = numpy.array([[0.6, 0.8], [1.0, 0.0]])
+        batch = DocumentBatch(
+            ids=["doc1", "doc2"],
+            embeddings=embeddings,
+            metadata={"color": ["red", "blue"]},
+            sortable_metadata={"price": [1.5, 2.0]},
+        )
+
+        # When
+        documents = [json.loads(line) for line in batch.to_jsonl().split()]
+
+        # Then
+        assert documents[0]["id"] == "doc1"
+        assert documents[0]["meta_color"] == "red"
+        assert documents[1]["meta_ordered_price"] == 2.0
+        assert documents[0]["embeddings"] == pytest.approx([0.6, 0.8])
+        assert batch.to_arrow().num_rows == 2
+
+    def test_document_batch_rejects_non_unit_embeddings(self):
+        # Given
+        embeddings = numpy.array([[0.6, 0.8], [1.0, 1.0]])
+
+        # When
+        with pytest.raises(ValueError) as exception:
+            DocumentBatch(ids=["doc1", "doc2"], embeddings=embeddings)
+
+        # Then
+        assert "doc2" in str(exception.value)
+
+    def test_documents_are_created_from_normalized_embeddings_matrix(self):
+        # Given
+        embeddings = numpy.array([[3.0, 4.0], [0.0, 2.0]])
+
+        # When
+        documents = UserProvidedEmbeddingsDocument.from_embeddings_matrix(
+            ids=["doc1", "doc2"],
+            embeddings=embeddings,
+            normalize=True,
+        )
+
+        # Then
+        assert [document.id for document in documents] == ["doc1", "doc2"]
+        assert documents[0].embeddings == pytest.approx([0.6, 0.8])
+        assert documents[1].to_vantage_dict()["embeddings"] == [0.0, 1.0]
+
+    def test_embeddings_matrix_keeps_precision_of_embeddings(self):
+        # Given
+        embeddings = numpy.array([[0.6, 0.8]], dtype=numpy.float64)
+
+        # When
+        documents = UserProvidedEmbeddingsDocument.from_embeddings_matrix(
+            ids=["doc1"],
+            embeddings=embeddings,
+        )
+
+        # Then
+        assert documents[0].to_vantage_dict()["embeddings"] == [0.6, 0.8]
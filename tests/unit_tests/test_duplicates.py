@@ -0,0 +1,35 @@
+import os
+
+from vantage_sdk.core.duplicates import DuplicateDetector
+
+
+# Unit tests for memory-bounded duplicate detection
+
+
+class TestDuplicateDetector:
+    def test_duplicates_are_detected_after_spilling_to_disk(self, tmp_path):
+        # Given
+        detector = DuplicateDetector(
+            max_memory_bytes=10_000, temporary_directory=str(tmp_path)
+        )
+        ids = [f"id-{index}" for index in range(5000)]
+
+        # When
+        first_pass = [detector.add(id) for id in ids]
+        second_pass = [detector.add(id) for id in ids]
+
+        # Then
+        assert not any(first_pass)
+        assert all(second_pass)
+        assert os.listdir(tmp_path)
+
+    def test_temporary_files_are_removed_on_close(self, tmp_path):
+        # Given
+        with DuplicateDetector(
+            max_memory_bytes=1_000, temporary_directory=str(tmp_path)
+        ) as detector:
+            for index in range(100):
+                detector.add(str(index))
+
+        # Then
+        assert os.listdir(tmp_path) == []
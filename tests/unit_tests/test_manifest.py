@@ -0,0 +1,92 @@
+import json
+
+from vantage_sdk.core.manifest import DocumentManifest, metadata_update
+
+
+# Unit tests for document manifest
+
+
+class TestDocumentManifest:
+    def test_only_new_and_changed_documents_are_reported(self, tmp_path):
+        # Given
+        manifest = DocumentManifest(str(tmp_path / "manifest.db"))
+        manifest.start("collection")
+        manifest.observe("1", '{"id": "1", "text": "a"}')
+        manifest.observe("2", '{"id": "2", "text": "b"}')
+        manifest.commit()
+
+        # When
+        manifest.start("collection")
+        unchanged = manifest.observe("1", '{"id": "1", "text": "a"}')
+        changed = manifest.observe("2", '{"id": "2", "text": "c"}')
+        new = manifest.observe("3", '{"id": "3", "text": "d"}')
+
+        # Then
+        assert (unchanged, changed, new) == (False, True, True)
+
+    def test_missing_documents_are_removed_on_commit(self, tmp_path):
+        # Given
+        manifest = DocumentManifest(str(tmp_path / "manifest.db"))
+        manifest.start("collection")
+        manifest.observe("1", "a")
+        manifest.observe("2", "b")
+        manifest.commit()
+
+        # When
+        manifest.start("collection")
+        manifest.observe("1", "a")
+        missing = list(manifest.missing_ids())
+        manifest.commit(remove_missing=True)
+
+        # Then
+        assert missing == ["2"]
+        assert len(manifest) == 1
+
+    def test_rollback_leaves_manifest_unchanged(self, tmp_path):
+        # Given
+        path = str(tmp_path / "manifest.db")
+        manifest = DocumentManifest(path)
+        manifest.start("collection")
+        manifest.observe("1", "a")
+
+        # When
+        manifest.rollback()
+        manifest.close()
+
+        # Then
+        with DocumentManifest(path) as reopened:
+            reopened.start("collection")
+            assert reopened.observe("1", "a")
+
+    def test_previous_version_is_kept_for_partial_updates(self, tmp_path):
+        # Given
+        manifest = DocumentManifest(
+            str(tmp_path / "manifest.db"), keep_documents=True
+        )
+        previous = json.dumps({"id": "1", "text": "a", "meta_price": 10})
+        current = json.dumps({"id": "1", "text": "a", "meta_price": 12})
+        manifest.start("collection")
+        manifest.observe("1", previous)
+        manifest.commit()
+
+        # When
+        manifest.start("collection")
+        manifest.observe("1", current)
+        update = metadata_update(manifest.previous_version("1"), current)
+
+        # Then
+        assert update == {"id": "1", "operation": "update", "meta_price": 12}
+
+    def test_full_document_is_required_when_text_changes(self):
+        # Given
+        previous = json.dumps({"id": "1", "text": "a", "meta_price": 10})
+        current = json.dumps({"id": "1", "text": "b", "meta_price": 10})
+        without_metadata = json.dumps({"id": "1", "text": "a"})
+
+        # When
+        text_changed = metadata_update(previous, current)
+        metadata_removed = metadata_update(previous, without_metadata)
+
+        # Then
+        assert text_changed is None
+        assert metadata_removed is None
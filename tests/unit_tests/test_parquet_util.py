@@ -0,0 +1,81 @@
+import io
+
+import pyarrow as arrow
+import pyarrow.parquet as parquet
+
+from vantage_sdk.core.parquet_util import (
+    arrow_to_parquet_parts,
+    split_parquet_file,
+)
+
+
+# Unit tests for parquet utilities
+
+
+class TestParquetUtil:
+    def test_file_is_split_into_parts_containing_all_rows(self, tmp_path):
+        # Given
+        file_path = str(tmp_path / "documents.parquet")
+        table = arrow.table(
+            {
+                "id": [str(index) for index in range(1000)],
+                "text": [f"document {index}" * 10 for index in range(1000)],
+            }
+        )
+        parquet.write_table(table, file_path, row_group_size=100)
+        row_group = parquet.ParquetFile(file_path).metadata.row_group(0)
+        max_part_bytes = 3 * sum(
+            row_group.column(column).total_compressed_size
+            for column in range(row_group.num_columns)
+        )
+
+        # When
+        parts = list(split_parquet_file(file_path, max_part_bytes))
+
+        # Then
+        tables = [parquet.read_table(io.BytesIO(part)) for part in parts]
+        assert 1 < len(parts) < 10
+        assert arrow.concat_tables(tables).equals(table)
+
+    def test_row_group_larger_than_part_is_split_by_rows(self, tmp_path):
+        # Given
+        file_path = str(tmp_path / "documents.parquet")
+        table = arrow.table({"id": [str(index) for index in range(1000)]})
+        parquet.write_table(table, file_path)
+
+        # When
+        parts = list(split_parquet_file(file_path, max_part_bytes=1000))
+
+        # Then
+        tables = [parquet.read_table(io.BytesIO(part)) for part in parts]
+        assert len(parts) > 1
+        assert arrow.concat_tables(tables).equals(table)
+
+    def test_file_without_row_groups_is_a_single_empty_part(self, tmp_path):
+        # Given
+        file_path = str(tmp_path / "documents.parquet")
+        schema = arrow.schema([("id", arrow.string())])
+        parquet.ParquetWriter(file_path, schema).close()
+
+        # When
+        parts = list(split_parquet_file(file_path, max_part_bytes=1000))
+
+        # Then
+        assert parquet.ParquetFile(file_path).metadata.num_row_groups == 0
+        assert len(parts) == 1
+        assert parquet.read_table(io.BytesIO(parts[0])).schema == schema
+
+    def test_record_batches_are_serialized_into_parts(self):
+        # Given
+        table = arrow.table({"id": [str(index) for index in range(10000)]})
+        reader = arrow.RecordBatchReader.from_batches(
+            table.schema, table.to_batches(max_chunksize=1000)
+        )
+
+        # When
+        parts = list(arrow_to_parquet_parts(reader, max_part_bytes=5000))
+
+        # Then
+        tables = [parquet.read_table(io.BytesIO(part)) for part in parts]
+        assert len(parts) > 1
+        assert arrow.concat_tables(tables).equals(table)
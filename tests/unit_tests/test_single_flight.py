@@ -0,0 +1,82 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vantage_sdk.core.single_flight import SingleFlight
+
+
+# Unit tests for coalescing of concurrent calls
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_with_same_key_are_coalesced(self):
+        # Given
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "result"
+
+        # When
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(single_flight.do, "key", function)
+            started.wait()
+            followers = [
+                executor.submit(single_flight.do, "key", function)
+                for _ in range(4)
+            ]
+            while single_flight.coalesced < 4:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        # Then
+        assert len(calls) == 1
+        assert results == ["result"] * 5
+        assert single_flight.coalesced == 4
+
+    def test_exception_is_raised_in_all_coalesced_calls(self):
+        # Given
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def function():
+            started.set()
+            release.wait()
+            raise ValueError("failed")
+
+        # When
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "key", function)
+            started.wait()
+            follower = executor.submit(single_flight.do, "key", function)
+            while single_flight.coalesced < 1:
+                time.sleep(0.001)
+            release.set()
+
+            # Then
+            with pytest.raises(ValueError):
+                leader.result()
+            with pytest.raises(ValueError):
+                follower.result()
+
+    def test_sequential_calls_are_not_coalesced(self):
+        # Given
+        single_flight = SingleFlight()
+        calls = []
+
+        # When
+        single_flight.do("key", lambda: calls.append(1))
+        single_flight.do("key", lambda: calls.append(2))
+
+        # Then
+        assert calls == [1, 2]
+        assert single_flight.coalesced == 0
@@ -0,0 +1,48 @@
+from vantage_sdk.core.text_util import (
+    BatchTextFileReader,
+    TextSplitter,
+    batch_lines,
+)
+
+
+# Unit tests for text batching utilities
+
+
+class TestTextUtil:
+    def test_batches_are_cut_by_size_in_bytes(self):
+        # Given
+        lines = ["a" * 9 + "\n"] * 5
+
+        # When
+        batches = list(batch_lines(lines, batch_size=100, max_batch_bytes=25))
+
+        # Then
+        assert [len(batch) for batch in batches] == [20, 20, 10]
+
+    def test_line_larger_than_size_limit_forms_its_own_batch(self):
+        # Given
+        text = "short\n" + "x" * 50 + "\n" + "short\n"
+
+        # When
+        batches = TextSplitter(
+            text=text, batch_size=100, max_batch_bytes=10
+        ).batch()
+
+        # Then
+        assert batches == ["short\n", "x" * 50 + "\n", "short\n"]
+
+    def test_file_reader_skips_blank_lines_and_stops_at_end_of_file(
+        self, tmp_path
+    ):
+        # Given
+        file_path = tmp_path / "documents.jsonl"
+        file_path.write_text('{"id": "1"}\n\n\n{"id": "2"}\n{"id": "3"}\n')
+
+        # When
+        with BatchTextFileReader(
+            file_path=str(file_path), batch_size=2
+        ) as reader:
+            batches = list(reader)
+
+        # Then
+        assert batches == ['{"id": "1"}\n{"id": "2"}\n', '{"id": "3"}\n']
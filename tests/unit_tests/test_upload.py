@@ -0,0 +1,158 @@
+import hashlib
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from vantage_sdk.core.upload import (
+    ChecksumReader,
+    compact_operations,
+    jsonl_lines,
+    upload_batches,
+)
+
+
+# Unit tests for concurrent upload of batches
+
+
+class TestUploadBatches:
+    def test_all_batches_are_uploaded(self):
+        # Given
+        batches = [f"batch-{index}" for index in range(20)]
+        uploaded = []
+        lock = threading.Lock()
+
+        def upload(batch):
+            with lock:
+                uploaded.append(batch)
+
+        # When
+        upload_batches(batches=batches, upload=upload, max_workers=4)
+
+        # Then
+        assert sorted(uploaded) == sorted(batches)
+
+    def test_reading_is_paused_while_queue_is_full(self):
+        # Given
+        release = threading.Event()
+        read = []
+
+        def batches():
+            for index in range(10):
+                read.append(index)
+                yield index
+
+        def upload(batch):
+            release.wait()
+
+        # When
+        reader = threading.Thread(
+            target=upload_batches,
+            kwargs=dict(
+                batches=batches(),
+                upload=upload,
+                max_workers=2,
+                max_pending=2,
+            ),
+        )
+        reader.start()
+        time.sleep(0.1)
+        read_while_blocked = len(read)
+        release.set()
+        reader.join()
+
+        # Then
+        assert read_while_blocked <= 2 + 2 + 1
+        assert len(read) == 10
+
+    def test_first_error_is_raised_and_reading_stops(self):
+        # Given
+        read = []
+
+        def batches():
+            for index in range(1000):
+                read.append(index)
+                yield index
+
+        def upload(batch):
+            if batch == 3:
+                raise RuntimeError("Upload failed")
+            time.sleep(0.001)
+
+        # When
+        with pytest.raises(RuntimeError, match="Upload failed"):
+            upload_batches(batches=batches(), upload=upload, max_workers=2)
+
+        # Then
+        assert len(read) < 1000
+
+    def test_checksum_is_computed_while_reading(self):
+        # Given
+        content = b"documents" * 1000
+        reader = ChecksumReader(io.BytesIO(content), len(content))
+
+        # When
+        chunks = iter(lambda: reader.read(1024), b"")
+        read_content = b"".join(chunks)
+
+        # Then
+        assert len(reader) == len(content)
+        assert read_content == content
+        assert reader.hexdigest() == hashlib.md5(content).hexdigest()
+
+    def test_operations_on_same_document_are_compacted(self):
+        # Given
+        lines = [
+            '{"id": "1", "text": "a", "meta_price": 1}\n',
+            '{"id": "2", "operation": "delete"}\n',
+            '{"id": "1", "operation": "update", "meta_price": 2}\n',
+            '{"id": "2", "text": "b"}\n',
+            '{"id": "3", "operation": "update", "meta_stock": 5}\n',
+            '{"id": "3", "operation": "update", "meta_price": 3}\n',
+        ]
+
+        # When
+        compacted = [json.loads(line) for line in compact_operations(lines)]
+
+        # Then
+        assert compacted == [
+            {"id": "1", "text": "a", "meta_price": 2},
+            {"id": "2", "text": "b"},
+            {
+                "id": "3",
+                "operation": "update",
+                "meta_stock": 5,
+                "meta_price": 3,
+            },
+        ]
+
+    def test_update_after_delete_is_kept(self):
+        # Given
+        lines = [
+            '{"id": "1", "operation": "delete"}\n',
+            '{"id": "1", "operation": "update", "meta_price": 2}\n',
+            'not json\n',
+        ]
+
+        # When
+        compacted = compact_operations(lines)
+
+        # Then
+        assert compacted == lines
+
+    def test_line_separators_in_strings_do_not_split_documents(self):
+        # Given
+        text = (
+            '{"id": "1", "text": "x\u2028y\x85z"}\n'
+            '{"id": "1", "operation": "update", "meta_price": 2}'
+        )
+
+        # When
+        compacted = compact_operations(jsonl_lines(text))
+
+        # Then
+        assert [json.loads(line) for line in compacted] == [
+            {"id": "1", "text": "x\u2028y\x85z", "meta_price": 2}
+        ]
@@ -0,0 +1,330 @@
+import json
+
+import pyarrow as arrow
+import pyarrow.parquet as parquet
+
+from vantage_sdk.core import validation
+from vantage_sdk.core.validation import (
+    DocumentValidator,
+    write_validation_report,
+)
+from vantage_sdk.model.validation import CollectionType
+
+
+# Unit tests for validation of documents
+
+
+def _write_documents(file_path, count):
+    lines = []
+    for index in range(count):
+        if index % 97 == 0:
+            lines.append("{not json\n")
+        document = {"id": str(index % 700), "text": "text"}
+        if index % 89 == 0:
+            document["meta_bad name"] = 1
+        lines.append(f"{json.dumps(document)}\n")
+
+    file_path.write_text("".join(lines))
+
+
+class TestDocumentValidator:
+    def test_parallel_validation_matches_sequential(
+        self, tmp_path, monkeypatch
+    ):
+        # Given
+        monkeypatch.setattr(validation, "_MIN_SHARD_BYTES", 1024)
+        file_path = tmp_path / "documents.jsonl"
+        _write_documents(file_path, 1000)
+
+        # When
+        sequential = DocumentValidator().validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+        )
+        parallel = DocumentValidator().validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+            max_workers=3,
+        )
+
+        # Then
+        assert len(sequential) > 300
+        assert [error.to_dict() for error in parallel] == [
+            error.to_dict() for error in sequential
+        ]
+
+    def test_parquet_errors_are_reported_for_invalid_rows_only(self, tmp_path):
+        # Given
+        file_path = tmp_path / "documents.parquet"
+        table = arrow.table(
+            {
+                "id": ["1", "2", "1", "x" * 300, "5"],
+                "text": ["a", None, "c", "d", "e"],
+                "operation": ["add", "add", "add", "add", "drop"],
+                "meta_price": [1.0, 2.0, None, 4.0, 5.0],
+                "embeddings": arrow.array(
+                    [[0.6, 0.8], [0.6, 0.8], [0.6, 0.8], [1.0], [0.6, 0.8]],
+                    arrow.list_(arrow.float64()),
+                ),
+            }
+        )
+        parquet.write_table(table, file_path, row_group_size=2)
+
+        # When
+        errors = DocumentValidator().validate_parquet(
+            file_path=str(file_path),
+            collection_type=CollectionType.USER_PROVIDED_EMBEDDINGS,
+            embeddings_dimension=2,
+        )
+
+        # Then
+        assert [
+            (
+                error.line_number,
+                [message.field_name for message in error.errors],
+            )
+            for error in errors
+        ] == [
+            (1, ["text"]),
+            (2, ["id"]),
+            (3, ["id", "embeddings"]),
+            (4, ["operation"]),
+        ]
+        assert errors[1].errors[0].error_message == "Duplicate encountered."
+
+    def test_rows_with_invalid_ids_are_checked_without_embeddings(
+        self, tmp_path
+    ):
+        # Given
+        file_path = tmp_path / "documents.parquet"
+        table = arrow.table(
+            {"id": ["bad\x01id", "x" * 300, "3"], "text": ["a", "b", "c"]}
+        )
+        parquet.write_table(table, file_path)
+
+        # When
+        errors = DocumentValidator().validate_parquet(
+            file_path=str(file_path),
+            collection_type=CollectionType.USER_PROVIDED_EMBEDDINGS,
+            embeddings_dimension=2,
+        )
+
+        # Then
+        assert [
+            (
+                error.line_number,
+                [message.field_name for message in error.errors],
+            )
+            for error in errors
+        ] == [
+            (0, ["id", "embeddings"]),
+            (1, ["id", "embeddings"]),
+            (2, ["embeddings"]),
+        ]
+
+    def test_long_texts_are_tokenized_in_batches(self, tmp_path, monkeypatch):
+        # Given
+        batches = []
+
+        class Encoding:
+            def encode_batch(self, texts):
+                batches.append(len(texts))
+                return [text.split() for text in texts]
+
+        monkeypatch.setattr(
+            validation, "_encoding_for_model", lambda model: Encoding()
+        )
+        file_path = tmp_path / "documents.jsonl"
+        documents = [
+            {"id": "1", "text": "short"},
+            {"id": "2", "text": "word " * 9000},
+            {"id": "3", "text": "x" * 9000},
+            {"id": "4", "text": "word " * 9000, "operation": "drop"},
+        ]
+        file_path.write_text(
+            "".join(f"{json.dumps(document)}\n" for document in documents)
+        )
+
+        # When
+        errors = DocumentValidator().validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+            model="model",
+        )
+
+        # Then
+        assert batches == [3]
+        assert [
+            (
+                error.line_number,
+                [message.field_name for message in error.errors],
+            )
+            for error in errors
+        ] == [(1, ["text"]), (3, ["operation", "text"])]
+
+    def test_errors_after_long_text_are_not_held_until_end_of_file(
+        self, monkeypatch
+    ):
+        # Given
+        class Encoding:
+            def encode_batch(self, texts):
+                return [text.split() for text in texts]
+
+        monkeypatch.setattr(
+            validation, "_encoding_for_model", lambda model: Encoding()
+        )
+        checker = validation._TokenLengthChecker("model")
+        validator = DocumentValidator()
+        documents = [{"id": "0", "text": "word " * 9000}] + [
+            {"id": str(index), "text": "short", "operation": "drop"}
+            for index in range(1, 5000)
+        ]
+
+        # When
+        errors = []
+        for line_number, document in enumerate(documents):
+            error = validator._validate_document(
+                document=document,
+                line_number=line_number,
+                collection_type=CollectionType.OPEN_AI,
+                model="model",
+                check_token_length=False,
+            )
+            errors.extend(checker.add(error, document, line_number))
+        emitted_before_end = len(errors)
+        errors.extend(checker.flush())
+
+        # Then
+        assert emitted_before_end >= len(documents) - 1024
+        assert [error.line_number for error in errors] == list(
+            range(len(documents))
+        )
+        assert [message.field_name for message in errors[0].errors] == ["text"]
+
+    def test_ids_are_not_shared_between_validations(self, tmp_path):
+        # Given
+        file_path = tmp_path / "documents.jsonl"
+        file_path.write_text('{"id": "1", "text": "a"}\n')
+        validator = DocumentValidator()
+
+        # When
+        first = validator.validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+        )
+        second = validator.validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+        )
+
+        # Then
+        assert first == []
+        assert second == []
+
+    def test_validation_stops_after_max_errors(self, tmp_path):
+        # Given
+        file_path = tmp_path / "documents.jsonl"
+        _write_documents(file_path, 1000)
+        all_errors = DocumentValidator().validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+        )
+
+        # When
+        errors = DocumentValidator().iter_validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+            max_errors=5,
+        )
+        first = next(errors)
+        rest = list(errors)
+
+        # Then
+        assert [error.to_dict() for error in [first, *rest]] == [
+            error.to_dict() for error in all_errors[:5]
+        ]
+
+    def test_errors_are_streamed_while_checking_token_lengths(
+        self, tmp_path, monkeypatch
+    ):
+        # Given
+        encoded = []
+
+        class Encoding:
+            def encode_batch(self, texts):
+                encoded.extend(texts)
+                return [text.split() for text in texts]
+
+        monkeypatch.setattr(
+            validation, "_encoding_for_model", lambda model: Encoding()
+        )
+        file_path = tmp_path / "documents.jsonl"
+        documents = (
+            [{"id": "first", "text": "word " * 9000}]
+            + [
+                {"id": str(index), "text": "short", "operation": "drop"}
+                for index in range(5000)
+            ]
+            + [{"id": "last", "text": "x" * 9000}]
+        )
+        file_path.write_text(
+            "".join(f"{json.dumps(document)}\n" for document in documents)
+        )
+
+        # When
+        errors = DocumentValidator().iter_validate_jsonl(
+            file_path=str(file_path),
+            collection_type=CollectionType.OPEN_AI,
+            model="model",
+            max_errors=10,
+        )
+        first = next(errors)
+
+        # Then
+        assert first.document_id == "first"
+        assert encoded == [documents[0]["text"]]
+        assert len(list(errors)) == 9
+        assert encoded == [documents[0]["text"]]
+
+    def test_errors_are_written_to_report(self, tmp_path):
+        # Given
+        file_path = tmp_path / "documents.jsonl"
+        file_path.write_text(
+            '{"id": "1", "text": "a"}\n'
+            "{not json\n"
+            '{"id": "1", "text": "a", "meta_bad name": 1}\n'
+            '{"id": "2", "text": "a", "operation": "drop"}\n'
+        )
+        errors = list(
+            DocumentValidator().iter_validate_jsonl(
+                file_path=str(file_path),
+                collection_type=CollectionType.OPEN_AI,
+            )
+        )
+
+        # When
+        summary = write_validation_report(
+            errors, str(tmp_path / "report.jsonl")
+        )
+        parquet_summary = write_validation_report(
+            iter(errors), str(tmp_path / "report.parquet")
+        )
+
+        # Then
+        report = (tmp_path / "report.jsonl").read_text().splitlines()
+        parquet_report = parquet.read_table(tmp_path / "report.parquet")
+        assert [json.loads(line) for line in report] == [
+            error.to_dict() for error in errors
+        ]
+        assert parquet_report.to_pylist() == [
+            error.to_dict() for error in errors
+        ]
+        assert summary == parquet_summary
+        assert summary.documents_with_errors == 3
+        assert summary.error_count == 4
+        assert summary.error_counts == {
+            "json": 1,
+            "id": 1,
+            "meta": 1,
+            "operation": 1,
+        }
@@ -0,0 +1,49 @@
+import numpy
+import pytest
+
+from vantage_sdk.core.vector_util import (
+    check_unit_vectors,
+    non_unit_vectors,
+    normalize_vectors,
+)
+
+
+# Unit tests for vector utilities
+
+
+class TestVectorUtil:
+    def test_non_unit_vectors_are_found(self):
+        # Given
+        embeddings = numpy.array(
+            [[0.6, 0.8], [1.0, 1.0], [0.0, 1.0]], dtype=numpy.float32
+        )
+
+        # When
+        invalid = non_unit_vectors(embeddings)
+
+        # Then
+        assert invalid.tolist() == [1]
+        with pytest.raises(ValueError):
+            check_unit_vectors(embeddings)
+
+    def test_normalized_vectors_pass_unit_vector_check(self):
+        # Given
+        embeddings = numpy.random.default_rng(0).random((100, 1536))
+
+        # When
+        normalized = normalize_vectors(embeddings)
+
+        # Then
+        assert normalized.dtype == embeddings.dtype
+        check_unit_vectors(normalized)
+
+    def test_zero_vector_cannot_be_normalized(self):
+        # Given
+        embeddings = numpy.zeros((1, 4))
+
+        # When
+        with pytest.raises(ValueError) as exception:
+            normalize_vectors(embeddings)
+
+        # Then
+        assert "Zero vectors" in str(exception.value)
@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from vantage_sdk.core.writer import DocumentWriter
+from vantage_sdk.model.document import VantageManagedEmbeddingsDocument
+
+
+# Unit tests for write-behind document writer
+
+
+class TestDocumentWriter:
+    def test_documents_are_uploaded_in_batches_per_collection(self):
+        # Given
+        uploaded = []
+
+        def upload(collection_id, batch):
+            uploaded.append((collection_id, batch.count("\n")))
+
+        writer = DocumentWriter(
+            upload=upload,
+            max_batch_documents=5,
+            max_batch_bytes=1024 * 1024,
+            max_latency_seconds=60,
+        )
+
+        # When
+        with writer:
+            futures = [
+                writer.upsert(
+                    "collection",
+                    VantageManagedEmbeddingsDocument(id=str(index), text="a"),
+                )
+                for index in range(12)
+            ]
+            futures.append(writer.delete("other-collection", "1"))
+
+        # Then
+        assert all(future.done() for future in futures)
+        assert sorted(uploaded) == [
+            ("collection", 2),
+            ("collection", 5),
+            ("collection", 5),
+            ("other-collection", 1),
+        ]
+
+    def test_documents_are_uploaded_after_max_latency(self):
+        # Given
+        uploaded = threading.Event()
+        writer = DocumentWriter(
+            upload=lambda collection_id, batch: uploaded.set(),
+            max_batch_documents=100,
+            max_batch_bytes=1024 * 1024,
+            max_latency_seconds=0.05,
+        )
+
+        # When
+        future = writer.delete("collection", "1")
+        future.result(timeout=5)
+
+        # Then
+        assert uploaded.is_set()
+        writer.close()
+
+    def test_upload_error_is_reported_by_futures(self):
+        # Given
+        def upload(collection_id, batch):
+            raise RuntimeError("Upload failed")
+
+        writer = DocumentWriter(
+            upload=upload,
+            max_batch_documents=100,
+            max_batch_bytes=1024 * 1024,
+            max_latency_seconds=60,
+        )
+        future = writer.delete("collection", "1")
+
+        # When
+        writer.flush()
+
+        # Then
+        with pytest.raises(RuntimeError, match="Upload failed"):
+            future.result()
+        writer.close()
@@ -1,5 +1,6 @@
 """Top-level package for Vantage SDK Python."""
 
+from vantage_sdk.async_client import AsyncVantageClient
 from vantage_sdk.client import VantageClient
 from vantage_sdk.model.account import Account
 from vantage_sdk.model.collection import Collection, CollectionUploadURL
@@ -16,6 +17,7 @@ __email__ = 'none@vantage.com'
 __version__ = '0.9.5'
 __all__ = [
     "VantageClient",
+    "AsyncVantageClient",
     "Collection",
     "CollectionUploadURL",
     "Account",
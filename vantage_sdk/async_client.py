@@ -0,0 +1,1823 @@
+"""
+This module contains AsyncVantageClient class, an asynchronous
+counterpart of VantageClient built on top of `asyncio`.
+
+Requests are sent without blocking the event loop and share a single
+connection pool, so a single event loop can keep many requests in flight.
+The asynchronous client requires the optional `aiohttp` dependency,
+which can be installed using `pip install vantage-sdk[async]`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ntpath
+from os.path import exists
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+import magic
+
+from vantage_sdk.client import (
+    _DOCUMENTS_UPLOAD_BATCH_MAX_BYTES,
+    _DOCUMENTS_UPLOAD_BATCH_SIZE,
+    _JSON_MIME_TYPE,
+    _JSONL_MIME_TYPE,
+    _PARQUET_FILE_TYPE,
+    VantageClient,
+)
+from vantage_sdk.config import (
+    API_HOST_VERSION,
+    AUTH_ENDPOINT,
+    DEFAULT_API_HOST,
+    DEFAULT_AUTH_HOST,
+    DEFAULT_ENCODING,
+)
+from vantage_sdk.core.base import AsyncAuthorizedApiClient, AuthorizationClient
+from vantage_sdk.core.compression import (
+    decompressed_size,
+    detect_compression,
+    open_jsonl,
+    strip_compression_suffix,
+)
+from vantage_sdk.core.http.models import (
+    AccountModifiable,
+    CollectionStatus,
+    ExternalKeyModifiable,
+    ShoppingAssistant,
+    ShoppingAssistantModifiable,
+    ShoppingAssistantResult,
+    TotalCountResult,
+    VantageAPIKeyModifiable,
+    VantageVibe,
+    VantageVibeModifiable,
+)
+from vantage_sdk.core.management import AsyncManagementAPI
+from vantage_sdk.core.search import AsyncSearchAPI
+from vantage_sdk.core.text_util import BatchTextFileReader
+from vantage_sdk.core.validation import VALIDATOR as validator
+from vantage_sdk.exceptions import VantageFileUploadError, VantageValueError
+from vantage_sdk.model.account import Account
+from vantage_sdk.model.collection import (
+    Collection,
+    CollectionUploadURL,
+    HuggingFaceCollection,
+    OpenAICollection,
+    UserProvidedEmbeddingsCollection,
+)
+from vantage_sdk.model.document import (
+    DocumentBatch,
+    UserProvidedEmbeddingsDocument,
+    VantageManagedEmbeddingsDocument,
+)
+from vantage_sdk.model.keys import (
+    AnthropicKey,
+    ExternalKey,
+    LLMProvider,
+    OpenAIKey,
+    SecondaryExternalAccount,
+    VantageAPIKey,
+    VantageAPIKeyRole,
+)
+from vantage_sdk.model.search import (
+    ApproximateResultsCountResult,
+    BatchSearchResult,
+    Facet,
+    FieldValueWeighting,
+    Filter,
+    MoreLikeTheseItem,
+    Pagination,
+    SearchRequest,
+    SearchResult,
+    SearchResultItem,
+    Sort,
+    TotalCountsOptions,
+    VantageVibeImageBase64,
+    VantageVibeImageUrl,
+)
+from vantage_sdk.model.validation import CollectionType, ValidationError
+
+
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+async def _read_chunks(stream: BinaryIO) -> AsyncIterator[bytes]:
+    """Reads a blocking stream in chunks, without blocking the event loop."""
+    while True:
+        chunk = await asyncio.to_thread(stream.read, _UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            return
+
+        yield chunk
+
+
+class AsyncVantageClient:
+    """
+    Asynchronous counterpart of `VantageClient`.
+
+    Every public method of `VantageClient` is available here as a
+    coroutine function with the same parameters and return value.
+    Requests and queries are built by the same helpers as in
+    `VantageClient`, so both clients send identical requests.
+
+    The client should be closed when it is no longer needed, either by
+    awaiting `close`, or by using it as an asynchronous context manager.
+
+    Examples
+    --------
+    >>> async with AsyncVantageClient.using_jwt_token(...) as client:
+    ...     result = await client.semantic_search(...)
+    """
+
+    # Request and query building is shared with the synchronous client.
+    _create_collection_request = VantageClient._create_collection_request
+    _collection_modifiable = VantageClient._collection_modifiable
+    _prepare_search_query = VantageClient._prepare_search_query
+    _vantage_api_key_check = VantageClient._vantage_api_key_check
+    _search_request_method = VantageClient._search_request_method
+    _search_page = VantageClient._search_page
+    _is_last_search_page = VantageClient._is_last_search_page
+    _is_below_min_score = VantageClient._is_below_min_score
+    _semantic_search_query = VantageClient._semantic_search_query
+    _embedding_search_query = VantageClient._embedding_search_query
+    _more_like_this_query = VantageClient._more_like_this_query
+    _more_like_these_query = VantageClient._more_like_these_query
+    _vantage_vibe_search_query = VantageClient._vantage_vibe_search_query
+    _shopping_assistant_query = VantageClient._shopping_assistant_query
+    _document_to_collection_compatibility_check = (
+        VantageClient._document_to_collection_compatibility_check
+    )
+    _direct_upload_batch_identifier = (
+        VantageClient._direct_upload_batch_identifier
+    )
+    _peek_documents = VantageClient._peek_documents
+    _document_batches = VantageClient._document_batches
+    _delete_document_batches = VantageClient._delete_document_batches
+    _line_batches = VantageClient._line_batches
+    _jsonl_batches = VantageClient._jsonl_batches
+
+    def __init__(
+        self,
+        management_api: AsyncManagementAPI,
+        search_api: AsyncSearchAPI,
+        account_id: str,
+        vantage_api_key: Optional[str] = None,
+        host: Optional[str] = DEFAULT_API_HOST,
+    ) -> None:
+        """
+        Initializes a new instance of the AsyncVantageClient class.
+
+        Parameters
+        ----------
+        management_api : AsyncManagementAPI
+            An instance of the AsyncManagementAPI class.
+        search_api : AsyncSearchAPI
+            An instance of the AsyncSearchAPI class.
+        account_id : str
+            The account ID to be used for all operations within the Vantage
+            platform.
+        vantage_api_key : Optional[str], optional
+            An optional Vantage API key used for search operations. If not
+            provided, must be set elsewhere before performing those operations.
+            Defaults to None.
+        host : Optional[str], optional
+            The host URL for the Vantage API.
+            If not provided, a default value is used.
+        """
+
+        self.management_api = management_api
+        self.search_api = search_api
+        self.account_id = account_id
+        self.vantage_api_key = vantage_api_key
+        self.host = host
+        self._default_encoding = DEFAULT_ENCODING
+
+    @classmethod
+    def _from_authorization_client(
+        cls,
+        auth_client: AuthorizationClient,
+        account_id: str,
+        vantage_api_key: Optional[str],
+        host: Optional[str],
+    ) -> AsyncVantageClient:
+        api_client = AsyncAuthorizedApiClient(authorization_client=auth_client)
+
+        if host is not None:
+            api_client.configuration.host = host
+
+        management_api = AsyncManagementAPI.from_defaults(
+            api_client=api_client
+        )
+        search_api = AsyncSearchAPI(api_client=api_client)
+
+        return cls(
+            management_api=management_api,
+            search_api=search_api,
+            account_id=account_id,
+            vantage_api_key=vantage_api_key,
+            host=host,
+        )
+
+    @classmethod
+    def using_vantage_api_key(
+        cls,
+        vantage_api_key: str,
+        account_id: str,
+        api_host: Optional[str] = DEFAULT_API_HOST,
+    ) -> AsyncVantageClient:
+        """
+        Instantiates an AsyncVantageClient using a Vantage API key for
+        authentication.
+
+        Parameters
+        ----------
+        vantage_api_key : str
+            The Vantage API key for authenticating API requests.
+        account_id : str
+            The account ID associated with the Vantage operations.
+        api_host : Optional[str], optional
+            The host URL for the Vantage API.
+            If not provided, a default value is used.
+
+        Returns
+        -------
+        AsyncVantageClient
+            An instance of the AsyncVantageClient.
+        """
+        auth_client = AuthorizationClient.using_provided_vantage_api_key(
+            vantage_api_key=vantage_api_key
+        )
+
+        return cls._from_authorization_client(
+            auth_client=auth_client,
+            account_id=account_id,
+            vantage_api_key=vantage_api_key,
+            host=f"{api_host}",
+        )
+
+    @classmethod
+    def using_jwt_token(
+        cls,
+        vantage_api_jwt_token: str,
+        account_id: str,
+        vantage_api_key: Optional[str] = None,
+        api_host: Optional[str] = DEFAULT_API_HOST,
+    ) -> AsyncVantageClient:
+        """
+        Instantiates an AsyncVantageClient using a JWT token for
+        authentication.
+
+        Parameters
+        ----------
+        vantage_api_jwt_token : str
+            The JWT token for authenticating API requests.
+        account_id : str
+            The account ID associated with the Vantage operations.
+        vantage_api_key : Optional[str], optional
+            An optional Vantage API key used for search operations. If not
+            provided, must be set elsewhere before performing those operations.
+            Defaults to None.
+        api_host : Optional[str], optional
+            The host URL for the Vantage API.
+            If not provided, a default value is used.
+
+        Returns
+        -------
+        AsyncVantageClient
+            An instance of the AsyncVantageClient.
+        """
+        auth_client = AuthorizationClient.using_provided_token(
+            vantage_jwt_token=vantage_api_jwt_token
+        )
+
+        return cls._from_authorization_client(
+            auth_client=auth_client,
+            account_id=account_id,
+            vantage_api_key=vantage_api_key,
+            host=f"{api_host}/{API_HOST_VERSION}",
+        )
+
+    @classmethod
+    def using_client_credentials(
+        cls,
+        vantage_client_id: str,
+        vantage_client_secret: str,
+        account_id: str,
+        vantage_api_key: Optional[str] = None,
+        api_host: Optional[str] = DEFAULT_API_HOST,
+        auth_host: Optional[str] = DEFAULT_AUTH_HOST,
+    ) -> AsyncVantageClient:
+        """
+        Instantiates an AsyncVantageClient using OAuth client credentials for
+        authentication.
+
+        Parameters
+        ----------
+        vantage_client_id : str
+            The client ID issued by Vantage for OAuth authentication.
+        vantage_client_secret : str
+            The client secret issued by Vantage for OAuth authentication.
+        account_id : str
+            The account ID to be used with the Vantage operations.
+        vantage_api_key : Optional[str], optional
+            An optional Vantage API key used for search operations. If not
+            provided, must be set elsewhere before performing those operations.
+            Defaults to None.
+        api_host : Optional[str], optional
+            The host URL for the Vantage API.
+            If not provided, a default value is used.
+        auth_host : Optional[str], optional
+            The base URL of the Vantage authentication server.
+            If not provided, a default value is used.
+
+        Returns
+        -------
+        AsyncVantageClient
+            An instance of the AsyncVantageClient.
+
+        Notes
+        -----
+        - Same as in `VantageClient`, the initial authentication with the
+        Vantage OAuth server is performed synchronously, while the client
+        is created. Tokens are later refreshed without blocking the event
+        loop.
+        """
+        auth_client = AuthorizationClient.automatic_token_management(
+            vantage_client_id=vantage_client_id,
+            vantage_client_secret=vantage_client_secret,
+            sso_endpoint_url=f"{auth_host}{AUTH_ENDPOINT}",
+            vantage_audience_url=api_host,
+        )
+
+        auth_client.authenticate()
+
+        return cls._from_authorization_client(
+            auth_client=auth_client,
+            account_id=account_id,
+            vantage_api_key=vantage_api_key,
+            host=f"{api_host}/{API_HOST_VERSION}",
+        )
+
+    @property
+    def _api_client(self) -> AsyncAuthorizedApiClient:
+        return self.management_api.account_api.api.api_client
+
+    async def close(self) -> None:
+        """
+        Closes the connection pool used by the client.
+        """
+        api_clients = {
+            id(api_client): api_client
+            for api_client in (
+                self._api_client,
+                self.search_api.api.api.api_client,
+            )
+        }
+
+        for api_client in api_clients.values():
+            await api_client.close()
+
+    async def __aenter__(self) -> AsyncVantageClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    # region Account
+
+    async def get_account(
+        self,
+        account_id: Optional[str] = None,
+    ) -> Account:
+        """
+        Retrieves the details of an account.
+
+        See `VantageClient.get_account` for details.
+        """
+
+        result = await self.management_api.account_api.get_account(
+            account_id=account_id or self.account_id
+        )
+        return Account.model_validate(result.model_dump())
+
+    async def update_account(
+        self,
+        account_name: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> Account:
+        """
+        Updates the account.
+
+        See `VantageClient.update_account` for details.
+        """
+
+        account_modifiable = AccountModifiable(account_name=account_name)
+
+        result = await self.management_api.account_api.update_account(
+            account_id=account_id or self.account_id,
+            account_modifiable=account_modifiable,
+        )
+        return Account.model_validate(result.model_dump())
+
+    # endregion
+
+    # region Vantage API keys
+
+    async def get_vantage_api_keys(
+        self,
+        account_id: Optional[str] = None,
+    ) -> List[VantageAPIKey]:
+        """
+        Retrieves a list of Vantage API keys for a specified account.
+
+        See `VantageClient.get_vantage_api_keys` for details.
+        """
+
+        api = self.management_api.vantage_api_keys_api
+        keys = await api.get_vantage_api_keys(
+            account_id=account_id or self.account_id,
+        )
+
+        return [VantageAPIKey.model_validate(key.model_dump()) for key in keys]
+
+    async def get_vantage_api_key(
+        self,
+        vantage_api_key_id: str,
+        account_id: Optional[str] = None,
+    ) -> VantageAPIKey:
+        """
+        Retrieves a specific Vantage API key for a given account.
+
+        See `VantageClient.get_vantage_api_key` for details.
+        """
+
+        api = self.management_api.vantage_api_keys_api
+        key = await api.get_vantage_api_key(
+            account_id=account_id or self.account_id,
+            vantage_api_key_id=vantage_api_key_id,
+        )
+        return VantageAPIKey.model_validate(key.model_dump())
+
+    async def create_vantage_api_key(
+        self,
+        name: str,
+        roles: List[VantageAPIKeyRole],
+        account_id: Optional[str] = None,
+    ) -> VantageAPIKey:
+        """
+        Created new Vantage API key for a given account.
+
+        See `VantageClient.create_vantage_api_key` for details.
+        """
+
+        vantage_api_key_modifiable = VantageAPIKeyModifiable(
+            name=name, roles=[role.value for role in roles]
+        )
+
+        api = self.management_api.vantage_api_keys_api
+        key = await api.create_vantage_api_key(
+            account_id=account_id or self.account_id,
+            vantage_api_key_modifiable=vantage_api_key_modifiable,
+        )
+        return VantageAPIKey.model_validate(key.model_dump())
+
+    async def revoke_vantage_api_key(
+        self,
+        vantage_api_key_id: str,
+        account_id: Optional[str] = None,
+    ) -> None:
+        """
+        Deactivates a specific Vantage API key for a given account.
+
+        See `VantageClient.revoke_vantage_api_key` for details.
+        """
+        await self.management_api.vantage_api_keys_api.revoke_vantage_api_key(
+            account_id=account_id or self.account_id,
+            vantage_api_key_id=vantage_api_key_id,
+        )
+
+    # endregion
+
+    # region External API keys
+
+    async def get_external_keys(
+        self,
+        account_id: Optional[str] = None,
+    ) -> List[ExternalKey]:
+        """
+        Retrieves a list of external keys associated with a given account.
+
+        See `VantageClient.get_external_keys` for details.
+        """
+
+        keys = await self.management_api.external_keys_api.get_external_keys(
+            account_id=account_id or self.account_id,
+        )
+        return [ExternalKey.model_validate(key.model_dump()) for key in keys]
+
+    async def get_external_key(
+        self,
+        external_key_id: str,
+        account_id: Optional[str] = None,
+    ) -> ExternalKey:
+        """
+        Retrieves a specific external key associated with a given account.
+
+        See `VantageClient.get_external_key` for details.
+        """
+
+        key = await self.management_api.external_keys_api.get_external_key(
+            account_id=account_id or self.account_id,
+            external_key_id=external_key_id,
+        )
+
+        return ExternalKey.model_validate(key.model_dump())
+
+    async def create_external_key(
+        self,
+        llm_provider: LLMProvider,
+        llm_secret: str,
+        account_id: Optional[str] = None,
+    ) -> ExternalKey:
+        """
+        Creates a new external key associated with a given account.
+
+        See `VantageClient.create_external_key` for details.
+        """
+
+        external_key_modifiable = ExternalKeyModifiable(
+            llm_provider=llm_provider.value, llm_secret=llm_secret
+        )
+
+        key = await self.management_api.external_keys_api.create_external_key(
+            account_id=account_id or self.account_id,
+            external_key_modifiable=external_key_modifiable,
+        )
+
+        return ExternalKey.model_validate(key.model_dump())
+
+    async def update_external_key(
+        self,
+        external_key_id: str,
+        llm_provider: LLMProvider,
+        llm_secret: str,
+        account_id: Optional[str] = None,
+    ) -> ExternalKey:
+        """
+        Updates the details of a specific external key associated with a given
+        account.
+
+        See `VantageClient.update_external_key` for details.
+        """
+
+        external_key_modifiable = ExternalKeyModifiable(
+            llm_provider=llm_provider.value, llm_secret=llm_secret
+        )
+
+        key = await self.management_api.external_keys_api.update_external_key(
+            account_id=account_id or self.account_id,
+            external_key_id=external_key_id,
+            external_key_modifiable=external_key_modifiable,
+        )
+
+        return ExternalKey.model_validate(key.model_dump())
+
+    async def delete_external_key(
+        self,
+        external_key_id: str,
+        account_id: Optional[str] = None,
+    ) -> None:
+        """
+        Deletes a specific external key associated with a given account.
+
+        See `VantageClient.delete_external_key` for details.
+        """
+
+        await self.management_api.external_keys_api.delete_external_key(
+            account_id=account_id or self.account_id,
+            external_key_id=external_key_id,
+        )
+
+    # endregion
+
+    # region Collections Helper Functions
+
+    async def _get_direct_upload_url(
+        self,
+        collection_id: str,
+        file_size: int,
+        parquet_file_name: str,
+        account_id: Optional[str] = None,
+    ) -> CollectionUploadURL:
+        url = await self.management_api.collection_api.get_browser_upload_url(
+            collection_id=collection_id,
+            file_size=file_size,
+            customer_batch_identifier=parquet_file_name,
+            account_id=account_id or self.account_id,
+        )
+
+        return CollectionUploadURL.model_validate(url.model_dump())
+
+    # endregion
+
+    # region Collections
+
+    async def list_collections(
+        self,
+        account_id: Optional[str] = None,
+    ) -> List[Collection]:
+        """
+        Retrieves a list of collections associated with a given account.
+
+        See `VantageClient.list_collections` for details.
+        """
+
+        collections = (
+            await self.management_api.collection_api.list_collections(
+                account_id=account_id or self.account_id
+            )
+        )
+
+        return [
+            Collection.model_validate(collection.model_dump())
+            for collection in collections
+        ]
+
+    async def get_collection(
+        self,
+        collection_id: str,
+        account_id: Optional[str] = None,
+    ) -> Collection:
+        """
+        Retrieves the details of a specified collection.
+
+        See `VantageClient.get_collection` for details.
+        """
+
+        collection = await self.management_api.collection_api.get_collection(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+        )
+
+        return Collection.model_validate(collection.model_dump())
+
+    async def get_collection_status(
+        self,
+        collection_id: str,
+        account_id: Optional[str] = None,
+    ) -> CollectionStatus:
+        """
+        Retrieves the status of a specified collection.
+
+        See `VantageClient.get_collection_status` for details.
+        """
+        api = self.management_api.collection_api
+        collection_status = await api.get_collection_status(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+        )
+
+        return CollectionStatus.model_validate(collection_status.model_dump())
+
+    async def create_collection(
+        self,
+        collection: Union[
+            UserProvidedEmbeddingsCollection,
+            OpenAICollection,
+            HuggingFaceCollection,
+        ],
+        account_id: Optional[str] = None,
+    ) -> Union[
+        UserProvidedEmbeddingsCollection,
+        OpenAICollection,
+        HuggingFaceCollection,
+    ]:
+        """
+        Creates a new collection based on the provided Collection object.
+
+        See `VantageClient.create_collection` for details.
+        """
+
+        create_collection_request = self._create_collection_request(
+            collection=collection
+        )
+
+        api = self.management_api.collection_api
+        collection = await api.create_collection(
+            create_collection_request=create_collection_request,
+            account_id=account_id or self.account_id,
+        )
+
+        return collection.model_validate(collection.model_dump())
+
+    async def update_collection(
+        self,
+        collection_id: str,
+        collection_name: Optional[str] = None,
+        external_key_id: Optional[str] = None,
+        secondary_external_accounts: Optional[
+            List[SecondaryExternalAccount]
+        ] = None,
+        account_id: Optional[str] = None,
+    ) -> Collection:
+        """
+        Updates an existing collection's details
+        identified by its collection_id within a specified account.
+
+        See `VantageClient.update_collection` for details.
+        """
+
+        collection = await self.management_api.collection_api.get_collection(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+        )
+
+        collection_modifiable = self._collection_modifiable(
+            collection=collection,
+            collection_name=collection_name,
+            external_key_id=external_key_id,
+            secondary_external_accounts=secondary_external_accounts,
+        )
+
+        api = self.management_api.collection_api
+        collection = await api.update_collection(
+            collection_id=collection_id,
+            collection_modifiable=collection_modifiable,
+            account_id=account_id or self.account_id,
+        )
+
+        return Collection.model_validate(collection.model_dump())
+
+    async def delete_collection(
+        self,
+        collection_id: str,
+        account_id: Optional[str] = None,
+    ) -> None:
+        """
+        Deletes a specific collection
+        identified by its collection_id within a specified account.
+
+        See `VantageClient.delete_collection` for details.
+        """
+
+        await self.management_api.collection_api.delete_collection(
+            collection_id=collection_id,
+            account_id=account_id if account_id else self.account_id,
+        )
+
+    # endregion
+
+    # region Shopping Assistant
+
+    async def list_shopping_assistants(
+        self,
+        account_id: Optional[str] = None,
+    ) -> List[ShoppingAssistant]:
+        """
+        Retrieves a list of shopping assistants associated with a given
+        account.
+
+        See `VantageClient.list_shopping_assistants` for details.
+        """
+
+        api = self.management_api.shopping_assistant_api
+        shopping_assistants = await api.list_shopping_assistants(
+            account_id=account_id or self.account_id,
+        )
+
+        return [
+            ShoppingAssistant.model_validate(assistant.model_dump())
+            for assistant in shopping_assistants
+        ]
+
+    async def get_shopping_assistant(
+        self,
+        shopping_assistant_id: str,
+        account_id: Optional[str] = None,
+    ) -> ShoppingAssistant:
+        """
+        Retrieves the details of a specified shopping assistant.
+
+        See `VantageClient.get_shopping_assistant` for details.
+        """
+
+        api = self.management_api.shopping_assistant_api
+        shopping_assistant = await api.get_shopping_assistant(
+            shopping_assistant_id=shopping_assistant_id,
+            account_id=account_id or self.account_id,
+        )
+
+        return ShoppingAssistant.model_validate(
+            shopping_assistant.model_dump()
+        )
+
+    async def create_shopping_assistant(
+        self,
+        name: Optional[str] = None,
+        external_key: Optional[OpenAIKey] = None,
+        llm_model_name: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> ShoppingAssistant:
+        """
+        Creates a new shopping assistant.
+
+        See `VantageClient.create_shopping_assistant` for details.
+        """
+        shopping_assistant_modifiable = ShoppingAssistantModifiable(
+            name=name,
+            external_account_id=external_key.external_key_id,
+            llm_model_name=llm_model_name,
+        )
+
+        api = self.management_api.shopping_assistant_api
+        result = await api.create_shopping_assistant(
+            shopping_assistant_modifiable=shopping_assistant_modifiable,
+            account_id=account_id or self.account_id,
+        )
+
+        return ShoppingAssistant.model_validate(result.model_dump())
+
+    async def update_shopping_assistant(
+        self,
+        shopping_assistant_id: str,
+        name: Optional[str] = None,
+        external_key: Optional[OpenAIKey] = None,
+        llm_model_name: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> ShoppingAssistant:
+        """
+        Updates an existing shopping assistant.
+
+        See `VantageClient.update_shopping_assistant` for details.
+        """
+        shopping_assistant_modifiable = ShoppingAssistantModifiable(
+            name=name,
+            external_account_id=external_key.external_key_id,
+            llm_model_name=llm_model_name,
+        )
+
+        api = self.management_api.shopping_assistant_api
+        result = await api.update_shopping_assistant(
+            shopping_assistant_id=shopping_assistant_id,
+            shopping_assistant_modifiable=shopping_assistant_modifiable,
+            account_id=account_id or self.account_id,
+        )
+
+        return ShoppingAssistant.model_validate(result.model_dump())
+
+    async def delete_shopping_assistant(
+        self,
+        shopping_assistant_id: str,
+        account_id: Optional[str] = None,
+    ) -> None:
+        """
+        Deletes a specific shopping assistant.
+
+        See `VantageClient.delete_shopping_assistant` for details.
+        """
+
+        api = self.management_api.shopping_assistant_api
+        await api.delete_shopping_assistant(
+            shopping_assistant_id=shopping_assistant_id,
+            account_id=account_id or self.account_id,
+        )
+
+    # endregion
+
+    # region Vantage Vibe
+
+    async def list_vibe_configurations(
+        self,
+        account_id: Optional[str] = None,
+    ) -> List[VantageVibe]:
+        """
+        Retrieves a list of Vantage vibe configurations.
+
+        See `VantageClient.list_vibe_configurations` for details.
+        """
+
+        api = self.management_api.vantage_vibe_api
+        vantage_vibes = await api.list_vantage_vibe(
+            account_id=account_id or self.account_id,
+        )
+
+        return [
+            VantageVibe.model_validate(vibe.model_dump())
+            for vibe in vantage_vibes
+        ]
+
+    async def get_vibe_configuration(
+        self,
+        vibe_id: str,
+        account_id: Optional[str] = None,
+    ) -> VantageVibe:
+        """
+        Retrieves the details of a specified Vantage vibe configuration.
+
+        See `VantageClient.get_vibe_configuration` for details.
+        """
+
+        vibe = await self.management_api.vantage_vibe_api.get_vantage_vibe(
+            vibe_id=vibe_id,
+            account_id=account_id or self.account_id,
+        )
+
+        return VantageVibe.model_validate(vibe.model_dump())
+
+    async def create_vibe_configuration(
+        self,
+        name: str,
+        llm_model_name: str,
+        external_key: Union[OpenAIKey, AnthropicKey],
+        account_id: Optional[str] = None,
+    ) -> VantageVibe:
+        """
+        Creates a new Vantage vibe configuration.
+
+        See `VantageClient.create_vibe_configuration` for details.
+        """
+
+        vibe_modifiable = VantageVibeModifiable(
+            llm_model_name=llm_model_name,
+            name=name,
+            external_account_id=external_key.external_key_id,
+        )
+
+        api = self.management_api.vantage_vibe_api
+        result = await api.create_vantage_vibe(
+            vantage_vibe_modifiable=vibe_modifiable,
+            account_id=account_id or self.account_id,
+        )
+
+        return VantageVibe.model_validate(result.model_dump())
+
+    async def update_vibe_configuration(
+        self,
+        vibe_id: str,
+        name: Optional[str] = None,
+        llm_model_name: Optional[str] = None,
+        external_key: Optional[Union[OpenAIKey, AnthropicKey]] = None,
+        account_id: Optional[str] = None,
+    ) -> VantageVibe:
+        """
+        Updates an existing Vantage vibe configuration.
+
+        See `VantageClient.update_vibe_configuration` for details.
+        """
+
+        vibe_modifiable = VantageVibeModifiable(
+            llm_model_name=llm_model_name,
+            name=name,
+            external_account_id=external_key.external_key_id,
+        )
+
+        api = self.management_api.vantage_vibe_api
+        result = await api.update_vantage_vibe(
+            vibe_id=vibe_id,
+            vantage_vibe_modifiable=vibe_modifiable,
+            account_id=account_id or self.account_id,
+        )
+
+        return VantageVibe.model_validate(result.model_dump())
+
+    async def delete_vibe_configuration(
+        self,
+        vibe_id: str,
+        account_id: Optional[str] = None,
+    ) -> None:
+        """
+        Deletes a specific Vantage vibe configuration.
+
+        See `VantageClient.delete_vibe_configuration` for details.
+        """
+
+        await self.management_api.vantage_vibe_api.delete_vantage_vibe(
+            vibe_id=vibe_id,
+            account_id=account_id or self.account_id,
+        )
+
+    # endregion
+
+    # region Search
+
+    async def semantic_search(
+        self,
+        text: str,
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        total_counts: Optional[TotalCountsOptions] = None,
+        vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> SearchResult:
+        """
+        Performs a search within a specified collection using a text query
+        and additional optional parameters.
+
+        See `VantageClient.semantic_search` for details.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._semantic_search_query(
+            text=text,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+            total_counts=total_counts,
+        )
+
+        result = await self.search_api.api.semantic_search(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            semantic_search_query=query,
+            _headers={"authorization": f"Bearer {vantage_api_key}"},
+        )
+
+        return SearchResult.model_validate(result.model_dump())
+
+    async def embedding_search(
+        self,
+        embedding: List[float],
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> SearchResult:
+        """
+        Performs a search within a specified collection using an embedding
+        and additional optional parameters.
+
+        See `VantageClient.embedding_search` for details.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._embedding_search_query(
+            embedding=embedding,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        result = await self.search_api.api.embedding_search(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            embedding_search_query=query,
+            _headers={"authorization": f"Bearer {vantage_api_key}"},
+        )
+
+        return SearchResult.model_validate(result.model_dump())
+
+    async def more_like_this_search(
+        self,
+        document_id: str,
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        account_id: Optional[str] = None,
+        vantage_api_key: Optional[str] = None,
+    ) -> SearchResult:
+        """
+        Performs a "More Like This" search to find documents similar to a
+        specified document within a specified collection using optional
+        additional parameters.
+
+        See `VantageClient.more_like_this_search` for details.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._more_like_this_query(
+            document_id=document_id,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        result = await self.search_api.api.more_like_this_search(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            more_like_this_query=query,
+            _headers={"authorization": f"Bearer {vantage_api_key}"},
+        )
+
+        return SearchResult.model_validate(result.model_dump())
+
+    async def more_like_these_search(
+        self,
+        more_like_these: list[MoreLikeTheseItem],
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        account_id: Optional[str] = None,
+        vantage_api_key: Optional[str] = None,
+    ) -> SearchResult:
+        """
+        Performs a "More Like These" search to find documents similar to a
+        specified list of MoreLikeTheseItem objects within a specified
+        collection using optional additional parameters.
+
+        See `VantageClient.more_like_these_search` for details.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._more_like_these_query(
+            more_like_these=more_like_these,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        result = await self.search_api.api.more_like_these_search(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            more_like_these_query=query,
+            _headers={"authorization": f"Bearer {vantage_api_key}"},
+        )
+
+        return SearchResult.model_validate(result.model_dump())
+
+    # endregion
+
+    # region Search - Additional
+
+    async def vantage_vibe_search(
+        self,
+        collection_id: str,
+        vibe_id: str,
+        images: List[Union[VantageVibeImageUrl, VantageVibeImageBase64]],
+        text: Optional[str],
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        account_id: Optional[str] = None,
+        vantage_api_key: Optional[str] = None,
+    ) -> SearchResult:
+        """
+        Performs a Vantage Vibe search to find documents with the vibe similar
+        to a specified list of image objects and text within a specified
+        collection using optional additional parameters.
+
+        See `VantageClient.vantage_vibe_search` for details.
+        """
+
+        vantage_vibe_search_query = self._vantage_vibe_search_query(
+            vibe_id=vibe_id,
+            images=images,
+            text=text,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        result = await self.search_api.api.vantage_vibe_search(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            vantage_vibe_search_query=vantage_vibe_search_query,
+            _headers={"authorization": f"Bearer {vantage_api_key}"},
+        )
+
+        return SearchResult.model_validate(result.model_dump())
+
+    async def shopping_assistant_search(
+        self,
+        collection_id: str,
+        text: str,
+        shopping_assistant_id: str,
+        max_groups: Optional[int] = 5,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        account_id: Optional[str] = None,
+        vantage_api_key: Optional[str] = None,
+    ) -> ShoppingAssistantResult:
+        """
+        Performs a search using a help of shopping assistant to find documents
+        within a specified collection and optional additional parameters.
+
+        See `VantageClient.shopping_assistant_search` for details.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._shopping_assistant_query(
+            text=text,
+            shopping_assistant_id=shopping_assistant_id,
+            max_groups=max_groups,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        result = await self.search_api.api.shopping_assistant(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            shopping_assistant_query=query,
+            _headers={"authorization": f"Bearer {vantage_api_key}"},
+        )
+
+        return ShoppingAssistantResult.model_validate(result.model_dump())
+
+    async def approximate_results_count_search(
+        self,
+        text: str,
+        collection_id: str,
+        total_counts: TotalCountsOptions,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> ApproximateResultsCountResult:
+        """
+        Performs a search within a specified collection using a text query and
+        optional additional parameters, returning approximate results count.
+
+        See `VantageClient.approximate_results_count_search` for details.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._semantic_search_query(
+            text=text,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+            total_counts=total_counts,
+        )
+
+        result = await self.search_api.api.approximate_results_count_search(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            semantic_search_query=query,
+            _headers={"authorization": f"Bearer {vantage_api_key}"},
+        )
+
+        return TotalCountResult.model_validate(result.model_dump())
+
+    # endregion
+
+    # region Search - Iterators
+
+    async def _iter_search_results(
+        self,
+        search: Callable[[Pagination], Awaitable[SearchResult]],
+        pagination: Optional[Pagination],
+        min_score: Optional[float],
+    ) -> AsyncIterator[SearchResultItem]:
+        page = pagination.page if pagination and pagination.page else 0
+
+        next_page = asyncio.ensure_future(
+            search(self._search_page(pagination, page))
+        )
+
+        try:
+            while next_page is not None:
+                results = (await next_page).results
+                next_page = None
+
+                if not results:
+                    return
+
+                if not self._is_last_search_page(
+                    results, pagination, min_score
+                ):
+                    page += 1
+                    next_page = asyncio.ensure_future(
+                        search(self._search_page(pagination, page))
+                    )
+
+                for item in results:
+                    if self._is_below_min_score(item, min_score):
+                        return
+
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def iter_semantic_search(
+        self,
+        text: str,
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        min_score: Optional[float] = None,
+        vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> AsyncIterator[SearchResultItem]:
+        """
+        Iterates over results of a semantic search, page by page,
+        using `async for`.
+
+        See `VantageClient.iter_semantic_search` for details.
+        """
+
+        async def search(page: Pagination) -> SearchResult:
+            return await self.semantic_search(
+                text=text,
+                collection_id=collection_id,
+                accuracy=accuracy,
+                pagination=page,
+                filter=filter,
+                sort=sort,
+                field_value_weighting=field_value_weighting,
+                facets=facets,
+                vantage_api_key=vantage_api_key,
+                account_id=account_id,
+            )
+
+        return self._iter_search_results(search, pagination, min_score)
+
+    def iter_embedding_search(
+        self,
+        embedding: List[float],
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        min_score: Optional[float] = None,
+        vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> AsyncIterator[SearchResultItem]:
+        """
+        Iterates over results of an embedding search, page by page,
+        using `async for`.
+
+        See `VantageClient.iter_embedding_search` for details.
+        """
+
+        async def search(page: Pagination) -> SearchResult:
+            return await self.embedding_search(
+                embedding=embedding,
+                collection_id=collection_id,
+                accuracy=accuracy,
+                pagination=page,
+                filter=filter,
+                sort=sort,
+                field_value_weighting=field_value_weighting,
+                facets=facets,
+                vantage_api_key=vantage_api_key,
+                account_id=account_id,
+            )
+
+        return self._iter_search_results(search, pagination, min_score)
+
+    # endregion
+
+    # region Search - Batch
+
+    async def batch_search(
+        self,
+        queries: List[SearchRequest],
+        max_concurrency: int = 8,
+    ) -> List[BatchSearchResult]:
+        """
+        Performs multiple searches concurrently, using a bounded number
+        of requests in flight at the same time.
+
+        See `VantageClient.batch_search` for details.
+        """
+        if max_concurrency < 1:
+            raise VantageValueError("max_concurrency must be at least 1.")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def search(query: SearchRequest) -> BatchSearchResult:
+            async with semaphore:
+                try:
+                    method = self._search_request_method(query)
+                    result = await method(**dict(query))
+                    return BatchSearchResult(result=result)
+                except Exception as exception:
+                    return BatchSearchResult(error=exception)
+
+        return list(await asyncio.gather(*map(search, queries)))
+
+    # endregion
+
+    # region Documents - Upsert Helper Functions
+
+    async def _upload_documents_using_direct_upload_url(
+        self,
+        direct_upload_url: str,
+        upload_content,
+        content_length: Optional[int] = None,
+    ) -> int:
+        session = self._api_client.rest_client.session
+        headers = (
+            {"Content-Length": str(content_length)}
+            if content_length is not None
+            else None
+        )
+
+        # Same as `requests`, do not send a content type which
+        # is not a part of the signed direct upload URL.
+        async with session.put(
+            direct_upload_url,
+            data=upload_content,
+            headers=headers,
+            skip_auto_headers=["Content-Type"],
+        ) as response:
+            if response.status != 200:
+                raise VantageFileUploadError(response.reason, response.status)
+
+            return response.status
+
+    async def _upload_documents_from_file(
+        self,
+        collection_id: str,
+        file_path: str,
+        batch_identifier: Optional[str],
+        account_id: Optional[str] = None,
+    ) -> int:
+        batch_identifier = self._direct_upload_batch_identifier(
+            batch_identifier
+        )
+
+        direct_upload_url = await self._get_direct_upload_url(
+            collection_id=collection_id,
+            file_size=Path(file_path).stat().st_size,
+            parquet_file_name=batch_identifier,
+            account_id=account_id,
+        )
+
+        with open(file_path, "rb") as file:
+            return await self._upload_documents_using_direct_upload_url(
+                direct_upload_url=direct_upload_url.upload_url,
+                upload_content=file,
+            )
+
+    async def _upload_documents_from_compressed_file(
+        self,
+        collection_id: str,
+        file_path: str,
+        batch_identifier: Optional[str],
+        account_id: Optional[str] = None,
+    ) -> int:
+        # Storage requires the size of uploaded content in advance,
+        # so the file is decompressed twice instead of storing it.
+        file_size = await asyncio.to_thread(decompressed_size, file_path)
+        batch_identifier = self._direct_upload_batch_identifier(
+            batch_identifier
+        )
+
+        direct_upload_url = await self._get_direct_upload_url(
+            collection_id=collection_id,
+            file_size=file_size,
+            parquet_file_name=batch_identifier,
+            account_id=account_id,
+        )
+
+        with open_jsonl(file_path) as file:
+            return await self._upload_documents_using_direct_upload_url(
+                direct_upload_url=direct_upload_url.upload_url,
+                upload_content=_read_chunks(file),
+                content_length=file_size,
+            )
+
+    # endregion
+
+    # region Documents - Upsert
+
+    async def upsert_documents(
+        self,
+        collection_id: str,
+        documents: Union[
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
+        ],
+        account_id: Optional[str] = None,
+    ):
+        """
+        Upserts documents to a specified collection from a list of Vantage
+        documents.
+
+        See `VantageClient.upsert_documents` for details.
+        """
+        first_document, documents = self._peek_documents(documents)
+
+        collection = await self.get_collection(
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+        )
+
+        self._document_to_collection_compatibility_check(
+            collection=collection,
+            document=first_document,
+        )
+
+        await self._upload_jsonl_batches(
+            collection_id=collection_id,
+            batches=self._document_batches(documents),
+            account_id=account_id or self.account_id,
+        )
+
+    async def _upload_jsonl_batches(
+        self,
+        collection_id: str,
+        batches: Iterable[str],
+        account_id: Optional[str],
+        batch_identifier: Optional[str] = None,
+    ) -> None:
+        for batch in batches:
+            await self.management_api.documents_api.upload_documents(
+                body=batch,
+                account_id=account_id if account_id else self.account_id,
+                collection_id=collection_id,
+                customer_batch_identifier=batch_identifier,
+            )
+
+    async def upsert_documents_from_jsonl_string(
+        self,
+        collection_id: str,
+        documents_jsonl: str,
+        batch_identifier: Optional[str] = None,
+        account_id: Optional[str] = None,
+        compact: bool = False,
+    ) -> None:
+        """
+        Upserts documents to a specified collection from a string containing
+        JSONL-formatted documents.
+
+        See `VantageClient.upsert_documents_from_jsonl_string` for details.
+
+        Notes
+        -----
+        Same as in `VantageClient`, batches are sent one after another,
+        so the order of operations within the JSONL string is preserved.
+        """
+
+        await self._upload_jsonl_batches(
+            collection_id=collection_id,
+            batches=self._jsonl_batches(documents_jsonl, compact=compact),
+            account_id=account_id,
+            batch_identifier=batch_identifier,
+        )
+
+    async def upsert_documents_from_jsonl_file(
+        self,
+        collection_id: str,
+        jsonl_file_path: str,
+        batch_identifier: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> None:
+        """
+        Upserts documents to a specified collection from a JSONL file located
+        at a given file path.
+
+        See `VantageClient.upsert_documents_from_jsonl_file` for details.
+        """
+
+        if not exists(jsonl_file_path):
+            raise FileNotFoundError(f"File \"{jsonl_file_path}\" not found.")
+
+        with BatchTextFileReader(
+            file_path=jsonl_file_path,
+            batch_size=_DOCUMENTS_UPLOAD_BATCH_SIZE,
+            max_batch_bytes=_DOCUMENTS_UPLOAD_BATCH_MAX_BYTES,
+            encoding=self._default_encoding,
+        ) as reader:
+            while True:
+                batch = await asyncio.to_thread(reader.next)
+
+                if not batch:
+                    return
+
+                await self.upsert_documents_from_jsonl_string(
+                    collection_id=collection_id,
+                    documents_jsonl=batch,
+                    batch_identifier=batch_identifier,
+                    account_id=account_id,
+                )
+
+    # endregion
+
+    # region Documents - Delete
+
+    async def delete_documents(
+        self,
+        collection_id: str,
+        document_ids: Iterable[str],
+        account_id: Optional[str] = None,
+    ) -> None:
+        """
+        Deletes a list of documents from a specified collection.
+
+        See `VantageClient.delete_documents` for details.
+        """
+
+        await self._upload_jsonl_batches(
+            collection_id=collection_id,
+            batches=self._delete_document_batches(document_ids),
+            account_id=account_id or self.account_id,
+        )
+
+    # endregion
+
+    # region Documents - Upload File
+
+    async def upload_documents_from_parquet_file(
+        self,
+        collection_id: str,
+        parquet_file_path: str,
+        account_id: Optional[str] = None,
+    ) -> int:
+        """
+        Uploads documents from a parquet file to a collection.
+
+        See `VantageClient.upload_documents_from_parquet_file` for details.
+
+        Notes
+        -----
+        The file is streamed to the direct upload URL,
+        instead of being read into memory first.
+        """
+
+        if not exists(parquet_file_path):
+            raise FileNotFoundError(f"File \"{parquet_file_path}\" not found.")
+
+        file_name = ntpath.basename(parquet_file_path)
+        file_type = magic.from_file(parquet_file_path)
+
+        if file_type != _PARQUET_FILE_TYPE:
+            raise ValueError("File must be a valid parquet file.")
+
+        return await self._upload_documents_from_file(
+            collection_id=collection_id,
+            file_path=parquet_file_path,
+            batch_identifier=file_name,
+            account_id=account_id,
+        )
+
+    async def upload_documents_from_jsonl_file(
+        self,
+        collection_id: str,
+        jsonl_file_path: str,
+        account_id: Optional[str] = None,
+    ) -> int:
+        """
+        Uploads documents from a JSONL file to a collection.
+
+        See `VantageClient.upload_documents_from_jsonl_file` for details.
+
+        Notes
+        -----
+        The file is streamed to the direct upload URL,
+        instead of being read into memory first. Compressed files
+        are decompressed while being streamed.
+        """
+        if not exists(jsonl_file_path):
+            raise FileNotFoundError(f"File \"{jsonl_file_path}\" not found.")
+
+        if await asyncio.to_thread(detect_compression, jsonl_file_path):
+            file_name = strip_compression_suffix(
+                ntpath.basename(jsonl_file_path)
+            )
+            if not file_name.endswith(".jsonl"):
+                file_name = f"{file_name}.jsonl"
+
+            return await self._upload_documents_from_compressed_file(
+                collection_id=collection_id,
+                file_path=jsonl_file_path,
+                batch_identifier=file_name,
+                account_id=account_id,
+            )
+
+        file_name = ntpath.basename(jsonl_file_path)
+        mime_type = magic.from_file(jsonl_file_path, mime=True)
+
+        # On some systems, magic identifies JSONL data as JSON data.
+        if mime_type not in (_JSONL_MIME_TYPE, _JSON_MIME_TYPE):
+            raise ValueError("File must be a valid JSONL file")
+
+        return await self._upload_documents_from_file(
+            collection_id=collection_id,
+            file_path=jsonl_file_path,
+            batch_identifier=file_name,
+            account_id=account_id,
+        )
+
+    # endregion
+
+    # region Documents - Validate File
+
+    async def validate_documents_from_jsonl(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str] = None,
+        embeddings_dimension: Optional[int] = None,
+    ) -> list[ValidationError]:
+        """
+        Validates documents from a JSONL file.
+
+        See `VantageClient.validate_documents_from_jsonl` for details.
+
+        Notes
+        -----
+        Validation is CPU bound, so it is executed in a separate thread.
+        """
+
+        return await asyncio.to_thread(
+            validator.validate_jsonl,
+            file_path=file_path,
+            collection_type=collection_type,
+            model=model,
+            embeddings_dimension=embeddings_dimension,
+        )
+
+    async def validate_documents_from_parquet(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str] = None,
+        embeddings_dimension: Optional[int] = None,
+    ) -> list[ValidationError]:
+        """
+        Validates documents from a Parquet file.
+
+        See `VantageClient.validate_documents_from_parquet` for details.
+
+        Notes
+        -----
+        Validation is CPU bound, so it is executed in a separate thread.
+        """
+
+        return await asyncio.to_thread(
+            validator.validate_parquet,
+            file_path=file_path,
+            collection_type=collection_type,
+            model=model,
+            embeddings_dimension=embeddings_dimension,
+        )
+
+    # endregion
@@ -5,14 +5,21 @@ which is a main entry point for users using the SDK.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import ntpath
+import re
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from os.path import exists
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 import magic
+import pandas
+import pyarrow as arrow
 import requests
 
 from vantage_sdk.config import (
@@ -23,8 +30,17 @@ from vantage_sdk.config import (
     DEFAULT_ENCODING,
 )
 from vantage_sdk.core.base import AuthorizationClient, AuthorizedApiClient
+from vantage_sdk.core.cache import TTLCache, search_cache_key
+from vantage_sdk.core.checkpoint import CheckpointJournal
+from vantage_sdk.core.compression import (
+    decompressed_size,
+    detect_compression,
+    open_jsonl,
+    strip_compression_suffix,
+)
+from vantage_sdk.core.http.models import AccountModifiable
+from vantage_sdk.core.http.models import Collection as OpenAPICollection
 from vantage_sdk.core.http.models import (
-    AccountModifiable,
     CollectionModifiable,
     CollectionStatus,
     CreateCollectionRequest,
@@ -60,15 +76,31 @@ from vantage_sdk.core.http.models import (
     VantageVibeSearchQuery,
 )
 from vantage_sdk.core.management import ManagementAPI
+from vantage_sdk.core.manifest import DocumentManifest, metadata_update
+from vantage_sdk.core.parquet_util import (
+    arrow_to_parquet_parts,
+    split_parquet_file,
+)
 from vantage_sdk.core.search import SearchAPI
+from vantage_sdk.core.single_flight import SingleFlight
 from vantage_sdk.core.text_util import (
     BatchTextFileReader,
     TextSplitter,
+    batch_lines,
     count_lines,
 )
+from vantage_sdk.core.upload import (
+    ChecksumReader,
+    compact_operations,
+    jsonl_lines,
+    upload_batches,
+)
 from vantage_sdk.core.validation import VALIDATOR as validator
+from vantage_sdk.core.validation import write_validation_report
+from vantage_sdk.core.writer import DocumentWriter
 from vantage_sdk.exceptions import VantageFileUploadError, VantageValueError
 from vantage_sdk.model.account import Account
+from vantage_sdk.model.cache import CacheStats
 from vantage_sdk.model.collection import (
     Collection,
     CollectionUploadURL,
@@ -77,6 +109,7 @@ from vantage_sdk.model.collection import (
     UserProvidedEmbeddingsCollection,
 )
 from vantage_sdk.model.document import (
+    DocumentBatch,
     UserProvidedEmbeddingsDocument,
     VantageManagedEmbeddingsDocument,
 )
@@ -91,25 +124,62 @@ from vantage_sdk.model.keys import (
 )
 from vantage_sdk.model.search import (
     ApproximateResultsCountResult,
+    BatchSearchResult,
+    EmbeddingSearchRequest,
     Facet,
     FieldValueWeighting,
     Filter,
     MoreLikeTheseItem,
+    MoreLikeThisSearchRequest,
     Pagination,
     SearchOptions,
+    SearchRequest,
     SearchResult,
+    SearchResultItem,
+    SemanticSearchRequest,
     Sort,
     TotalCountsOptions,
     VantageVibeImageBase64,
     VantageVibeImageUrl,
+    VantageVibeSearchRequest,
+)
+from vantage_sdk.model.validation import (
+    CollectionType,
+    ValidationError,
+    ValidationSummary,
 )
-from vantage_sdk.model.validation import CollectionType, ValidationError
 
 
 _DOCUMENTS_UPLOAD_BATCH_SIZE = 500
+_DOCUMENTS_UPLOAD_BATCH_MAX_BYTES = 4 * 1024 * 1024
 _PARQUET_FILE_TYPE = "Apache Parquet"
 _JSONL_MIME_TYPE = "application/x-ndjson"
 _JSON_MIME_TYPE = "application/json"
+_MD5_ETAG_PATTERN = re.compile(r"[0-9a-f]{32}")
+_UPLOAD_PART_MAX_RETRIES = 3
+_UPLOAD_PART_RETRY_BACKOFF_SECONDS = 1
+_DOCUMENT_WRITER_MAX_LATENCY_SECONDS = 1.0
+_VALIDATION_ID_MEMORY_BYTES = 256 * 1024 * 1024
+_SEARCH_CACHE_TTL_SECONDS = 60
+_SEARCH_CACHE_MAX_ENTRIES = 1024
+_SEARCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_COLLECTION_CACHE_TTL_SECONDS = 300
+_COLLECTION_CACHE_MAX_ENTRIES = 256
+_SEARCH_REQUEST_METHODS = {
+    SemanticSearchRequest: "semantic_search",
+    EmbeddingSearchRequest: "embedding_search",
+    MoreLikeThisSearchRequest: "more_like_this_search",
+    VantageVibeSearchRequest: "vantage_vibe_search",
+}
+
+
+def _is_retryable_upload_error(error: Exception) -> bool:
+    if not isinstance(error, VantageFileUploadError):
+        return True
+
+    # Status 200 means the upload succeeded, but its checksum did not match.
+    _, status_code = error.args
+    return status_code in (200, 408, 429) or status_code >= 500
 
 
 class VantageClient:
@@ -149,6 +219,13 @@ class VantageClient:
         self.vantage_api_key = vantage_api_key
         self.host = host
         self._default_encoding = DEFAULT_ENCODING
+        self._upload_session: Optional[requests.Session] = None
+        self._search_cache: Optional[TTLCache] = None
+        self._search_coalescer: Optional[SingleFlight] = None
+        self._collection_cache: Optional[TTLCache] = TTLCache(
+            ttl_seconds=_COLLECTION_CACHE_TTL_SECONDS,
+            max_entries=_COLLECTION_CACHE_MAX_ENTRIES,
+        )
 
     @classmethod
     def using_vantage_api_key(
@@ -321,6 +398,172 @@ class VantageClient:
             host=host,
         )
 
+    # region Search Cache and Coalescing
+
+    def enable_search_cache(
+        self,
+        ttl_seconds: float = _SEARCH_CACHE_TTL_SECONDS,
+        max_entries: int = _SEARCH_CACHE_MAX_ENTRIES,
+        max_bytes: Optional[int] = _SEARCH_CACHE_MAX_BYTES,
+    ) -> None:
+        """
+        Enables in-memory caching of search results.
+
+        Results of `semantic_search`, `embedding_search`,
+        `more_like_this_search` and `approximate_results_count_search`
+        are cached, keyed by the collection and the serialized query.
+        Cached results of a collection are invalidated when documents
+        in that collection are upserted, deleted or uploaded using this
+        client, or when the collection is deleted.
+
+        Parameters
+        ----------
+        ttl_seconds : float, optional
+            For how long a search result is cached.
+            Defaults to 60 seconds.
+        max_entries : int, optional
+            Maximum number of cached search results.
+            Defaults to 1024.
+        max_bytes : Optional[int], optional
+            Maximum total size of cached search results, in bytes.
+            If None, the size is limited only by `max_entries`.
+            Defaults to 64 MiB.
+
+        Notes
+        -----
+        Changes made to a collection outside of this client are not
+        reflected in cached results until they expire.
+        """
+        self._search_cache = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+
+    def disable_search_cache(self) -> None:
+        """
+        Disables caching of search results, discarding all cached results.
+        """
+        self._search_cache = None
+
+    def search_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Returns hit, miss and eviction counters of the search cache.
+
+        Returns
+        -------
+        Optional[CacheStats]
+            Search cache counters, or None if the cache is not enabled.
+        """
+        if self._search_cache is None:
+            return None
+
+        return self._search_cache.stats()
+
+    def enable_search_coalescing(self) -> None:
+        """
+        Enables coalescing of identical concurrent search requests.
+
+        When multiple threads perform the same search (same operation,
+        collection, query and API key) at the same time, only one request
+        is sent, and its result is shared with all of them. Works with
+        or without the search cache enabled.
+        """
+        self._search_coalescer = SingleFlight()
+
+    def disable_search_coalescing(self) -> None:
+        """
+        Disables coalescing of identical concurrent search requests.
+        """
+        self._search_coalescer = None
+
+    def coalesced_search_count(self) -> int:
+        """
+        Returns the number of searches which were served by
+        an identical search already in flight.
+
+        Returns
+        -------
+        int
+            Number of coalesced searches, or 0 if coalescing is not enabled.
+        """
+        if self._search_coalescer is None:
+            return 0
+
+        return self._search_coalescer.coalesced
+
+    def _invalidate_search_cache(
+        self,
+        collection_id: str,
+        account_id: Optional[str] = None,
+    ) -> None:
+        if self._search_cache is None:
+            return
+
+        self._search_cache.invalidate_tag(
+            (account_id or self.account_id, collection_id)
+        )
+
+    # endregion
+
+    # region Collection Metadata Cache
+
+    def enable_collection_cache(
+        self,
+        ttl_seconds: float = _COLLECTION_CACHE_TTL_SECONDS,
+        max_entries: int = _COLLECTION_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Enables in-memory caching of collection metadata, replacing
+        the current cache, if any.
+
+        The cache is enabled by default. It is used by methods which need
+        collection properties before sending a request, such as
+        `upsert_documents` and `update_collection`, and by
+        `get_collections`, which may therefore use metadata up to
+        `ttl_seconds` old if the collection was changed by another client.
+        `get_collection` always retrieves current metadata and stores it
+        in the cache. Cached metadata of a collection is invalidated
+        when the collection is created, updated or deleted using this
+        client.
+
+        Parameters
+        ----------
+        ttl_seconds : float, optional
+            For how long collection metadata is cached.
+            Defaults to 300 seconds.
+        max_entries : int, optional
+            Maximum number of cached collections.
+            Defaults to 256.
+        """
+        self._collection_cache = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+
+    def disable_collection_cache(self) -> None:
+        """
+        Disables caching of collection metadata,
+        discarding all cached metadata.
+        """
+        self._collection_cache = None
+
+    def collection_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Returns hit, miss and eviction counters of the collection cache.
+
+        Returns
+        -------
+        Optional[CacheStats]
+            Collection cache counters, or None if the cache is not enabled.
+        """
+        if self._collection_cache is None:
+            return None
+
+        return self._collection_cache.stats()
+
+    # endregion
+
     # region Account
 
     def get_account(
@@ -708,6 +951,123 @@ class VantageClient:
 
     # region Collections Helper Functions
 
+    def _create_collection_request(
+        self,
+        collection: Union[
+            UserProvidedEmbeddingsCollection,
+            OpenAICollection,
+            HuggingFaceCollection,
+        ],
+    ) -> CreateCollectionRequest:
+        if (
+            hasattr(collection, "secondary_external_accounts")
+            and collection.secondary_external_accounts is not None
+        ):
+            collection.secondary_external_accounts = [
+                OpenAPISecondaryExternalAccount(
+                    external_account_id=account.external_account_id,
+                    external_type=account.external_type,
+                )
+                for account in collection.secondary_external_accounts
+            ]
+
+        external_key_id = None
+        if (
+            hasattr(collection, "external_key")
+            and collection.external_key is not None
+        ):
+            external_key_id = collection.external_key.external_key_id
+
+        return CreateCollectionRequest(
+            collection_id=collection.collection_id,
+            collection_name=collection.collection_name,
+            user_provided_embeddings=bool(collection.user_provided_embeddings),
+            embeddings_dimension=int(collection.embeddings_dimension),
+            external_key_id=external_key_id,
+            secondary_external_accounts=getattr(
+                collection, 'secondary_external_accounts', None
+            ),
+            llm=getattr(collection, 'llm', None),
+            llm_secret=getattr(collection, 'llm_secret', None),
+            llm_provider=getattr(collection, 'llm_provider', None),
+            external_url=getattr(collection, 'external_url', None),
+            collection_preview_url_pattern=getattr(
+                collection, 'collection_preview_url_pattern', None
+            ),
+        )
+
+    def _collection_modifiable(
+        self,
+        collection: Collection,
+        collection_name: Optional[str] = None,
+        external_key_id: Optional[str] = None,
+        secondary_external_accounts: Optional[
+            List[SecondaryExternalAccount]
+        ] = None,
+    ) -> CollectionModifiable:
+        if secondary_external_accounts:
+            if collection.user_provided_embeddings:
+                raise ValueError(
+                    "Collections with user-provided embeddings cannot have secondary external accounts."
+                )
+
+            if collection.llm_provider is not LLMProvider.OpenAI.value:
+                raise ValueError(
+                    f"Only collections which are using {LLMProvider.OpenAI.value} as LLM provider can have secondary external accounts."  # noqa: E501
+                )
+
+            secondary_external_accounts = [
+                OpenAPISecondaryExternalAccount(
+                    external_account_id=account.external_account_id,
+                    external_type=account.external_type,
+                )
+                for account in secondary_external_accounts
+            ]
+
+        return CollectionModifiable(
+            external_key_id=external_key_id,
+            secondary_external_accounts=secondary_external_accounts,
+            collection_name=collection_name,
+        )
+
+    def _collection_metadata(
+        self,
+        collection_id: str,
+        account_id: Optional[str] = None,
+        refresh: bool = False,
+    ) -> OpenAPICollection:
+        account_id = account_id or self.account_id
+        cache = self._collection_cache
+        key = (account_id, collection_id)
+
+        if cache is not None and not refresh:
+            collection = cache.get(key)
+            if collection is not None:
+                return collection
+
+        # Metadata retrieved while the collection changes is not cached.
+        generation = cache.generation(key) if cache is not None else None
+        collection = self.management_api.collection_api.get_collection(
+            collection_id=collection_id,
+            account_id=account_id,
+        )
+        if cache is not None:
+            cache.put(key, collection, tag=key, generation=generation)
+
+        return collection
+
+    def _invalidate_collection_metadata(
+        self,
+        collection_id: str,
+        account_id: Optional[str] = None,
+    ) -> None:
+        if self._collection_cache is None:
+            return
+
+        self._collection_cache.invalidate_tag(
+            (account_id or self.account_id, collection_id)
+        )
+
     def _get_direct_upload_url(
         self,
         collection_id: str,
@@ -807,16 +1167,68 @@ class VantageClient:
 
         Notes
         -----
+        The collection cache is not used for the request, but it is
+        updated with the retrieved details.
+
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
-        collection = self.management_api.collection_api.get_collection(
-            collection_id=collection_id,
-            account_id=account_id or self.account_id,
+        collection = self._collection_metadata(
+            collection_id, account_id, refresh=True
         )
 
         return Collection.model_validate(collection.model_dump())
 
+    def get_collections(
+        self,
+        collection_ids: List[str],
+        account_id: Optional[str] = None,
+        max_concurrency: int = 8,
+    ) -> List[Collection]:
+        """
+        Retrieves the details of multiple collections.
+
+        Collections found in the collection cache are returned from it,
+        while the rest are retrieved concurrently and added to the cache.
+
+        Parameters
+        ----------
+        collection_ids : List[str]
+            The unique identifiers of the collections to be retrieved.
+        account_id : Optional[str], optional
+            The account ID to which the collections belong.
+            If not provided, the instance's account ID is used.
+            Defaults to None.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time.
+            Defaults to 8.
+
+        Returns
+        -------
+        List[Collection]
+            Collection objects, in the same order as `collection_ids`.
+        """
+        if max_concurrency < 1:
+            raise VantageValueError("max_concurrency must be at least 1.")
+
+        unique_ids = list(dict.fromkeys(collection_ids))
+        if not unique_ids:
+            return []
+
+        def fetch(collection_id: str) -> OpenAPICollection:
+            return self._collection_metadata(collection_id, account_id)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(unique_ids))
+        ) as executor:
+            fetched = executor.map(fetch, unique_ids)
+            collections = dict(zip(unique_ids, fetched))
+
+        return [
+            Collection.model_validate(collections[collection_id].model_dump())
+            for collection_id in collection_ids
+        ]
+
     def get_collection_status(
         self,
         collection_id: str,
@@ -885,41 +1297,8 @@ class VantageClient:
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
-        if (
-            hasattr(collection, "secondary_external_accounts")
-            and collection.secondary_external_accounts is not None
-        ):
-            collection.secondary_external_accounts = [
-                OpenAPISecondaryExternalAccount(
-                    external_account_id=account.external_account_id,
-                    external_type=account.external_type,
-                )
-                for account in collection.secondary_external_accounts
-            ]
-
-        external_key_id = None
-        if (
-            hasattr(collection, "external_key")
-            and collection.external_key is not None
-        ):
-            external_key_id = collection.external_key.external_key_id
-
-        create_collection_request = CreateCollectionRequest(
-            collection_id=collection.collection_id,
-            collection_name=collection.collection_name,
-            user_provided_embeddings=bool(collection.user_provided_embeddings),
-            embeddings_dimension=int(collection.embeddings_dimension),
-            external_key_id=external_key_id,
-            secondary_external_accounts=getattr(
-                collection, 'secondary_external_accounts', None
-            ),
-            llm=getattr(collection, 'llm', None),
-            llm_secret=getattr(collection, 'llm_secret', None),
-            llm_provider=getattr(collection, 'llm_provider', None),
-            external_url=getattr(collection, 'external_url', None),
-            collection_preview_url_pattern=getattr(
-                collection, 'collection_preview_url_pattern', None
-            ),
+        create_collection_request = self._create_collection_request(
+            collection=collection
         )
 
         collection = self.management_api.collection_api.create_collection(
@@ -927,6 +1306,10 @@ class VantageClient:
             account_id=account_id or self.account_id,
         )
 
+        self._invalidate_collection_metadata(
+            create_collection_request.collection_id, account_id
+        )
+
         return collection.model_validate(collection.model_dump())
 
     def update_collection(
@@ -969,41 +1352,26 @@ class VantageClient:
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
-        collection = self.management_api.collection_api.get_collection(
+        collection = self._collection_metadata(
             collection_id=collection_id,
-            account_id=account_id or self.account_id,
+            account_id=account_id,
         )
 
-        if secondary_external_accounts:
-            if collection.user_provided_embeddings:
-                raise ValueError(
-                    "Collections with user-provided embeddings cannot have secondary external accounts."
-                )
-
-            if collection.llm_provider is not LLMProvider.OpenAI.value:
-                raise ValueError(
-                    f"Only collections which are using {LLMProvider.OpenAI.value} as LLM provider can have secondary external accounts."  # noqa: E501
-                )
-
-            secondary_external_accounts = [
-                OpenAPISecondaryExternalAccount(
-                    external_account_id=account.external_account_id,
-                    external_type=account.external_type,
-                )
-                for account in secondary_external_accounts
-            ]
-
-        collection_modifiable = CollectionModifiable(
+        collection_modifiable = self._collection_modifiable(
+            collection=collection,
+            collection_name=collection_name,
             external_key_id=external_key_id,
             secondary_external_accounts=secondary_external_accounts,
-            collection_name=collection_name,
         )
 
-        collection = self.management_api.collection_api.update_collection(
-            collection_id=collection_id,
-            collection_modifiable=collection_modifiable,
-            account_id=account_id or self.account_id,
-        )
+        try:
+            collection = self.management_api.collection_api.update_collection(
+                collection_id=collection_id,
+                collection_modifiable=collection_modifiable,
+                account_id=account_id or self.account_id,
+            )
+        finally:
+            self._invalidate_collection_metadata(collection_id, account_id)
 
         return Collection.model_validate(collection.model_dump())
 
@@ -1035,10 +1403,14 @@ class VantageClient:
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
-        self.management_api.collection_api.delete_collection(
-            collection_id=collection_id,
-            account_id=account_id if account_id else self.account_id,
-        )
+        try:
+            self.management_api.collection_api.delete_collection(
+                collection_id=collection_id,
+                account_id=account_id if account_id else self.account_id,
+            )
+        finally:
+            self._invalidate_collection_metadata(collection_id, account_id)
+            self._invalidate_search_cache(collection_id, account_id)
 
     # endregion
 
@@ -1550,79 +1922,192 @@ class VantageClient:
 
         return vantage_api_key
 
-    # endregion
-
-    # region Search
-
-    def semantic_search(
+    def _call_search_api(
         self,
-        text: str,
+        operation: str,
         collection_id: str,
-        accuracy: Optional[float] = None,
-        pagination: Optional[Pagination] = None,
-        filter: Optional[Filter] = None,
-        sort: Optional[Sort] = None,
-        field_value_weighting: Optional[FieldValueWeighting] = None,
-        facets: Optional[List[Facet]] = None,
-        total_counts: Optional[TotalCountsOptions] = None,
-        vantage_api_key: Optional[str] = None,
-        account_id: Optional[str] = None,
-    ) -> SearchResult:
+        account_id: str,
+        vantage_api_key: str,
+        use_cache: bool = False,
+        **query,
+    ):
         """
-        Performs a search within a specified collection using a text query
-        and additional optional parameters.
-
-        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options)
-        documentation page for more details.
+        Calls a search API operation, using the search cache
+        and coalescing identical concurrent requests, if enabled.
 
         Parameters
         ----------
-        text : str
-            The text query for the semantic search.
+        operation : str
+            Name of the `SearchApi` operation, e.g. "semantic_search".
         collection_id : str
             The ID of the collection to search within.
-        accuracy : Optional[float], optional
-            The accuracy threshold for the search.
-            Defaults to None.
-        pagination: Optional[Pagination], optional
-            Pagination settings for the search results.
-            Defaults to None.
-        filter: Optional[Filter], optional
-            Filter settings to narrow down the search results.
-            Defaults to None.
-        sort: Optional[Sort], optional
-            Sorting settings for the search results.
-            Defaults to None.
-        field_value_weighting: Optional[FieldValueWeighting], optional
-            Weighting settings for specific field values in the search.
-            Defaults to None.
-        facets: Optional[List[Facet]], optional
-            Array of objects defining specific attributes of the data.
-            Defaults to None.
-        total_counts: Optional[TotalCountsOptions], optional
-            Similarity score range used to calculate the total
-            number of documents that match it.
-        vantage_api_key : Optional[str], optional
-            The Vantage API key used for authentication.
-            If not provided, the instance's API key is used.
-            Defaults to None.
-        account_id : Optional[str], optional
+        account_id : str
             The account ID associated with the search.
-            If not provided, the instance's account ID is used.
-            Defaults to None.
+        vantage_api_key : str
+            The Vantage API key used for authentication.
+        use_cache : bool, optional
+            If the result of the operation can be cached.
+            Defaults to False.
+        **query
+            The query, keyed by the name of the operation's query parameter.
+        """
 
-        Returns
-        -------
-        SearchResult
-            An object containing the search results.
+        def search():
+            return getattr(self.search_api.api, operation)(
+                collection_id=collection_id,
+                account_id=account_id,
+                _headers={"authorization": f"Bearer {vantage_api_key}"},
+                **query,
+            )
 
-        Notes
-        -----
-        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
+        cache = self._search_cache if use_cache else None
+        coalescer = self._search_coalescer
+        if cache is None and coalescer is None:
+            return search()
+
+        key = search_cache_key(
+            search_type=operation,
+            account_id=account_id,
+            collection_id=collection_id,
+            vantage_api_key=vantage_api_key,
+            query={name: value.to_dict() for name, value in query.items()},
+        )
+
+        if cache is not None:
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        tag = (account_id, collection_id)
+
+        def fetch():
+            # Results of searches running while the collection changes
+            # are not cached.
+            generation = cache.generation(tag) if cache is not None else None
+            result = search()
+            if cache is not None:
+                cache.put(
+                    key,
+                    result,
+                    size=len(result.to_json()),
+                    tag=tag,
+                    generation=generation,
+                )
+            return result
+
+        if coalescer is None:
+            return fetch()
+
+        return coalescer.do(key, fetch)
+
+    def _search_request_method(self, request: SearchRequest) -> Callable:
+        method_name = _SEARCH_REQUEST_METHODS.get(type(request))
+
+        if method_name is None:
+            raise VantageValueError(
+                f"Unsupported search request type: {type(request).__name__}."
+            )
+
+        return getattr(self, method_name)
+
+    def _search_page(
+        self,
+        pagination: Optional[Pagination],
+        page: int,
+    ) -> Pagination:
+        return Pagination(
+            page=page,
+            count=pagination.count if pagination else None,
+            threshold=pagination.threshold if pagination else None,
+        )
+
+    def _is_last_search_page(
+        self,
+        results: List[SearchResultItem],
+        pagination: Optional[Pagination],
+        min_score: Optional[float],
+    ) -> bool:
+        if pagination and pagination.count:
+            if len(results) < pagination.count:
+                return True
+
+        return self._is_below_min_score(results[-1], min_score)
+
+    def _is_below_min_score(
+        self,
+        item: SearchResultItem,
+        min_score: Optional[float],
+    ) -> bool:
+        return (
+            min_score is not None
+            and item.score is not None
+            and item.score < min_score
+        )
+
+    def _iter_search_results(
+        self,
+        search: Callable[[Pagination], SearchResult],
+        pagination: Optional[Pagination],
+        min_score: Optional[float],
+    ) -> Iterator[SearchResultItem]:
         """
+        Yields search result items page by page, fetching the next page
+        in the background while the current one is being consumed.
 
-        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+        Parameters
+        ----------
+        search : Callable[[Pagination], SearchResult]
+            Performs the search for a given page.
+        pagination : Optional[Pagination]
+            Page to start from, page size and threshold.
+        min_score : Optional[float]
+            Score below which the iteration stops.
+        """
+        page = pagination.page if pagination and pagination.page else 0
+
+        # At most one page is being fetched while another one is consumed.
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            next_page = executor.submit(
+                search, self._search_page(pagination, page)
+            )
 
+            while next_page is not None:
+                results = next_page.result().results
+                next_page = None
+
+                if not results:
+                    return
+
+                if not self._is_last_search_page(
+                    results, pagination, min_score
+                ):
+                    page += 1
+                    next_page = executor.submit(
+                        search, self._search_page(pagination, page)
+                    )
+
+                for item in results:
+                    if self._is_below_min_score(item, min_score):
+                        return
+
+                    yield item
+        finally:
+            # Releases the prefetching thread also when the iteration
+            # is stopped early, without waiting for the page it fetches.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _semantic_search_query(
+        self,
+        text: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        total_counts: Optional[TotalCountsOptions] = None,
+    ) -> SemanticSearchQuery:
         search_properties = self._prepare_search_query(
             accuracy=accuracy,
             pagination=pagination,
@@ -1632,7 +2117,7 @@ class VantageClient:
             facets=facets,
         )
 
-        query = SemanticSearchQuery(
+        return SemanticSearchQuery(
             text=text,
             collection=search_properties.collection,
             filter=search_properties.filter,
@@ -1645,80 +2130,16 @@ class VantageClient:
             ),
         )
 
-        result = self.search_api.api.semantic_search(
-            collection_id=collection_id,
-            account_id=account_id or self.account_id,
-            semantic_search_query=query,
-            _headers={"authorization": f"Bearer {vantage_api_key}"},
-        )
-
-        return SearchResult.model_validate(result.model_dump())
-
-    def embedding_search(
+    def _embedding_search_query(
         self,
         embedding: List[float],
-        collection_id: str,
         accuracy: Optional[float] = None,
         pagination: Optional[Pagination] = None,
         filter: Optional[Filter] = None,
         sort: Optional[Sort] = None,
         field_value_weighting: Optional[FieldValueWeighting] = None,
         facets: Optional[List[Facet]] = None,
-        vantage_api_key: Optional[str] = None,
-        account_id: Optional[str] = None,
-    ) -> SearchResult:
-        """
-        Performs a search within a specified collection using an embedding vector and
-        optional additional parameters.
-
-        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options)
-        documentation page for more details.
-
-        Parameters
-        ----------
-        embedding : List[int]
-            The embedding vector used for the search.
-        collection_id : str
-            The ID of the collection to search within.
-        accuracy : Optional[float], optional
-            The accuracy threshold for the search.
-            Defaults to None.
-        pagination: Optional[Pagination], optional
-            Pagination settings for the search results.
-            Defaults to None.
-        filter: Optional[Filter], optional
-            Filter settings to narrow down the search results.
-            Defaults to None.
-        sort: Optional[Sort], optional
-            Sorting settings for the search results.
-            Defaults to None.
-        field_value_weighting: Optional[FieldValueWeighting], optional
-            Weighting settings for specific field values in the search.
-            Defaults to None.
-        facets: Optional[List[Facet]], optional
-            Array of objects defining specific attributes of the data.
-            Defaults to None.
-        vantage_api_key : Optional[str], optional
-            The Vantage API key used for authentication.
-            If not provided, the instance's API key is used.
-            Defaults to None.
-        account_id : Optional[str], optional
-            The account ID associated with the search.
-            If not provided, the instance's account ID is used.
-            Defaults to None.
-
-        Returns
-        -------
-        SearchResult
-            An object containing the search results.
-
-        Notes
-        -----
-        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
-        """
-
-        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
-
+    ) -> EmbeddingSearchQuery:
         search_properties = self._prepare_search_query(
             accuracy=accuracy,
             pagination=pagination,
@@ -1728,7 +2149,7 @@ class VantageClient:
             facets=facets,
         )
 
-        query = EmbeddingSearchQuery(
+        return EmbeddingSearchQuery(
             embedding=embedding,
             collection=search_properties.collection,
             filter=search_properties.filter,
@@ -1738,81 +2159,16 @@ class VantageClient:
             facets=search_properties.facets,
         )
 
-        result = self.search_api.api.embedding_search(
-            collection_id=collection_id,
-            account_id=account_id or self.account_id,
-            embedding_search_query=query,
-            _headers={"authorization": f"Bearer {vantage_api_key}"},
-        )
-
-        return SearchResult.model_validate(result.model_dump())
-
-    def more_like_this_search(
+    def _more_like_this_query(
         self,
         document_id: str,
-        collection_id: str,
         accuracy: Optional[float] = None,
         pagination: Optional[Pagination] = None,
         filter: Optional[Filter] = None,
         sort: Optional[Sort] = None,
         field_value_weighting: Optional[FieldValueWeighting] = None,
         facets: Optional[List[Facet]] = None,
-        account_id: Optional[str] = None,
-        vantage_api_key: Optional[str] = None,
-    ) -> SearchResult:
-        """
-        Performs a "More Like This" search to find documents similar to a specified
-        document within a specified collection using optional additional parameters.
-
-        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options) and
-        [More Like This](https://docs.vantagediscovery.com/docs/search-more-like-this)
-        documentation pages for more details.
-
-        Parameters
-        ----------
-        document_id : str
-            The ID of the document to find similar documents to.
-        collection_id : str
-            The ID of the collection to search within.
-        accuracy : Optional[float], optional
-            The accuracy threshold for the search.
-            Defaults to None.
-        pagination: Optional[Pagination], optional
-            Pagination settings for the search results.
-            Defaults to None.
-        filter: Optional[Filter], optional
-            Filter settings to narrow down the search results.
-            Defaults to None.
-        sort: Optional[Sort], optional
-            Sorting settings for the search results.
-            Defaults to None.
-        field_value_weighting: Optional[FieldValueWeighting], optional
-            Weighting settings for specific field values in the search.
-            Defaults to None.
-        facets: Optional[List[Facet]], optional
-            Array of objects defining specific attributes of the data.
-            Defaults to None.
-        vantage_api_key : Optional[str], optional
-            The Vantage API key used for authentication.
-            If not provided, the instance's API key is used.
-            Defaults to None.
-        account_id : Optional[str], optional
-            The account ID associated with the search.
-            If not provided, the instance's account ID is used.
-            Defaults to None.
-
-        Returns
-        -------
-        SearchResult
-            An object containing the search results similar to the specified document.
-
-        Notes
-        -----
-        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
-        """
-
-        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
-
+    ) -> MoreLikeThisQuery:
         search_properties = self._prepare_search_query(
             accuracy=accuracy,
             pagination=pagination,
@@ -1822,7 +2178,7 @@ class VantageClient:
             facets=facets,
         )
 
-        query = MoreLikeThisQuery(
+        return MoreLikeThisQuery(
             document_id=document_id,
             collection=search_properties.collection,
             filter=search_properties.filter,
@@ -1832,18 +2188,124 @@ class VantageClient:
             facets=search_properties.facets,
         )
 
-        result = self.search_api.api.more_like_this_search(
-            collection_id=collection_id,
-            account_id=account_id or self.account_id,
-            more_like_this_query=query,
-            _headers={"authorization": f"Bearer {vantage_api_key}"},
-        )
-
-        return SearchResult.model_validate(result.model_dump())
-
-    def more_like_these_search(
+    def _more_like_these_query(
         self,
         more_like_these: list[MoreLikeTheseItem],
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+    ) -> MoreLikeTheseQuery:
+        search_properties = self._prepare_search_query(
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        return MoreLikeTheseQuery(
+            these=[
+                MLTheseTheseInner.model_validate(item.model_dump())
+                for item in more_like_these
+            ],
+            collection=search_properties.collection,
+            filter=search_properties.filter,
+            pagination=search_properties.pagination,
+            sort=search_properties.sort,
+            field_value_weighting=search_properties.field_value_weighting,
+            facets=search_properties.facets,
+        )
+
+    def _vantage_vibe_search_query(
+        self,
+        vibe_id: str,
+        images: List[Union[VantageVibeImageUrl, VantageVibeImageBase64]],
+        text: Optional[str],
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+    ) -> VantageVibeSearchQuery:
+        if len(images) > 10 or len(images) < 1:
+            raise VantageValueError(
+                "The images array should contain at least one and up to 10 elements."
+            )
+
+        search_properties = self._prepare_search_query(
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        prepared_images = [
+            VantageVibeImage(
+                url=image.url,
+                image=image.base64,
+            )
+            for image in images
+        ]
+
+        return VantageVibeSearchQuery(
+            vibe_id=vibe_id,
+            text=text,
+            images=prepared_images,
+            collection=search_properties.collection,
+            filter=search_properties.filter,
+            pagination=search_properties.pagination,
+            sort=search_properties.sort,
+            field_value_weighting=search_properties.field_value_weighting,
+            facets=search_properties.facets,
+        )
+
+    def _shopping_assistant_query(
+        self,
+        text: str,
+        shopping_assistant_id: str,
+        max_groups: Optional[int] = 5,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+    ) -> ShoppingAssistantQuery:
+        search_properties = self._prepare_search_query(
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        return ShoppingAssistantQuery(
+            text=text,
+            max_groups=max_groups,
+            shopping_assistant_id=shopping_assistant_id,
+            collection=search_properties.collection,
+            filter=search_properties.filter,
+            pagination=search_properties.pagination,
+            sort=search_properties.sort,
+            field_value_weighting=search_properties.field_value_weighting,
+            facets=search_properties.facets,
+        )
+
+    # endregion
+
+    # region Search
+
+    def semantic_search(
+        self,
+        text: str,
         collection_id: str,
         accuracy: Optional[float] = None,
         pagination: Optional[Pagination] = None,
@@ -1851,21 +2313,21 @@ class VantageClient:
         sort: Optional[Sort] = None,
         field_value_weighting: Optional[FieldValueWeighting] = None,
         facets: Optional[List[Facet]] = None,
-        account_id: Optional[str] = None,
+        total_counts: Optional[TotalCountsOptions] = None,
         vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
     ) -> SearchResult:
         """
-        Performs a "More Like These" search to find documents similar to a specified list
-        of MoreLikeTheseItem objects within a specified collection using optional additional parameters.
+        Performs a search within a specified collection using a text query
+        and additional optional parameters.
 
         Check [Search Options](https://docs.vantagediscovery.com/docs/search-options)
-        and [More Like These](https://docs.vantagediscovery.com/docs/search-more-like-these-tm)
-        documentation pages for more details.
+        documentation page for more details.
 
         Parameters
         ----------
-        more_like_these : list[MoreLikeTheseItem]
-            The list of "MoreLikeTheseItem" objects to find similar documents to.
+        text : str
+            The text query for the semantic search.
         collection_id : str
             The ID of the collection to search within.
         accuracy : Optional[float], optional
@@ -1886,6 +2348,9 @@ class VantageClient:
         facets: Optional[List[Facet]], optional
             Array of objects defining specific attributes of the data.
             Defaults to None.
+        total_counts: Optional[TotalCountsOptions], optional
+            Similarity score range used to calculate the total
+            number of documents that match it.
         vantage_api_key : Optional[str], optional
             The Vantage API key used for authentication.
             If not provided, the instance's API key is used.
@@ -1898,7 +2363,7 @@ class VantageClient:
         Returns
         -------
         SearchResult
-            An object containing the search results similar to the specified document.
+            An object containing the search results.
 
         Notes
         -----
@@ -1907,74 +2372,54 @@ class VantageClient:
 
         vantage_api_key = self._vantage_api_key_check(vantage_api_key)
 
-        search_properties = self._prepare_search_query(
+        query = self._semantic_search_query(
+            text=text,
             accuracy=accuracy,
             pagination=pagination,
             filter=filter,
             sort=sort,
             field_value_weighting=field_value_weighting,
             facets=facets,
+            total_counts=total_counts,
         )
 
-        query = MoreLikeTheseQuery(
-            these=[
-                MLTheseTheseInner.model_validate(item.model_dump())
-                for item in more_like_these
-            ],
-            collection=search_properties.collection,
-            filter=search_properties.filter,
-            pagination=search_properties.pagination,
-            sort=search_properties.sort,
-            field_value_weighting=search_properties.field_value_weighting,
-            facets=search_properties.facets,
-        )
-
-        result = self.search_api.api.more_like_these_search(
+        result = self._call_search_api(
+            operation="semantic_search",
             collection_id=collection_id,
             account_id=account_id or self.account_id,
-            more_like_these_query=query,
-            _headers={"authorization": f"Bearer {vantage_api_key}"},
+            vantage_api_key=vantage_api_key,
+            use_cache=True,
+            semantic_search_query=query,
         )
 
         return SearchResult.model_validate(result.model_dump())
 
-    # endregion
-
-    # region Search - Additional
-
-    def vantage_vibe_search(
+    def embedding_search(
         self,
+        embedding: List[float],
         collection_id: str,
-        vibe_id: str,
-        images: List[Union[VantageVibeImageUrl, VantageVibeImageBase64]],
-        text: Optional[str],
         accuracy: Optional[float] = None,
         pagination: Optional[Pagination] = None,
         filter: Optional[Filter] = None,
         sort: Optional[Sort] = None,
         field_value_weighting: Optional[FieldValueWeighting] = None,
         facets: Optional[List[Facet]] = None,
-        account_id: Optional[str] = None,
         vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
     ) -> SearchResult:
         """
-        Performs a Vantage Vibe search to find documents with the vibe similar to a specified list
-        of image objects and text within a specified collection using optional additional parameters.
+        Performs a search within a specified collection using an embedding vector and
+        optional additional parameters.
 
-        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options) and
-        [Vantage Vibe](https://docs.vantagediscovery.com/docs/search-vantage-vibe)
-        documentation pages for more details.
+        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options)
+        documentation page for more details.
 
         Parameters
         ----------
+        embedding : List[int]
+            The embedding vector used for the search.
         collection_id : str
             The ID of the collection to search within.
-        vibe_id : str
-            The ID of the Vantage vibe.
-        images : list[Union[VantageVibeImageUrl, VantageVibeImageBase64]]
-            The images to find documents with the same vibe.
-        text: Optional[sting], optional
-            The text query for the search.
         accuracy : Optional[float], optional
             The accuracy threshold for the search.
             Defaults to None.
@@ -2005,21 +2450,17 @@ class VantageClient:
         Returns
         -------
         SearchResult
-            An object containing the search results similar to the specified document.
+            An object containing the search results.
 
         Notes
         -----
         Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
         """
 
-        if len(images) > 10 or len(images) < 1:
-            raise VantageValueError(
-                "The images array should contain at least one and up to 10 elements."
-            )
-
         vantage_api_key = self._vantage_api_key_check(vantage_api_key)
 
-        search_properties = self._prepare_search_query(
+        query = self._embedding_search_query(
+            embedding=embedding,
             accuracy=accuracy,
             pagination=pagination,
             filter=filter,
@@ -2028,41 +2469,21 @@ class VantageClient:
             facets=facets,
         )
 
-        prepared_images = [
-            VantageVibeImage(
-                url=image.url,
-                image=image.base64,
-            )
-            for image in images
-        ]
-
-        vantage_vibe_search_query = VantageVibeSearchQuery(
-            vibe_id=vibe_id,
-            text=text,
-            images=prepared_images,
-            collection=search_properties.collection,
-            filter=search_properties.filter,
-            pagination=search_properties.pagination,
-            sort=search_properties.sort,
-            field_value_weighting=search_properties.field_value_weighting,
-            facets=search_properties.facets,
-        )
-
-        result = self.search_api.api.vantage_vibe_search(
+        result = self._call_search_api(
+            operation="embedding_search",
             collection_id=collection_id,
             account_id=account_id or self.account_id,
-            vantage_vibe_search_query=vantage_vibe_search_query,
-            _headers={"authorization": f"Bearer {vantage_api_key}"},
+            vantage_api_key=vantage_api_key,
+            use_cache=True,
+            embedding_search_query=query,
         )
 
         return SearchResult.model_validate(result.model_dump())
 
-    def shopping_assistant_search(
+    def more_like_this_search(
         self,
+        document_id: str,
         collection_id: str,
-        text: str,
-        shopping_assistant_id: str,
-        max_groups: Optional[int] = 5,
         accuracy: Optional[float] = None,
         pagination: Optional[Pagination] = None,
         filter: Optional[Filter] = None,
@@ -2071,26 +2492,21 @@ class VantageClient:
         facets: Optional[List[Facet]] = None,
         account_id: Optional[str] = None,
         vantage_api_key: Optional[str] = None,
-    ) -> ShoppingAssistantResult:
+    ) -> SearchResult:
         """
-        Performs a search using a help of shopping assistant to find documents
-        within a specified collection and optional additional parameters.
+        Performs a "More Like This" search to find documents similar to a specified
+        document within a specified collection using optional additional parameters.
 
-        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options)
-        and [ShoppingAssistant](https://docs.vantagediscovery.com/docs/search-shopping-assistant)
+        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options) and
+        [More Like This](https://docs.vantagediscovery.com/docs/search-more-like-this)
         documentation pages for more details.
 
         Parameters
         ----------
+        document_id : str
+            The ID of the document to find similar documents to.
         collection_id : str
             The ID of the collection to search within.
-        text: str
-            Query for the LLM to parse into groups based on the predefined system prompt.
-        shopping_assistant_id: str
-            The ID of the shopping assistant configuration linked to specified collection.
-        max_groups: Optional[int], optional
-            Max number of groups the user wants to give back.
-            Defaults to 5.
         accuracy : Optional[float], optional
             The accuracy threshold for the search.
             Defaults to None.
@@ -2120,16 +2536,18 @@ class VantageClient:
 
         Returns
         -------
-        ShoppingAssistantResult
-            An object containing the search results, grouped as configured in the shopping assistant.
+        SearchResult
+            An object containing the search results similar to the specified document.
 
         Notes
         -----
         Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
         """
+
         vantage_api_key = self._vantage_api_key_check(vantage_api_key)
 
-        search_properties = self._prepare_search_query(
+        query = self._more_like_this_query(
+            document_id=document_id,
             accuracy=accuracy,
             pagination=pagination,
             filter=filter,
@@ -2138,30 +2556,298 @@ class VantageClient:
             facets=facets,
         )
 
-        query = ShoppingAssistantQuery(
-            text=text,
-            max_groups=max_groups,
-            shopping_assistant_id=shopping_assistant_id,
-            collection=search_properties.collection,
-            filter=search_properties.filter,
-            pagination=search_properties.pagination,
-            sort=search_properties.sort,
-            field_value_weighting=search_properties.field_value_weighting,
-            facets=search_properties.facets,
-        )
-
-        result = self.search_api.api.shopping_assistant(
+        result = self._call_search_api(
+            operation="more_like_this_search",
             collection_id=collection_id,
             account_id=account_id or self.account_id,
-            shopping_assistant_query=query,
-            _headers={"authorization": f"Bearer {vantage_api_key}"},
+            vantage_api_key=vantage_api_key,
+            use_cache=True,
+            more_like_this_query=query,
         )
 
-        return ShoppingAssistantResult.model_validate(result.model_dump())
+        return SearchResult.model_validate(result.model_dump())
 
-    def approximate_results_count_search(
+    def more_like_these_search(
         self,
-        text: str,
+        more_like_these: list[MoreLikeTheseItem],
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        account_id: Optional[str] = None,
+        vantage_api_key: Optional[str] = None,
+    ) -> SearchResult:
+        """
+        Performs a "More Like These" search to find documents similar to a specified list
+        of MoreLikeTheseItem objects within a specified collection using optional additional parameters.
+
+        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options)
+        and [More Like These](https://docs.vantagediscovery.com/docs/search-more-like-these-tm)
+        documentation pages for more details.
+
+        Parameters
+        ----------
+        more_like_these : list[MoreLikeTheseItem]
+            The list of "MoreLikeTheseItem" objects to find similar documents to.
+        collection_id : str
+            The ID of the collection to search within.
+        accuracy : Optional[float], optional
+            The accuracy threshold for the search.
+            Defaults to None.
+        pagination: Optional[Pagination], optional
+            Pagination settings for the search results.
+            Defaults to None.
+        filter: Optional[Filter], optional
+            Filter settings to narrow down the search results.
+            Defaults to None.
+        sort: Optional[Sort], optional
+            Sorting settings for the search results.
+            Defaults to None.
+        field_value_weighting: Optional[FieldValueWeighting], optional
+            Weighting settings for specific field values in the search.
+            Defaults to None.
+        facets: Optional[List[Facet]], optional
+            Array of objects defining specific attributes of the data.
+            Defaults to None.
+        vantage_api_key : Optional[str], optional
+            The Vantage API key used for authentication.
+            If not provided, the instance's API key is used.
+            Defaults to None.
+        account_id : Optional[str], optional
+            The account ID associated with the search.
+            If not provided, the instance's account ID is used.
+            Defaults to None.
+
+        Returns
+        -------
+        SearchResult
+            An object containing the search results similar to the specified document.
+
+        Notes
+        -----
+        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._more_like_these_query(
+            more_like_these=more_like_these,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        result = self._call_search_api(
+            operation="more_like_these_search",
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            vantage_api_key=vantage_api_key,
+            more_like_these_query=query,
+        )
+
+        return SearchResult.model_validate(result.model_dump())
+
+    # endregion
+
+    # region Search - Additional
+
+    def vantage_vibe_search(
+        self,
+        collection_id: str,
+        vibe_id: str,
+        images: List[Union[VantageVibeImageUrl, VantageVibeImageBase64]],
+        text: Optional[str],
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        account_id: Optional[str] = None,
+        vantage_api_key: Optional[str] = None,
+    ) -> SearchResult:
+        """
+        Performs a Vantage Vibe search to find documents with the vibe similar to a specified list
+        of image objects and text within a specified collection using optional additional parameters.
+
+        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options) and
+        [Vantage Vibe](https://docs.vantagediscovery.com/docs/search-vantage-vibe)
+        documentation pages for more details.
+
+        Parameters
+        ----------
+        collection_id : str
+            The ID of the collection to search within.
+        vibe_id : str
+            The ID of the Vantage vibe.
+        images : list[Union[VantageVibeImageUrl, VantageVibeImageBase64]]
+            The images to find documents with the same vibe.
+        text: Optional[sting], optional
+            The text query for the search.
+        accuracy : Optional[float], optional
+            The accuracy threshold for the search.
+            Defaults to None.
+        pagination: Optional[Pagination], optional
+            Pagination settings for the search results.
+            Defaults to None.
+        filter: Optional[Filter], optional
+            Filter settings to narrow down the search results.
+            Defaults to None.
+        sort: Optional[Sort], optional
+            Sorting settings for the search results.
+            Defaults to None.
+        field_value_weighting: Optional[FieldValueWeighting], optional
+            Weighting settings for specific field values in the search.
+            Defaults to None.
+        facets: Optional[List[Facet]], optional
+            Array of objects defining specific attributes of the data.
+            Defaults to None.
+        vantage_api_key : Optional[str], optional
+            The Vantage API key used for authentication.
+            If not provided, the instance's API key is used.
+            Defaults to None.
+        account_id : Optional[str], optional
+            The account ID associated with the search.
+            If not provided, the instance's account ID is used.
+            Defaults to None.
+
+        Returns
+        -------
+        SearchResult
+            An object containing the search results similar to the specified document.
+
+        Notes
+        -----
+        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
+        """
+
+        vantage_vibe_search_query = self._vantage_vibe_search_query(
+            vibe_id=vibe_id,
+            images=images,
+            text=text,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        result = self._call_search_api(
+            operation="vantage_vibe_search",
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            vantage_api_key=vantage_api_key,
+            vantage_vibe_search_query=vantage_vibe_search_query,
+        )
+
+        return SearchResult.model_validate(result.model_dump())
+
+    def shopping_assistant_search(
+        self,
+        collection_id: str,
+        text: str,
+        shopping_assistant_id: str,
+        max_groups: Optional[int] = 5,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        account_id: Optional[str] = None,
+        vantage_api_key: Optional[str] = None,
+    ) -> ShoppingAssistantResult:
+        """
+        Performs a search using a help of shopping assistant to find documents
+        within a specified collection and optional additional parameters.
+
+        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options)
+        and [ShoppingAssistant](https://docs.vantagediscovery.com/docs/search-shopping-assistant)
+        documentation pages for more details.
+
+        Parameters
+        ----------
+        collection_id : str
+            The ID of the collection to search within.
+        text: str
+            Query for the LLM to parse into groups based on the predefined system prompt.
+        shopping_assistant_id: str
+            The ID of the shopping assistant configuration linked to specified collection.
+        max_groups: Optional[int], optional
+            Max number of groups the user wants to give back.
+            Defaults to 5.
+        accuracy : Optional[float], optional
+            The accuracy threshold for the search.
+            Defaults to None.
+        pagination: Optional[Pagination], optional
+            Pagination settings for the search results.
+            Defaults to None.
+        filter: Optional[Filter], optional
+            Filter settings to narrow down the search results.
+            Defaults to None.
+        sort: Optional[Sort], optional
+            Sorting settings for the search results.
+            Defaults to None.
+        field_value_weighting: Optional[FieldValueWeighting], optional
+            Weighting settings for specific field values in the search.
+            Defaults to None.
+        facets: Optional[List[Facet]], optional
+            Array of objects defining specific attributes of the data.
+            Defaults to None.
+        vantage_api_key : Optional[str], optional
+            The Vantage API key used for authentication.
+            If not provided, the instance's API key is used.
+            Defaults to None.
+        account_id : Optional[str], optional
+            The account ID associated with the search.
+            If not provided, the instance's account ID is used.
+            Defaults to None.
+
+        Returns
+        -------
+        ShoppingAssistantResult
+            An object containing the search results, grouped as configured in the shopping assistant.
+
+        Notes
+        -----
+        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
+        """
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._shopping_assistant_query(
+            text=text,
+            shopping_assistant_id=shopping_assistant_id,
+            max_groups=max_groups,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+        )
+
+        result = self._call_search_api(
+            operation="shopping_assistant",
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            vantage_api_key=vantage_api_key,
+            shopping_assistant_query=query,
+        )
+
+        return ShoppingAssistantResult.model_validate(result.model_dump())
+
+    def approximate_results_count_search(
+        self,
+        text: str,
         collection_id: str,
         total_counts: TotalCountsOptions,
         accuracy: Optional[float] = None,
@@ -2172,29 +2858,206 @@ class VantageClient:
         facets: Optional[List[Facet]] = None,
         vantage_api_key: Optional[str] = None,
         account_id: Optional[str] = None,
-    ) -> ApproximateResultsCountResult:
+    ) -> ApproximateResultsCountResult:
+        """
+        Performs a search within a specified collection using a text query and
+        optional additional parameters.
+
+        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options) and
+        [Approximate Results Count Search](https://docs.vantagediscovery.com/docs/search-approximate-results-count)
+        documentation pages for more details.
+
+        Parameters
+        ----------
+        text : str
+            The text query for the semantic search.
+        collection_id : str
+            The ID of the collection to search within.
+        total_counts: TotalCountsOptions
+            Similarity score range used to calculate the total
+            number of documents that match it.
+        accuracy : Optional[float], optional
+            The accuracy threshold for the search.
+            Defaults to None.
+        pagination: Optional[Pagination], optional
+            Pagination settings for the search results.
+            Defaults to None.
+        filter: Optional[Filter], optional
+            Filter settings to narrow down the search results.
+            Defaults to None.
+        sort: Optional[Sort], optional
+            Sorting settings for the search results.
+            Defaults to None.
+        field_value_weighting: Optional[FieldValueWeighting], optional
+            Weighting settings for specific field values in the search.
+            Defaults to None.
+        facets: Optional[List[Facet]], optional
+            Array of objects defining specific attributes of the data.
+            Defaults to None.
+        vantage_api_key : Optional[str], optional
+            The Vantage API key used for authentication.
+            If not provided, the instance's API key is used.
+            Defaults to None.
+        account_id : Optional[str], optional
+            The account ID associated with the search.
+            If not provided, the instance's account ID is used.
+            Defaults to None.
+
+        Returns
+        -------
+        ApproximateResultsCountResult
+            An object containing the total count of documents that
+            match total_counts threshold range.
+
+        Notes
+        -----
+        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
+        """
+
+        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+
+        query = self._semantic_search_query(
+            text=text,
+            accuracy=accuracy,
+            pagination=pagination,
+            filter=filter,
+            sort=sort,
+            field_value_weighting=field_value_weighting,
+            facets=facets,
+            total_counts=total_counts,
+        )
+
+        result = self._call_search_api(
+            operation="approximate_results_count_search",
+            collection_id=collection_id,
+            account_id=account_id or self.account_id,
+            vantage_api_key=vantage_api_key,
+            use_cache=True,
+            semantic_search_query=query,
+        )
+
+        return TotalCountResult.model_validate(result.model_dump())
+
+    # endregion
+
+    # region Search - Iterators
+
+    def iter_semantic_search(
+        self,
+        text: str,
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        min_score: Optional[float] = None,
+        vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> Iterator[SearchResultItem]:
+        """
+        Iterates over results of a semantic search, page by page.
+
+        While the items of one page are being consumed, the next page is
+        fetched in the background, so at most two pages are held in memory.
+        The iteration stops on an empty page, on a page smaller than
+        requested page size, or on the first item scored below `min_score`.
+
+        Parameters
+        ----------
+        text : str
+            The text query for the semantic search.
+        collection_id : str
+            The ID of the collection to search within.
+        accuracy : Optional[float], optional
+            The accuracy threshold for the search.
+            Defaults to None.
+        pagination: Optional[Pagination], optional
+            The page to start from (defaults to 0), the page size
+            and the threshold used for every page.
+            Defaults to None.
+        filter: Optional[Filter], optional
+            Filter settings to narrow down the search results.
+            Defaults to None.
+        sort: Optional[Sort], optional
+            Sorting settings for the search results.
+            Defaults to None.
+        field_value_weighting: Optional[FieldValueWeighting], optional
+            Weighting settings for specific field values in the search.
+            Defaults to None.
+        facets: Optional[List[Facet]], optional
+            Array of objects defining specific attributes of the data,
+            sent with the request for every page. Facet counts are not
+            yielded by the iterator, which yields only result items.
+            Defaults to None.
+        min_score: Optional[float], optional
+            Score floor; the iteration stops on the first item with
+            a lower score. Assumes results are sorted by score.
+            Defaults to None.
+        vantage_api_key : Optional[str], optional
+            The Vantage API key used for authentication.
+            If not provided, the instance's API key is used.
+            Defaults to None.
+        account_id : Optional[str], optional
+            The account ID associated with the search.
+            If not provided, the instance's account ID is used.
+            Defaults to None.
+
+        Returns
+        -------
+        Iterator[SearchResultItem]
+            Iterator over the search result items.
+        """
+
+        def search(page: Pagination) -> SearchResult:
+            return self.semantic_search(
+                text=text,
+                collection_id=collection_id,
+                accuracy=accuracy,
+                pagination=page,
+                filter=filter,
+                sort=sort,
+                field_value_weighting=field_value_weighting,
+                facets=facets,
+                vantage_api_key=vantage_api_key,
+                account_id=account_id,
+            )
+
+        return self._iter_search_results(search, pagination, min_score)
+
+    def iter_embedding_search(
+        self,
+        embedding: List[float],
+        collection_id: str,
+        accuracy: Optional[float] = None,
+        pagination: Optional[Pagination] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[Sort] = None,
+        field_value_weighting: Optional[FieldValueWeighting] = None,
+        facets: Optional[List[Facet]] = None,
+        min_score: Optional[float] = None,
+        vantage_api_key: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> Iterator[SearchResultItem]:
         """
-        Performs a search within a specified collection using a text query and
-        optional additional parameters.
+        Iterates over results of an embedding search, page by page.
 
-        Check [Search Options](https://docs.vantagediscovery.com/docs/search-options) and
-        [Approximate Results Count Search](https://docs.vantagediscovery.com/docs/search-approximate-results-count)
-        documentation pages for more details.
+        Pages are fetched and the iteration stops the same way as
+        in `iter_semantic_search`.
 
         Parameters
         ----------
-        text : str
-            The text query for the semantic search.
+        embedding : List[float]
+            The embedding used for the search.
         collection_id : str
             The ID of the collection to search within.
-        total_counts: TotalCountsOptions
-            Similarity score range used to calculate the total
-            number of documents that match it.
         accuracy : Optional[float], optional
             The accuracy threshold for the search.
             Defaults to None.
         pagination: Optional[Pagination], optional
-            Pagination settings for the search results.
+            The page to start from (defaults to 0), the page size
+            and the threshold used for every page.
             Defaults to None.
         filter: Optional[Filter], optional
             Filter settings to narrow down the search results.
@@ -2206,7 +3069,13 @@ class VantageClient:
             Weighting settings for specific field values in the search.
             Defaults to None.
         facets: Optional[List[Facet]], optional
-            Array of objects defining specific attributes of the data.
+            Array of objects defining specific attributes of the data,
+            sent with the request for every page. Facet counts are not
+            yielded by the iterator, which yields only result items.
+            Defaults to None.
+        min_score: Optional[float], optional
+            Score floor; the iteration stops on the first item with
+            a lower score. Assumes results are sorted by score.
             Defaults to None.
         vantage_api_key : Optional[str], optional
             The Vantage API key used for authentication.
@@ -2219,45 +3088,83 @@ class VantageClient:
 
         Returns
         -------
-        ApproximateResultsCountResult
-            An object containing the total count of documents that
-            match total_counts threshold range.
+        Iterator[SearchResultItem]
+            Iterator over the search result items.
+        """
 
-        Notes
-        -----
-        Visit our [documentation](https://docs.vantagediscovery.com/docs/search-api) for more details and examples.
+        def search(page: Pagination) -> SearchResult:
+            return self.embedding_search(
+                embedding=embedding,
+                collection_id=collection_id,
+                accuracy=accuracy,
+                pagination=page,
+                filter=filter,
+                sort=sort,
+                field_value_weighting=field_value_weighting,
+                facets=facets,
+                vantage_api_key=vantage_api_key,
+                account_id=account_id,
+            )
+
+        return self._iter_search_results(search, pagination, min_score)
+
+    # endregion
+
+    # region Search - Batch
+
+    def batch_search(
+        self,
+        queries: List[SearchRequest],
+        max_concurrency: int = 8,
+    ) -> List[BatchSearchResult]:
         """
+        Performs multiple searches concurrently, using a bounded number
+        of requests in flight at the same time.
 
-        vantage_api_key = self._vantage_api_key_check(vantage_api_key)
+        Each query is executed the same way as the search method
+        matching its type, e.g. `SemanticSearchRequest` is executed
+        the same way as `semantic_search`.
 
-        search_properties = self._prepare_search_query(
-            accuracy=accuracy,
-            pagination=pagination,
-            filter=filter,
-            sort=sort,
-            field_value_weighting=field_value_weighting,
-            facets=facets,
-        )
+        Parameters
+        ----------
+        queries : List[SearchRequest]
+            Search requests to execute. Supported request types are
+            SemanticSearchRequest, EmbeddingSearchRequest,
+            MoreLikeThisSearchRequest and VantageVibeSearchRequest.
+        max_concurrency : int, optional
+            Maximum number of search requests in flight at the same time.
+            Defaults to 8.
 
-        query = SemanticSearchQuery(
-            text=text,
-            collection=search_properties.collection,
-            filter=search_properties.filter,
-            pagination=search_properties.pagination,
-            sort=search_properties.sort,
-            field_value_weighting=search_properties.field_value_weighting,
-            facets=search_properties.facets,
-            total_counts=total_counts.model_dump(),
-        )
+        Returns
+        -------
+        List[BatchSearchResult]
+            Outcomes of the searches, in the same order as `queries`.
+            If a search fails, the exception it raised is captured in
+            its outcome, instead of being raised.
 
-        result = self.search_api.api.approximate_results_count_search(
-            collection_id=collection_id,
-            account_id=account_id or self.account_id,
-            semantic_search_query=query,
-            _headers={"authorization": f"Bearer {vantage_api_key}"},
-        )
+        Notes
+        -----
+        All searches share the connection pool of the client, which keeps
+        up to `connection_pool_maxsize` connections (5 per CPU by default).
+        Using a higher `max_concurrency` will not reuse the extra connections.
+        """
+        if max_concurrency < 1:
+            raise VantageValueError("max_concurrency must be at least 1.")
 
-        return TotalCountResult.model_validate(result.model_dump())
+        if not queries:
+            return []
+
+        def search(query: SearchRequest) -> BatchSearchResult:
+            try:
+                method = self._search_request_method(query)
+                return BatchSearchResult(result=method(**dict(query)))
+            except Exception as exception:
+                return BatchSearchResult(error=exception)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(queries))
+        ) as executor:
+            return list(executor.map(search, queries))
 
     # endregion
 
@@ -2267,7 +3174,9 @@ class VantageClient:
         self,
         collection: Collection,
         document: Union[
-            UserProvidedEmbeddingsDocument, VantageManagedEmbeddingsDocument
+            UserProvidedEmbeddingsDocument,
+            VantageManagedEmbeddingsDocument,
+            DocumentBatch,
         ],
     ) -> None:
         """
@@ -2280,8 +3189,17 @@ class VantageClient:
             expects user-provided embeddings or Vantage-managed embeddings.
         document : Union[UserProvidedEmbeddingsDocument, VantageManagedEmbeddingsDocument]
             The document to be checked for compatibility with the collection. This must be an instance of either
-            UserProvidedEmbeddingsDocument or VantageManagedEmbeddingsDocument.
+            UserProvidedEmbeddingsDocument or VantageManagedEmbeddingsDocument, or a DocumentBatch.
         """
+        if isinstance(document, DocumentBatch):
+            if bool(collection.user_provided_embeddings) != (
+                document.user_provided_embeddings
+            ):
+                raise ValueError(
+                    "Document batch must contain embeddings if and only if the collection uses user-provided embeddings."  # noqa: E501
+                )
+            return
+
         if collection.user_provided_embeddings and isinstance(
             document, VantageManagedEmbeddingsDocument
         ):
@@ -2295,41 +3213,466 @@ class VantageClient:
                 f"Embeddings are not required for Vantage-managed embeddings collection. Please provide a list of {VantageManagedEmbeddingsDocument.__name__} objects."  # noqa: E501
             )
 
-    def _upload_documents_using_direct_upload_url(
+    @property
+    def _direct_upload_session(self) -> requests.Session:
+        if self._upload_session is None:
+            self._upload_session = requests.Session()
+
+        return self._upload_session
+
+    def _upload_documents_using_direct_upload_url(
+        self,
+        direct_upload_url: str,
+        upload_content: Union[bytes, ChecksumReader],
+    ) -> int:
+        """
+        Uploads content to a specified collection using a direct upload URL.
+
+        Parameters
+        ----------
+        direct_upload_url : str
+            The URL to which the content should be uploaded. This URL should be pre-configured to
+            accept uploads for a specific collection.
+        upload_content : Union[bytes, ChecksumReader]
+            The content to be uploaded. Content wrapped in ChecksumReader
+            is streamed from the underlying file.
+
+        Returns
+        -------
+        int
+            The HTTP status code returned by the server after attempting the upload.
+        """
+        response = self._direct_upload_session.put(
+            direct_upload_url,
+            data=upload_content,
+        )
+
+        if response.status_code != 200:
+            raise VantageFileUploadError(response.reason, response.status_code)
+
+        if isinstance(upload_content, ChecksumReader):
+            checksum = upload_content.hexdigest()
+        else:
+            checksum = hashlib.md5(
+                upload_content, usedforsecurity=False
+            ).hexdigest()
+
+        # Storage returns the MD5 checksum of the uploaded object as ETag,
+        # unless it was encrypted or uploaded in multiple parts.
+        etag = response.headers.get("ETag", "").strip('"')
+        if _MD5_ETAG_PATTERN.fullmatch(etag) and etag != checksum:
+            raise VantageFileUploadError(
+                "Checksum of uploaded content does not match.",
+                response.status_code,
+            )
+
+        return response.status_code
+
+    def _upload_documents_from_file(
+        self,
+        collection_id: str,
+        file_path: str,
+        batch_identifier: Optional[str],
+        account_id: Optional[str] = None,
+    ) -> int:
+        file_size = Path(file_path).stat().st_size
+
+        with open(file_path, "rb") as file:
+            return self._upload_documents_from_bytes(
+                collection_id=collection_id,
+                content=ChecksumReader(file, file_size),
+                file_size=file_size,
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+            )
+
+    def _upload_documents_from_compressed_file(
+        self,
+        collection_id: str,
+        file_path: str,
+        batch_identifier: Optional[str],
+        account_id: Optional[str] = None,
+    ) -> int:
+        # Storage requires the size of uploaded content in advance,
+        # so the file is decompressed twice instead of storing it.
+        file_size = decompressed_size(file_path)
+
+        with open_jsonl(file_path) as file:
+            return self._upload_documents_from_bytes(
+                collection_id=collection_id,
+                content=ChecksumReader(file, file_size),
+                file_size=file_size,
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+            )
+
+    def _direct_upload_batch_identifier(
+        self,
+        batch_identifier: Optional[str],
+    ) -> str:
+        if batch_identifier is None:
+            return f"{uuid.uuid4().hex}.parquet"
+
+        if not (
+            batch_identifier.endswith(".parquet")
+            or batch_identifier.endswith(".jsonl")
+        ):
+            # Add ".parquet" extension to batch identifier,
+            # so the document ingestion step won't ignore it.
+            return f"{batch_identifier}.parquet"
+
+        return batch_identifier
+
+    def _peek_documents(
+        self,
+        documents: Union[
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
+        ],
+    ) -> Tuple[
+        Union[
+            VantageManagedEmbeddingsDocument,
+            UserProvidedEmbeddingsDocument,
+            DocumentBatch,
+        ],
+        Union[
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
+        ],
+    ]:
+        """
+        Returns the first document, used to check compatibility with
+        the collection, together with documents which can still be
+        iterated from the start.
+        """
+        if isinstance(documents, DocumentBatch):
+            return documents, documents
+
+        iterator = iter(documents)
+        first_document = next(iterator, None)
+
+        if first_document is None:
+            raise ValueError("Documents object can't be empty.")
+
+        return first_document, chain([first_document], iterator)
+
+    def _document_lines(
+        self,
+        documents: Union[
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
+        ],
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Serializes documents, returning pairs of document id
+        and JSON line without line terminator.
+        """
+        if isinstance(documents, DocumentBatch):
+            return zip(
+                documents.ids.to_pylist(),
+                documents.to_jsonl().split("\n"),
+            )
+
+        return (
+            (vantage_dict["id"], json.dumps(vantage_dict))
+            for vantage_dict in (
+                document.to_vantage_dict() for document in documents
+            )
+        )
+
+    def _document_batches(
+        self,
+        documents: Union[
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
+        ],
+    ) -> Iterator[str]:
+        lines = (f"{line}\n" for _, line in self._document_lines(documents))
+
+        return self._line_batches(lines)
+
+    def _upsert_changed_documents(
+        self,
+        collection_id: str,
+        documents: Union[
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
+        ],
+        account_id: str,
+        manifest: DocumentManifest,
+        delete_missing: bool,
+        partial_updates: bool,
+    ) -> None:
+        manifest.start(f"{account_id}/{collection_id}")
+
+        changed_lines = self._changed_document_lines(
+            documents=documents,
+            manifest=manifest,
+            partial_updates=partial_updates,
+        )
+
+        try:
+            self._upload_jsonl_batches(
+                collection_id=collection_id,
+                batches=self._line_batches(changed_lines),
+                batch_identifier=None,
+                account_id=account_id,
+                max_workers=1,
+            )
+
+            if delete_missing:
+                self._upload_jsonl_batches(
+                    collection_id=collection_id,
+                    batches=self._delete_document_batches(
+                        manifest.missing_ids()
+                    ),
+                    batch_identifier=None,
+                    account_id=account_id,
+                    max_workers=1,
+                )
+        except BaseException:
+            manifest.rollback()
+            raise
+
+        manifest.commit(remove_missing=delete_missing)
+
+    def _changed_document_lines(
+        self,
+        documents: Union[
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
+        ],
+        manifest: DocumentManifest,
+        partial_updates: bool,
+    ) -> Iterator[str]:
+        """
+        Returns JSON lines of documents which are new or changed according
+        to the manifest. With `partial_updates`, documents of which only
+        metadata changed are replaced by "update" operations.
+        """
+        for id, line in self._document_lines(documents):
+            if not manifest.observe(id, line):
+                continue
+
+            previous = (
+                manifest.previous_version(id) if partial_updates else None
+            )
+            update = (
+                metadata_update(previous, line)
+                if previous is not None
+                else None
+            )
+
+            if update is None:
+                yield f"{line}\n"
+            elif len(update) > 2:
+                # Otherwise, the document differs from the previous
+                # version only in serialization.
+                yield f"{json.dumps(update)}\n"
+
+    def _delete_document_batches(
+        self,
+        document_ids: Iterable[str],
+    ) -> Iterator[str]:
+        lines = (
+            f"{json.dumps({'id': id, 'operation': 'delete'})}\n"
+            for id in document_ids
+        )
+
+        return self._line_batches(lines)
+
+    def _line_batches(self, lines: Iterable[str]) -> Iterator[str]:
+        return batch_lines(
+            lines=lines,
+            batch_size=_DOCUMENTS_UPLOAD_BATCH_SIZE,
+            max_batch_bytes=_DOCUMENTS_UPLOAD_BATCH_MAX_BYTES,
+            encoding=self._default_encoding,
+        )
+
+    def _jsonl_batches(
+        self,
+        documents_jsonl: str,
+        compact: bool = False,
+    ) -> List[str]:
+        if compact:
+            lines = jsonl_lines(documents_jsonl)
+            return list(self._line_batches(compact_operations(lines)))
+
+        lines_count = count_lines(documents_jsonl)
+
+        if lines_count <= _DOCUMENTS_UPLOAD_BATCH_SIZE and (
+            len(documents_jsonl.encode(self._default_encoding))
+            <= _DOCUMENTS_UPLOAD_BATCH_MAX_BYTES
+        ):
+            return [documents_jsonl]
+
+        splitter = TextSplitter(
+            text=documents_jsonl,
+            batch_size=_DOCUMENTS_UPLOAD_BATCH_SIZE,
+            max_batch_bytes=_DOCUMENTS_UPLOAD_BATCH_MAX_BYTES,
+        )
+
+        return splitter.batch()
+
+    def _upload_jsonl_batch(
+        self,
+        collection_id: str,
+        batch: str,
+        batch_identifier: Optional[str],
+        account_id: Optional[str],
+    ) -> None:
+        self.management_api.documents_api.upload_documents(
+            body=batch,
+            account_id=account_id if account_id else self.account_id,
+            collection_id=collection_id,
+            customer_batch_identifier=batch_identifier,
+        )
+
+    def _upload_jsonl_batches(
+        self,
+        collection_id: str,
+        batches: Iterable[str],
+        batch_identifier: Optional[str],
+        account_id: Optional[str],
+        max_workers: int,
+    ) -> None:
+        def upload(batch: str) -> None:
+            self._upload_jsonl_batch(
+                collection_id=collection_id,
+                batch=batch,
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+            )
+
+        try:
+            upload_batches(
+                batches=batches,
+                upload=upload,
+                max_workers=max_workers,
+            )
+        finally:
+            self._invalidate_search_cache(collection_id, account_id)
+
+    def _upload_jsonl_file_resumable(
+        self,
+        collection_id: str,
+        jsonl_file_path: str,
+        batch_identifier: Optional[str],
+        account_id: Optional[str],
+        max_workers: int,
+    ) -> None:
+        journal = CheckpointJournal(jsonl_file_path)
+
+        def upload(batch: Tuple[int, int, int, str]) -> None:
+            batch_index, start, end, documents_jsonl = batch
+            self._upload_jsonl_batch(
+                collection_id=collection_id,
+                batch=documents_jsonl,
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+            )
+            journal.acknowledge(batch_index, start, end)
+
+        with journal, BatchTextFileReader(
+            file_path=jsonl_file_path,
+            batch_size=_DOCUMENTS_UPLOAD_BATCH_SIZE,
+            max_batch_bytes=_DOCUMENTS_UPLOAD_BATCH_MAX_BYTES,
+            encoding=self._default_encoding,
+            start_offset=journal.resume_offset,
+        ) as reader:
+            batches = (
+                (batch_index, start, end, documents_jsonl)
+                for batch_index, (start, end, documents_jsonl) in enumerate(
+                    reader.iter_with_offsets(),
+                    start=journal.resume_batch_index,
+                )
+                if not journal.is_acknowledged(start, end)
+            )
+
+            try:
+                upload_batches(
+                    batches=batches,
+                    upload=upload,
+                    max_workers=max_workers,
+                )
+            finally:
+                self._invalidate_search_cache(collection_id, account_id)
+
+        journal.complete()
+
+    def _upload_part_with_retries(
         self,
-        direct_upload_url: str,
-        upload_content,
+        collection_id: str,
+        content: bytes,
+        batch_identifier: str,
+        account_id: Optional[str],
+        max_retries: int,
     ) -> int:
-        """
-        Uploads content to a specified collection using a direct upload URL.
+        for attempt in range(max_retries + 1):
+            try:
+                return self._upload_documents_from_bytes(
+                    collection_id=collection_id,
+                    content=content,
+                    file_size=len(content),
+                    batch_identifier=batch_identifier,
+                    account_id=account_id,
+                )
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                VantageFileUploadError,
+            ) as error:
+                if attempt == max_retries or not _is_retryable_upload_error(
+                    error
+                ):
+                    raise
+
+            time.sleep(_UPLOAD_PART_RETRY_BACKOFF_SECONDS * 2**attempt)
+
+    def _upload_parquet_parts(
+        self,
+        collection_id: str,
+        parts: Iterable[bytes],
+        batch_identifier: str,
+        account_id: Optional[str],
+        max_workers: int,
+        max_retries: int,
+    ) -> int:
+        stem = batch_identifier.removesuffix(".parquet")
+        statuses: List[int] = []
 
-        Parameters
-        ----------
-        direct_upload_url : str
-            The URL to which the content should be uploaded. This URL should be pre-configured to
-            accept uploads for a specific collection.
-        upload_content
-            The content to be uploaded.
+        def upload(part: Tuple[int, bytes]) -> None:
+            index, content = part
+            statuses.append(
+                self._upload_part_with_retries(
+                    collection_id=collection_id,
+                    content=content,
+                    batch_identifier=f"{stem}-part-{index:05d}.parquet",
+                    account_id=account_id,
+                    max_retries=max_retries,
+                )
+            )
 
-        Returns
-        -------
-        int
-            The HTTP status code returned by the server after attempting the upload.
-        """
-        response = requests.put(
-            direct_upload_url,
-            data=upload_content,
+        upload_batches(
+            batches=enumerate(parts),
+            upload=upload,
+            max_workers=max_workers,
         )
 
-        if response.status_code != 200:
-            raise VantageFileUploadError(response.reason, response.status_code)
-
-        return response.status_code
+        # Failed parts raise, so the worst status of accepted parts
+        # is returned, as for a file uploaded in one part.
+        return max(statuses)
 
     def _upload_documents_from_bytes(
         self,
         collection_id: str,
-        content: bytes,
+        content: Union[bytes, ChecksumReader],
         file_size: int,
         batch_identifier: Optional[str],
         account_id: Optional[str] = None,
@@ -2341,8 +3684,9 @@ class VantageClient:
         ----------
         collection_id : str
             The identifier of the collection to which the documents are being upserted.
-        content : bytes
-            The binary content (documents in bytes) to be uploaded.
+        content : Union[bytes, ChecksumReader]
+            The binary content (documents in bytes) to be uploaded,
+            or a file wrapped in ChecksumReader to stream it from.
         file_size : int
             The size of the content to be uploaded, in bytes.
         batch_identifier : Optional[str], optional
@@ -2358,15 +3702,9 @@ class VantageClient:
             The HTTP status code returned by the server after attempting the upload.
         """
 
-        if batch_identifier is None:
-            batch_identifier = f"{uuid.uuid4}.parquet"
-        elif not (
-            batch_identifier.endswith(".parquet")
-            or batch_identifier.endswith(".jsonl")
-        ):
-            # Add ".parquet" extension to batch identifier,
-            # so the document ingestion step won't ignore it.
-            batch_identifier = f"{batch_identifier}.parquet"
+        batch_identifier = self._direct_upload_batch_identifier(
+            batch_identifier
+        )
 
         direct_upload_url = self._get_direct_upload_url(
             collection_id=collection_id,
@@ -2375,10 +3713,13 @@ class VantageClient:
             account_id=account_id,
         )
 
-        return self._upload_documents_using_direct_upload_url(
-            direct_upload_url=direct_upload_url.upload_url,
-            upload_content=content,
-        )
+        try:
+            return self._upload_documents_using_direct_upload_url(
+                direct_upload_url=direct_upload_url.upload_url,
+                upload_content=content,
+            )
+        finally:
+            self._invalidate_search_cache(collection_id, account_id)
 
     # endregion
 
@@ -2388,10 +3729,14 @@ class VantageClient:
         self,
         collection_id: str,
         documents: Union[
-            List[VantageManagedEmbeddingsDocument],
-            List[UserProvidedEmbeddingsDocument],
+            Iterable[VantageManagedEmbeddingsDocument],
+            Iterable[UserProvidedEmbeddingsDocument],
+            DocumentBatch,
         ],
         account_id: Optional[str] = None,
+        manifest: Optional[DocumentManifest] = None,
+        delete_missing: bool = False,
+        partial_updates: bool = False,
     ):
         """
         Upserts documents to a specified collection from a list of Vantage
@@ -2403,44 +3748,76 @@ class VantageClient:
         ----------
         collection_id : str
             The unique identifier for the collection to which the documents will be upserted.
-        documents : Union[List[VantageManagedEmbeddingsDocument], List[UserProvidedEmbeddingsDocument]]
-            A list of documents to upsert. This list should contain only one type of document,
-            either VantageManagedEmbeddingsDocument or UserProvidedEmbeddingsDocument,
-            depending on the collection's type.
+        documents : Union[Iterable[VantageManagedEmbeddingsDocument], Iterable[UserProvidedEmbeddingsDocument], DocumentBatch]
+            A list, or any other iterable such as a generator, of documents to upsert.
+            It should contain only one type of document, either VantageManagedEmbeddingsDocument
+            or UserProvidedEmbeddingsDocument, depending on the collection's type.
+            Documents are serialized and uploaded in batches while being iterated,
+            so they don't need to fit into memory at once. Large numbers of documents
+            can also be provided more efficiently as a DocumentBatch.
         account_id : Optional[str], optional
             The account ID to which the collection belongs.
             If not provided, the instance's account ID is used.
             Defaults to None.
-
+        manifest : Optional[DocumentManifest], optional
+            If provided, only documents which are new or changed since
+            they were last upserted using the same manifest are sent.
+            Defaults to None.
+        delete_missing : bool, optional
+            If True, documents recorded in `manifest` which are not among
+            `documents` are deleted from the collection, so that the
+            collection matches `documents`. Requires `manifest`.
+            Defaults to False.
+        partial_updates : bool, optional
+            If True, documents of which only metadata fields changed since
+            they were last upserted are sent as "update" operations
+            containing just the changed fields, instead of full documents.
+            Requires `manifest` created with `keep_documents` set.
+            Defaults to False.
 
         Notes
         -----
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
-        if not documents:
-            raise ValueError("Documents object can't be empty.")
+        if delete_missing and manifest is None:
+            raise ValueError("Deleting missing documents requires a manifest.")
+
+        if partial_updates and (
+            manifest is None or not manifest.keep_documents
+        ):
+            raise ValueError(
+                "Partial updates require a manifest which keeps documents."
+            )
+
+        first_document, documents = self._peek_documents(documents)
 
-        collection = self.get_collection(
+        collection = self._collection_metadata(
             collection_id=collection_id,
-            account_id=account_id or self.account_id,
+            account_id=account_id,
         )
 
         self._document_to_collection_compatibility_check(
             collection=collection,
-            document=documents[0],
+            document=first_document,
         )
 
-        vantage_documents_jsonl = "\n".join(
-            map(
-                json.dumps,
-                [document.to_vantage_dict() for document in documents],
+        if manifest is not None:
+            self._upsert_changed_documents(
+                collection_id=collection_id,
+                documents=documents,
+                account_id=account_id or self.account_id,
+                manifest=manifest,
+                delete_missing=delete_missing,
+                partial_updates=partial_updates,
             )
-        )
+            return
 
-        self.upsert_documents_from_jsonl_string(
+        self._upload_jsonl_batches(
             collection_id=collection_id,
-            documents_jsonl=vantage_documents_jsonl,
+            batches=self._document_batches(documents),
+            batch_identifier=None,
             account_id=account_id or self.account_id,
+            max_workers=1,
         )
 
     def upsert_documents_from_jsonl_string(
@@ -2449,6 +3826,8 @@ class VantageClient:
         documents_jsonl: str,
         batch_identifier: Optional[str] = None,
         account_id: Optional[str] = None,
+        max_workers: int = 1,
+        compact: bool = False,
     ) -> None:
         """
         Upserts documents to a specified collection from a string containing JSONL-formatted documents.
@@ -2467,39 +3846,32 @@ class VantageClient:
             The account ID to which the collection belongs.
             If not provided, the instance's account ID is used.
             Defaults to None.
+        max_workers : int, optional
+            Number of batches of documents uploaded at the same time.
+            Batches may be upserted in a different order than they
+            appear in the input when greater than 1.
+            Defaults to 1.
+        compact : bool, optional
+            If True, operations on the same document ID are collapsed
+            before upload, so that only the result of applying them in
+            order is sent. A later add or delete replaces earlier
+            operations, and updates are merged into a preceding add or
+            update. Useful when the string contains many successive
+            changes of the same documents.
+            Defaults to False.
 
         Notes
         -----
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
-        lines_count = count_lines(documents_jsonl)
-
-        if lines_count <= _DOCUMENTS_UPLOAD_BATCH_SIZE:
-            self.management_api.documents_api.upload_documents(
-                body=documents_jsonl,
-                account_id=account_id if account_id else self.account_id,
-                collection_id=collection_id,
-                customer_batch_identifier=batch_identifier,
-            )
-            return
-
-        splitter = TextSplitter(
-            text=documents_jsonl,
-            batch_size=_DOCUMENTS_UPLOAD_BATCH_SIZE,
+        self._upload_jsonl_batches(
+            collection_id=collection_id,
+            batches=self._jsonl_batches(documents_jsonl, compact=compact),
+            batch_identifier=batch_identifier,
+            account_id=account_id,
+            max_workers=max_workers,
         )
-        for batch in splitter.batch():
-            batch.strip()
-
-            if str.isspace(batch):
-                continue
-
-            self.management_api.documents_api.upload_documents(
-                body=batch,
-                account_id=account_id if account_id else self.account_id,
-                collection_id=collection_id,
-                customer_batch_identifier=batch_identifier,
-            )
 
     def upsert_documents_from_jsonl_file(
         self,
@@ -2507,6 +3879,8 @@ class VantageClient:
         jsonl_file_path: str,
         batch_identifier: Optional[str] = None,
         account_id: Optional[str] = None,
+        max_workers: int = 1,
+        resumable: bool = False,
     ) -> None:
         """
         Upserts documents to a specified collection from a JSONL file located at a given file path.
@@ -2520,37 +3894,124 @@ class VantageClient:
             The unique identifier of the collection to which the documents will be uploaded.
         file_path : str
             The path to the JSONL file containing the documents to be uploaded.
+            The file may be gzip or Zstandard compressed, or a tar archive
+            of JSONL files, which is decompressed while being read.
         batch_identifier : Optional[str], optional
             An optional identifier provided by the user to track the batch of document uploads.
         account_id : Optional[str], optional
             The account ID to which the collection belongs.
             If not provided, the instance's account ID is used.
             Defaults to None.
+        max_workers : int, optional
+            Number of batches of documents uploaded at the same time.
+            Batches may be upserted in a different order than they
+            appear in the input when greater than 1.
+            Defaults to 1.
+        resumable : bool, optional
+            If True, uploaded batches are recorded in a checkpoint journal
+            stored next to the file, named after it with a ".checkpoint"
+            suffix. If the upload is interrupted, calling this method
+            again with `resumable` set uploads only the batches which
+            were not uploaded before. The journal is removed once the
+            whole file has been uploaded.
+            Defaults to False.
 
         Notes
         -----
+        Documents are read while previous batches are being uploaded,
+        but no more than twice `max_workers` batches are kept in memory
+        waiting for upload.
+
+        A checkpoint journal is discarded if the file has been modified
+        since the journal was written.
+
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
         if not exists(jsonl_file_path):
             raise FileNotFoundError(f"File \"{jsonl_file_path}\" not found.")
 
+        if resumable:
+            self._upload_jsonl_file_resumable(
+                collection_id=collection_id,
+                jsonl_file_path=jsonl_file_path,
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+                max_workers=max_workers,
+            )
+            return
+
         with BatchTextFileReader(
             file_path=jsonl_file_path,
             batch_size=_DOCUMENTS_UPLOAD_BATCH_SIZE,
+            max_batch_bytes=_DOCUMENTS_UPLOAD_BATCH_MAX_BYTES,
+            encoding=self._default_encoding,
         ) as reader:
-            while True:
-                batch = reader.next()
+            self._upload_jsonl_batches(
+                collection_id=collection_id,
+                batches=reader,
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+                max_workers=max_workers,
+            )
 
-                if not any(batch):
-                    return
+    def document_writer(
+        self,
+        account_id: Optional[str] = None,
+        max_batch_documents: int = _DOCUMENTS_UPLOAD_BATCH_SIZE,
+        max_batch_bytes: int = _DOCUMENTS_UPLOAD_BATCH_MAX_BYTES,
+        max_latency_seconds: float = _DOCUMENT_WRITER_MAX_LATENCY_SECONDS,
+    ) -> DocumentWriter:
+        """
+        Creates a writer which buffers upserts and deletes of individual
+        documents, and uploads them in batches from a background thread.
+        The writer can be used from multiple threads.
 
-                self.upsert_documents_from_jsonl_string(
-                    collection_id=collection_id,
-                    documents_jsonl=batch,
-                    batch_identifier=batch_identifier,
-                    account_id=account_id,
-                )
+        Parameters
+        ----------
+        account_id : Optional[str], optional
+            The account ID to which the collections belong.
+            If not provided, the instance's account ID is used.
+            Defaults to None.
+        max_batch_documents : int, optional
+            Number of documents buffered for a collection,
+            after which they are uploaded. Defaults to 500.
+        max_batch_bytes : int, optional
+            Size in bytes of documents buffered for a collection,
+            after which they are uploaded. Defaults to 4 MiB.
+        max_latency_seconds : float, optional
+            Longest time a document is buffered before it is uploaded.
+            Defaults to 1 second.
+
+        Returns
+        -------
+        DocumentWriter
+            The writer. It should be closed, or used as a context manager,
+            so that remaining buffered documents are uploaded.
+
+        Notes
+        -----
+        `DocumentWriter.upsert` and `DocumentWriter.delete` return
+        futures which complete once the document has been uploaded.
+        """
+        account_id = account_id or self.account_id
+
+        def upload(collection_id: str, batch: str) -> None:
+            self._upload_jsonl_batches(
+                collection_id=collection_id,
+                batches=[batch],
+                batch_identifier=None,
+                account_id=account_id,
+                max_workers=1,
+            )
+
+        return DocumentWriter(
+            upload=upload,
+            max_batch_documents=max_batch_documents,
+            max_batch_bytes=max_batch_bytes,
+            max_latency_seconds=max_latency_seconds,
+            encoding=self._default_encoding,
+        )
 
     # endregion
 
@@ -2559,7 +4020,7 @@ class VantageClient:
     def delete_documents(
         self,
         collection_id: str,
-        document_ids: List[str],
+        document_ids: Iterable[str],
         account_id: Optional[str] = None,
     ) -> None:
         """
@@ -2569,8 +4030,9 @@ class VantageClient:
         ----------
         collection_id : str
             The unique identifier of the collection from which documents are to be deleted.
-        document_ids : List[str]
-            A list of document IDs that need to be deleted from the collection.
+        document_ids : Iterable[str]
+            A list, or any other iterable such as a generator, of document IDs
+            that need to be deleted from the collection.
         account_id : Optional[str], optional
             The account identifier under which the collection exists.
             If not provided, the instance's account ID is used.
@@ -2581,21 +4043,12 @@ class VantageClient:
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
-        documents_to_delete = [
-            {"id": id, "operation": "delete"} for id in document_ids
-        ]
-
-        vantage_documents_jsonl = "\n".join(
-            map(
-                json.dumps,
-                [document for document in documents_to_delete],
-            )
-        )
-
-        self.upsert_documents_from_jsonl_string(
+        self._upload_jsonl_batches(
             collection_id=collection_id,
-            documents_jsonl=vantage_documents_jsonl,
+            batches=self._delete_document_batches(document_ids),
+            batch_identifier=None,
             account_id=account_id or self.account_id,
+            max_workers=1,
         )
 
     # endregion
@@ -2607,6 +4060,9 @@ class VantageClient:
         collection_id: str,
         parquet_file_path: str,
         account_id: Optional[str] = None,
+        max_part_bytes: Optional[int] = None,
+        max_workers: int = 1,
+        max_retries: int = _UPLOAD_PART_MAX_RETRIES,
     ) -> int:
         """
         Uploads documents from a parquet file to a collection.
@@ -2622,6 +4078,21 @@ class VantageClient:
             The account ID to which the collection belongs.
             If not provided, the instance's account ID is used.
             Defaults to None
+        max_part_bytes : Optional[int], optional
+            If provided, the file is split along its row groups into parts
+            of roughly this size, each uploaded as a separate batch.
+            Row groups larger than this size are split by rows.
+            If not provided, the file is uploaded as a whole.
+            Defaults to None.
+        max_workers : int, optional
+            Number of parts uploaded at the same time.
+            Used only if `max_part_bytes` is provided.
+            Defaults to 1.
+        max_retries : int, optional
+            How many times the upload of a part is retried after
+            a connection or server error.
+            Used only if `max_part_bytes` is provided.
+            Defaults to 3.
 
         Returns
         -------
@@ -2630,6 +4101,10 @@ class VantageClient:
 
         Notes
         -----
+        Parts are named after the file, with a "-part-<number>" suffix.
+        Each part is prepared in memory, so up to twice `max_workers`
+        parts of `max_part_bytes` size are kept in memory at a time.
+
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
 
@@ -2646,13 +4121,19 @@ class VantageClient:
         if not batch_identifier.endswith(".parquet"):
             batch_identifier = f"{batch_identifier}.parquet"
 
-        file_size = Path(parquet_file_path).stat().st_size
-        file = open(parquet_file_path, "rb")
-        file_content = file.read()
-        return self._upload_documents_from_bytes(
+        if max_part_bytes is not None:
+            return self._upload_parquet_parts(
+                collection_id=collection_id,
+                parts=split_parquet_file(parquet_file_path, max_part_bytes),
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+                max_workers=max_workers,
+                max_retries=max_retries,
+            )
+
+        return self._upload_documents_from_file(
             collection_id=collection_id,
-            content=file_content,
-            file_size=file_size,
+            file_path=parquet_file_path,
             batch_identifier=file_name,
             account_id=account_id,
         )
@@ -2664,7 +4145,7 @@ class VantageClient:
         account_id: Optional[str] = None,
     ) -> int:
         """
-        Uploads documents from a parquet file to a collection.
+        Uploads documents from a JSONL file to a collection.
 
         Parameters
         ----------
@@ -2672,7 +4153,9 @@ class VantageClient:
             The unique identifier of the collection
             embeddings are being uploaded to.
         jsonl_file_path : str
-            Path to the JSONL file in a filesystem.
+            Path to the JSONL file in a filesystem. The file may be gzip
+            or Zstandard compressed, or a tar archive of JSONL files,
+            which are uploaded as a single file.
         account_id : Optional[str], optional
             The account ID to which the collection belongs.
             If not provided, the instance's account ID is used.
@@ -2685,11 +4168,29 @@ class VantageClient:
 
         Notes
         -----
+        Compressed files are decompressed while being uploaded, without
+        storing decompressed data. They are read twice, as the size of
+        decompressed data has to be known before the upload starts.
+
         Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
         """
         if not exists(jsonl_file_path):
             raise FileNotFoundError(f"File \"{jsonl_file_path}\" not found.")
 
+        if detect_compression(jsonl_file_path) is not None:
+            file_name = strip_compression_suffix(
+                ntpath.basename(jsonl_file_path)
+            )
+            if not file_name.endswith(".jsonl"):
+                file_name = f"{file_name}.jsonl"
+
+            return self._upload_documents_from_compressed_file(
+                collection_id=collection_id,
+                file_path=jsonl_file_path,
+                batch_identifier=file_name,
+                account_id=account_id,
+            )
+
         file_name = ntpath.basename(jsonl_file_path)
         mime_type = magic.from_file(jsonl_file_path, mime=True)
         batch_identifier = file_name
@@ -2701,18 +4202,152 @@ class VantageClient:
         if not batch_identifier.endswith(".jsonl"):
             batch_identifier = f"{batch_identifier}.jsonl"
 
-        file_size = Path(jsonl_file_path).stat().st_size
-        file = open(jsonl_file_path, "rb")
-        file_content = file.read()
-
-        return self._upload_documents_from_bytes(
+        return self._upload_documents_from_file(
             collection_id=collection_id,
-            content=file_content,
-            file_size=file_size,
+            file_path=jsonl_file_path,
             batch_identifier=file_name,
             account_id=account_id,
         )
 
+    def upload_documents_from_arrow(
+        self,
+        collection_id: str,
+        data: Union[arrow.Table, arrow.RecordBatchReader, DocumentBatch],
+        batch_identifier: Optional[str] = None,
+        account_id: Optional[str] = None,
+        max_part_bytes: Optional[int] = None,
+        max_workers: int = 1,
+        max_retries: int = _UPLOAD_PART_MAX_RETRIES,
+    ) -> int:
+        """
+        Uploads documents from a pyarrow Table or RecordBatchReader
+        to a collection, without writing them to a file first.
+
+        The data is serialized into an in-memory parquet file, which is
+        uploaded the same way as `upload_documents_from_parquet_file`.
+        Columns must follow the same schema as a parquet file would.
+
+        Parameters
+        ----------
+        collection_id : str
+            The unique identifier of the collection
+            embeddings are being uploaded to.
+        data : Union[arrow.Table, arrow.RecordBatchReader, DocumentBatch]
+            Documents to upload, one per row. Record batches of
+            a RecordBatchReader are serialized as they are read.
+        batch_identifier : Optional[str], optional
+            An optional identifier provided by the user to track the batch
+            of document uploads. If not provided, a unique identifier
+            is generated.
+        account_id : Optional[str], optional
+            The account ID to which the collection belongs.
+            If not provided, the instance's account ID is used.
+            Defaults to None
+        max_part_bytes : Optional[int], optional
+            If provided, data is split into parquet files of roughly
+            this size, each uploaded as a separate batch.
+            If not provided, data is uploaded as a single batch.
+            Defaults to None.
+        max_workers : int, optional
+            Number of parts uploaded at the same time.
+            Defaults to 1.
+        max_retries : int, optional
+            How many times the upload of a part is retried after
+            a connection or server error.
+            Defaults to 3.
+
+        Returns
+        -------
+        int
+            HTTP status of upload execution.
+
+        Notes
+        -----
+        Visit our [documentation](https://docs.vantagediscovery.com/docs/management-api) for more details and examples.
+        """
+        batch_identifier = self._direct_upload_batch_identifier(
+            batch_identifier
+        )
+
+        if isinstance(data, DocumentBatch):
+            data = data.to_arrow()
+
+        if max_part_bytes is None:
+            (content,) = arrow_to_parquet_parts(data)
+
+            return self._upload_part_with_retries(
+                collection_id=collection_id,
+                content=content,
+                batch_identifier=batch_identifier,
+                account_id=account_id,
+                max_retries=max_retries,
+            )
+
+        return self._upload_parquet_parts(
+            collection_id=collection_id,
+            parts=arrow_to_parquet_parts(data, max_part_bytes),
+            batch_identifier=batch_identifier,
+            account_id=account_id,
+            max_workers=max_workers,
+            max_retries=max_retries,
+        )
+
+    def upload_documents_from_dataframe(
+        self,
+        collection_id: str,
+        dataframe: pandas.DataFrame,
+        batch_identifier: Optional[str] = None,
+        account_id: Optional[str] = None,
+        max_part_bytes: Optional[int] = None,
+        max_workers: int = 1,
+        max_retries: int = _UPLOAD_PART_MAX_RETRIES,
+    ) -> int:
+        """
+        Uploads documents from a pandas DataFrame to a collection,
+        without writing them to a file first.
+
+        The index of the DataFrame is not uploaded. See
+        `upload_documents_from_arrow` for description of parameters.
+
+        Parameters
+        ----------
+        collection_id : str
+            The unique identifier of the collection
+            embeddings are being uploaded to.
+        dataframe : pandas.DataFrame
+            Documents to upload, one per row.
+        batch_identifier : Optional[str], optional
+            An optional identifier provided by the user to track the batch
+            of document uploads.
+        account_id : Optional[str], optional
+            The account ID to which the collection belongs.
+            If not provided, the instance's account ID is used.
+            Defaults to None
+        max_part_bytes : Optional[int], optional
+            Approximate size of uploaded parquet files.
+            Defaults to None.
+        max_workers : int, optional
+            Number of parts uploaded at the same time.
+            Defaults to 1.
+        max_retries : int, optional
+            How many times the upload of a part is retried.
+            Defaults to 3.
+
+        Returns
+        -------
+        int
+            HTTP status of upload execution.
+        """
+        return self.upload_documents_from_arrow(
+            collection_id=collection_id,
+            data=arrow.Table.from_pandas(dataframe, preserve_index=False),
+            batch_identifier=batch_identifier,
+            account_id=account_id,
+            max_part_bytes=max_part_bytes,
+            max_workers=max_workers,
+            max_retries=max_retries,
+        )
+
     # endregion
 
     # region Documents - Validate File
@@ -2723,6 +4358,9 @@ class VantageClient:
         collection_type: CollectionType,
         model: Optional[str] = None,
         embeddings_dimension: Optional[int] = None,
+        max_workers: int = 1,
+        max_id_memory_bytes: int = _VALIDATION_ID_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
     ) -> list[ValidationError]:
         """
         Validates documents from a JSONL file.
@@ -2730,13 +4368,24 @@ class VantageClient:
         Parameters
         ----------
         file_path : str
-            Path of the JSONL file in the filesystem.
+            Path of the JSONL file in the filesystem. The file may be
+            gzip or Zstandard compressed, or a tar archive of JSONL files.
         collection_type : CollectionType
             For what kind of collection are documents from this file intended.
         model : Optional[str] = None
             Which model should be used to generate embeddings (if any).
         embeddings_dimension : Optional[int] = None
             Dimension of embeddings (if provided in file).
+        max_workers : int = 1
+            Number of processes validating parts of the file in parallel.
+            Errors, including duplicate IDs across parts, and their line
+            numbers are the same as when validating in a single process.
+            Compressed files are always validated in a single process.
+        max_id_memory_bytes : int = 256 MiB
+            Approximate memory used to detect duplicate IDs. IDs which
+            don't fit are stored in a temporary file on disk.
+        max_errors : Optional[int] = None
+            Validation stops once this many errors are found.
 
         Raises
         ------
@@ -2753,6 +4402,9 @@ class VantageClient:
             collection_type=collection_type,
             model=model,
             embeddings_dimension=embeddings_dimension,
+            max_workers=max_workers,
+            max_id_memory_bytes=max_id_memory_bytes,
+            max_errors=max_errors,
         )
 
     def validate_documents_from_parquet(
@@ -2761,6 +4413,8 @@ class VantageClient:
         collection_type: CollectionType,
         model: Optional[str] = None,
         embeddings_dimension: Optional[int] = None,
+        max_id_memory_bytes: int = _VALIDATION_ID_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
     ) -> list[ValidationError]:
         """
         Validates documents from a Parquet file.
@@ -2775,6 +4429,11 @@ class VantageClient:
             Which model should be used to generate embeddings (if any).
         embeddings_dimension : Optional[int] = None
             Dimension of embeddings (if provided in file).
+        max_id_memory_bytes : int = 256 MiB
+            Approximate memory used to detect duplicate IDs. IDs which
+            don't fit are stored in a temporary file on disk.
+        max_errors : Optional[int] = None
+            Validation stops once this many errors are found.
 
         Raises
         ------
@@ -2791,6 +4450,104 @@ class VantageClient:
             collection_type=collection_type,
             model=model,
             embeddings_dimension=embeddings_dimension,
+            max_id_memory_bytes=max_id_memory_bytes,
+            max_errors=max_errors,
+        )
+
+    def iter_validate_documents_from_jsonl(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str] = None,
+        embeddings_dimension: Optional[int] = None,
+        max_workers: int = 1,
+        max_id_memory_bytes: int = _VALIDATION_ID_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[ValidationError]:
+        """
+        Validates documents from a JSONL file, yielding errors as they
+        are found instead of collecting them in a list.
+
+        Errors are the same, and in the same order, as those returned by
+        `validate_documents_from_jsonl`. Validation stops once the
+        iterator is closed, or once `max_errors` errors were yielded.
+        See `validate_documents_from_jsonl` for description of parameters.
+
+        Returns
+        -------
+        Iterator[ValidationError]
+            Iterator over encountered errors.
+        """
+
+        return validator.iter_validate_jsonl(
+            file_path=file_path,
+            collection_type=collection_type,
+            model=model,
+            embeddings_dimension=embeddings_dimension,
+            max_workers=max_workers,
+            max_id_memory_bytes=max_id_memory_bytes,
+            max_errors=max_errors,
+        )
+
+    def iter_validate_documents_from_parquet(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str] = None,
+        embeddings_dimension: Optional[int] = None,
+        max_id_memory_bytes: int = _VALIDATION_ID_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[ValidationError]:
+        """
+        Validates documents from a Parquet file, yielding errors as they
+        are found instead of collecting them in a list.
+
+        Errors are the same, and in the same order, as those returned by
+        `validate_documents_from_parquet`. Validation stops once the
+        iterator is closed, or once `max_errors` errors were yielded.
+        See `validate_documents_from_parquet` for description of
+        parameters.
+
+        Returns
+        -------
+        Iterator[ValidationError]
+            Iterator over encountered errors.
+        """
+
+        return validator.iter_validate_parquet(
+            file_path=file_path,
+            collection_type=collection_type,
+            model=model,
+            embeddings_dimension=embeddings_dimension,
+            max_id_memory_bytes=max_id_memory_bytes,
+            max_errors=max_errors,
         )
 
+    def write_validation_report(
+        self,
+        errors: Iterable[ValidationError],
+        report_path: str,
+    ) -> ValidationSummary:
+        """
+        Writes validation errors to a JSONL or Parquet report file
+        as they are produced, without keeping them in memory.
+
+        Parameters
+        ----------
+        errors : Iterable[ValidationError]
+            Validation errors, e.g. from
+            `iter_validate_documents_from_jsonl`.
+        report_path : str
+            Path of the report. If it ends with ".parquet", the report
+            is written as a Parquet file, and as a JSONL file otherwise.
+
+        Returns
+        -------
+        ValidationSummary
+            Number of documents with errors, and counts of errors
+            per error type.
+        """
+
+        return write_validation_report(errors=errors, report_path=report_path)
+
     # endregion
@@ -0,0 +1,277 @@
+"""
+This module contains asynchronous counterparts of the HTTP components
+used by the SDK. They are built on top of `aiohttp`, which is an optional
+dependency and can be installed using `pip install vantage-sdk[async]`.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import re
+import ssl
+import typing
+from typing import Any, Optional
+
+from vantage_sdk.core.http.exceptions import ApiException, ApiValueError
+
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def _require_aiohttp() -> None:
+    if aiohttp is None:
+        raise ImportError(
+            "Asynchronous client requires the 'aiohttp' package. "
+            "Install it using `pip install vantage-sdk[async]`."
+        )
+
+
+class AsyncRESTResponse:
+    """
+    Fully read response received by the asynchronous REST client.
+
+    Exposes the same interface as `RESTResponse`, so it can be
+    deserialized by the generated `ApiClient`.
+    """
+
+    def __init__(self, status: int, reason: str, headers, data: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    def read(self) -> bytes:
+        return self.data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+    """
+    Non-blocking REST client sharing a single `aiohttp` connection pool.
+
+    The session is created lazily, inside the running event loop,
+    and is reused by all requests until `close` is called.
+    """
+
+    def __init__(self, configuration) -> None:
+        _require_aiohttp()
+        self._configuration = configuration
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _ssl_context(self):
+        configuration = self._configuration
+
+        if not configuration.verify_ssl:
+            return False
+
+        context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if configuration.cert_file:
+            context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if configuration.assert_hostname is False:
+            context.check_hostname = False
+
+        return context
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._configuration.connection_pool_maxsize or 0,
+                ssl=self._ssl_context(),
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+
+    def _timeout(self, _request_timeout):
+        if not _request_timeout:
+            return None
+
+        if isinstance(_request_timeout, (int, float)):
+            return aiohttp.ClientTimeout(total=_request_timeout)
+
+        if isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            return aiohttp.ClientTimeout(
+                connect=_request_timeout[0],
+                sock_read=_request_timeout[1],
+            )
+
+        return None
+
+    def _request_data(self, method, headers, body, post_params):
+        if method not in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            return None
+
+        content_type = headers.get('Content-Type')
+        if not content_type or re.search('json', content_type, re.IGNORECASE):
+            return None if body is None else json.dumps(body)
+
+        if content_type == 'application/x-www-form-urlencoded':
+            return aiohttp.FormData(post_params)
+
+        if content_type == 'multipart/form-data':
+            # Content-Type with the proper boundary is generated by aiohttp.
+            del headers['Content-Type']
+            form_data = aiohttp.FormData()
+            for key, value in post_params:
+                if isinstance(value, tuple):
+                    filename, filedata, mimetype = value
+                    form_data.add_field(
+                        key,
+                        filedata,
+                        filename=filename,
+                        content_type=mimetype,
+                    )
+                else:
+                    form_data.add_field(key, value)
+            return form_data
+
+        if isinstance(body, (str, bytes)):
+            return body
+
+        if content_type == 'text/plain' and isinstance(body, bool):
+            return "true" if body else "false"
+
+        raise ApiException(
+            status=0,
+            reason="Cannot prepare a request message for provided arguments. "
+            "Please check that your arguments match declared content type.",
+        )
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        """Perform requests without blocking the event loop.
+
+        Parameters are the same as for `RESTClientObject.request`.
+        """
+        method = method.upper()
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        data = self._request_data(method, headers, body, post_params)
+
+        try:
+            async with self.session.request(
+                method,
+                url,
+                data=data,
+                headers=headers,
+                timeout=self._timeout(_request_timeout),
+                proxy=self._configuration.proxy,
+                proxy_headers=self._configuration.proxy_headers,
+            ) as response:
+                return AsyncRESTResponse(
+                    status=response.status,
+                    reason=response.reason,
+                    headers=response.headers,
+                    data=await response.read(),
+                )
+        except aiohttp.ClientSSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+
+def _response_type(annotation: Any) -> Optional[str]:
+    """Converts return annotation of a generated operation to type name."""
+    if annotation in (None, type(None), inspect.Signature.empty):
+        return None
+
+    if typing.get_origin(annotation) in (list, typing.List):
+        (item_type,) = typing.get_args(annotation)
+        return f"List[{item_type.__name__}]"
+
+    return annotation.__name__
+
+
+class AsyncApi:
+    """
+    Asynchronous facade over an OpenAPI generated API component.
+
+    Every operation of the wrapped component is exposed as a coroutine
+    function with the same name and parameters. Requests are built by
+    the generated `_<operation>_serialize` methods, and are sent using
+    the asynchronous API client the component was created with.
+
+    Attributes
+    ----------
+    api: Any
+        Wrapped OpenAPI generated API component.
+    """
+
+    def __init__(self, api: Any):
+        """
+        Default constructor.
+
+        Parameters
+        ----------
+        api: Any
+            OpenAPI generated API component, created using an asynchronous
+            API client, such as `AsyncAuthorizedApiClient`.
+        """
+        self.api = api
+
+    def __getattr__(self, operation: str):
+        serialize = getattr(self.api, f"_{operation}_serialize", None)
+        if serialize is None:
+            raise AttributeError(
+                f"'{type(self.api).__name__}' has no operation '{operation}'"
+            )
+
+        signature = inspect.signature(getattr(type(self.api), operation))
+        response_type = _response_type(signature.return_annotation)
+        api_client = self.api.api_client
+
+        async def call_operation(**kwargs):
+            bound = signature.bind(self.api, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self")
+            request_timeout = arguments.pop("_request_timeout")
+
+            response_data = await api_client.call_api(
+                *serialize(**arguments),
+                _request_timeout=request_timeout,
+            )
+
+            response_types_map = (
+                {} if response_type is None else {"2XX": response_type}
+            )
+            return api_client.response_deserialize(
+                response_data=response_data,
+                response_types_map=response_types_map,
+            ).data
+
+        call_operation.__name__ = operation
+        return call_operation
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 from typing import Optional
 
@@ -11,8 +12,12 @@ from vantage_sdk.config import (
     DEFAULT_AUTH_HOST,
     DEFAULT_ENCODING,
 )
+from vantage_sdk.core.async_http import AsyncRESTClientObject
 from vantage_sdk.core.http import ApiClient
-from vantage_sdk.core.http.exceptions import UnauthorizedException
+from vantage_sdk.core.http.exceptions import (
+    ApiException,
+    UnauthorizedException,
+)
 
 
 class AuthorizationClient:
@@ -206,3 +211,92 @@ class AuthorizedApiClient(ApiClient):
                 "authorization"
             ] = f"Bearer {self.authorization_client.jwt_token}"
             return super().call_api(*args)
+
+
+class AsyncAuthorizedApiClient(ApiClient):
+    """
+    Authorized API client sending requests without blocking the event loop.
+
+    Requests are serialized and deserialized the same way as in
+    `AuthorizedApiClient`, but `call_api` is a coroutine and all requests
+    share a single asynchronous connection pool.
+    """
+
+    def __init__(
+        self,
+        authorization_client: AuthorizationClient,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None,
+    ) -> None:
+        super().__init__(
+            configuration=configuration,
+            header_name=header_name,
+            header_value=header_value,
+            cookie=cookie,
+        )
+        self.rest_client = AsyncRESTClientObject(self.configuration)
+        self.authorization_client = authorization_client
+
+    async def _call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        try:
+            return await self.rest_client.request(
+                method,
+                url,
+                headers=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+        except ApiException as e:
+            if e.body:
+                e.body = e.body.decode('utf-8')
+            raise e
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        args = (
+            method,
+            url,
+            header_params,
+            body,
+            post_params,
+            _request_timeout,
+        )
+        if "authorization" in header_params:
+            return await self._call_api(*args)
+
+        try:
+            auth_string = (
+                self.authorization_client._vantage_api_key
+                if self.authorization_client._vantage_api_key
+                else self.authorization_client.jwt_token
+            )
+            header_params["authorization"] = f"Bearer {auth_string}"
+            return await self._call_api(*args)
+        except UnauthorizedException:
+            # Obtaining a new token is a blocking call.
+            await asyncio.to_thread(self.authorization_client.authenticate)
+            header_params[
+                "authorization"
+            ] = f"Bearer {self.authorization_client.jwt_token}"
+            return await self._call_api(*args)
+
+    async def close(self) -> None:
+        await self.rest_client.close()
@@ -0,0 +1,228 @@
+"""
+In-memory caches used by the SDK clients.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, TypeVar
+
+from vantage_sdk.model.cache import CacheStats
+
+
+V = TypeVar("V")
+
+
+class _CacheEntry(Generic[V]):
+    __slots__ = ("value", "size", "expires_at", "tag")
+
+    def __init__(
+        self,
+        value: V,
+        size: int,
+        expires_at: float,
+        tag: Optional[Hashable],
+    ):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.tag = tag
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe cache with per-entry time to live and LRU eviction.
+
+    The cache is bounded by number of entries and, optionally, by total
+    size of entries in bytes. When either limit is exceeded, the least
+    recently used entries are evicted. Each entry can be assigned a tag,
+    so that all entries sharing a tag can be invalidated at once.
+
+    A value computed while its tag was invalidated is stale. To avoid
+    storing it, read the tag's `generation` before computing the value
+    and pass it to `put`, which skips values of an older generation.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        ttl_seconds : float
+            For how long an entry is valid after it has been put.
+        max_entries : int
+            Maximum number of entries in the cache.
+        max_bytes : Optional[int], optional
+            Maximum total size of entries in the cache, in bytes.
+            If not provided, the size is not limited.
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _CacheEntry[V]] = OrderedDict()
+        self._tags: dict[Hashable, set[Hashable]] = {}
+        self._generations: dict[Hashable, int] = {}
+        self._clears = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Returns the value stored under `key`, or None if not present."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: V,
+        size: int = 0,
+        tag: Optional[Hashable] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Stores `value` under `key`, replacing the previous value, if any.
+
+        Values larger than the maximum size of the cache are not stored,
+        and neither are values of an older `generation` of the tag.
+        """
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+
+        entry = _CacheEntry(
+            value=value,
+            size=size,
+            expires_at=time.monotonic() + self._ttl_seconds,
+            tag=tag,
+        )
+
+        with self._lock:
+            if generation is not None and generation != self._generation(tag):
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self._size += size
+            if tag is not None:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._size > self._max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the entry stored under `key`, if any."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                self._invalidations += 1
+
+    def generation(self, tag: Hashable) -> int:
+        """
+        Returns a number which changes whenever
+        entries assigned the `tag` are invalidated.
+        """
+        with self._lock:
+            return self._generation(tag)
+
+    def invalidate_tag(self, tag: Hashable) -> None:
+        """Removes all entries assigned the `tag`."""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Removes all entries, keeping the counters."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._clears += 1
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                size_bytes=self._size,
+            )
+
+    def _generation(self, tag: Hashable) -> int:
+        # Both counters only grow, so their sum changes with either.
+        return self._clears + self._generations.get(tag, 0)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+        if entry.tag is not None:
+            keys = self._tags[entry.tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[entry.tag]
+
+
+def search_cache_key(
+    search_type: str,
+    account_id: str,
+    collection_id: str,
+    vantage_api_key: str,
+    query: dict[str, Any],
+) -> str:
+    """
+    Creates a canonical cache key for a search request.
+
+    The key is a hash of the search type, the collection, the API key used
+    to authorize the search and the serialized query, so that requests
+    with an identical body map to the same key regardless of field order.
+    """
+    canonical = json.dumps(
+        [search_type, account_id, collection_id, vantage_api_key, query],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,158 @@
+"""
+Checkpoint journal for resumable uploads of files.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Dict, Optional, TextIO
+
+
+_JOURNAL_SUFFIX = ".checkpoint"
+
+
+class CheckpointJournal:
+    """
+    Records which batches of a source file have been uploaded.
+
+    The journal is a small append-only file stored next to the source
+    file. Its first line identifies the source file by size and
+    modification time, and every following line records the batch
+    number and the byte range of one acknowledged batch.
+
+    Batches can be acknowledged in any order. The journal tracks the
+    offset up to which all batches have been acknowledged, from which
+    reading of the source file is resumed, as well as batches acknowledged
+    beyond that offset, which are skipped when encountered again.
+
+    If the source file has changed since the journal was written, the
+    journal is discarded and the upload starts from the beginning.
+    """
+
+    def __init__(self, source_path: str):
+        """
+        Parameters
+        ----------
+        source_path : str
+            Path to the file being uploaded.
+        """
+        self.path = f"{source_path}{_JOURNAL_SUFFIX}"
+        self._source = self._describe(source_path)
+        self._acknowledged: Dict[int, int] = {}
+        self._resume_offset = 0
+        self._resume_batch_index = 0
+        self._lock = threading.Lock()
+        self._fd: Optional[TextIO] = None
+        self._complete_bytes = 0
+
+        self._load()
+
+    def __enter__(self) -> CheckpointJournal:
+        is_new = not os.path.exists(self.path)
+        if not is_new:
+            # Removes an incomplete last line, so that new lines
+            # are not appended to it.
+            os.truncate(self.path, self._complete_bytes)
+
+        self._fd = open(self.path, "a", encoding="utf-8")
+
+        if is_new:
+            self._write(json.dumps(self._source))
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+
+    @property
+    def resume_offset(self) -> int:
+        """Byte offset up to which all batches have been acknowledged."""
+        return self._resume_offset
+
+    @property
+    def resume_batch_index(self) -> int:
+        """Number of the first batch starting at `resume_offset`."""
+        return self._resume_batch_index
+
+    def is_acknowledged(self, start: int, end: int) -> bool:
+        """Checks if the batch spanning `start` to `end` was uploaded."""
+        with self._lock:
+            return self._acknowledged.get(start) == end
+
+    def acknowledge(self, batch_index: int, start: int, end: int) -> None:
+        """
+        Records that the batch spanning bytes `start` to `end` of the
+        source file has been uploaded. Safe to call from multiple threads.
+        """
+        with self._lock:
+            self._acknowledged[start] = end
+            self._write(f"{batch_index} {start} {end}")
+
+    def complete(self) -> None:
+        """Removes the journal, once the whole file has been uploaded."""
+        self.__exit__(None, None, None)
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _write(self, line: str) -> None:
+        self._fd.write(f"{line}\n")
+        self._fd.flush()
+        os.fsync(self._fd.fileno())
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as journal:
+            content = journal.read()
+
+        # The last line is incomplete if it is not terminated, e.g. when
+        # the process was killed while writing it, and is ignored.
+        self._complete_bytes = content.rfind(b"\n") + 1
+        lines = (
+            content[: self._complete_bytes]
+            .decode("utf-8", errors="replace")
+            .splitlines()
+        )
+
+        try:
+            source = json.loads(lines[0]) if lines else None
+        except json.JSONDecodeError:
+            source = None
+
+        if source != self._source:
+            os.remove(self.path)
+            return
+
+        batch_indexes: Dict[int, int] = {}
+        for line in lines[1:]:
+            parts = line.split()
+
+            if len(parts) != 3 or not all(part.isdigit() for part in parts):
+                continue
+
+            batch_index, start, end = map(int, parts)
+            if end <= start:
+                continue
+
+            self._acknowledged[start] = end
+            batch_indexes[start] = batch_index
+
+        offset = 0
+        batch_index = 0
+        while offset in self._acknowledged:
+            batch_index = batch_indexes[offset] + 1
+            offset = self._acknowledged[offset]
+
+        self._resume_offset = offset
+        self._resume_batch_index = batch_index
+
+    @staticmethod
+    def _describe(source_path: str) -> dict:
+        stat = os.stat(source_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
@@ -0,0 +1,173 @@
+"""
+Streaming decompression of compressed and archived JSONL files.
+
+Zstandard support requires the optional `zstandard` package.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import tarfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+GZIP = "gzip"
+ZSTD = "zstd"
+TAR = "tar"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_TAR_MAGIC_OFFSET = 257
+_TAR_MAGIC = b"ustar"
+_COMPRESSION_SUFFIXES = (".gz", ".zst", ".tar", ".tgz")
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ImportError(
+            "Reading Zstandard compressed files requires the 'zstandard' "
+            "package. Install it using `pip install vantage-sdk[zstd]`."
+        )
+
+
+def _compression(stream: io.BufferedIOBase) -> Optional[str]:
+    header = stream.peek(len(_ZSTD_MAGIC))
+
+    if header.startswith(_GZIP_MAGIC):
+        return GZIP
+
+    if header.startswith(_ZSTD_MAGIC):
+        return ZSTD
+
+    return None
+
+
+def _is_tar(stream: io.BufferedIOBase) -> bool:
+    end = _TAR_MAGIC_OFFSET + len(_TAR_MAGIC)
+    header = stream.peek(end)
+
+    return header[_TAR_MAGIC_OFFSET:end] == _TAR_MAGIC
+
+
+def _decompressed(stream: io.BufferedIOBase) -> io.BufferedIOBase:
+    compression = _compression(stream)
+
+    if compression == GZIP:
+        return io.BufferedReader(gzip.GzipFile(fileobj=stream), _CHUNK_SIZE)
+
+    if compression == ZSTD:
+        _require_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(stream)
+        return io.BufferedReader(reader, _CHUNK_SIZE)
+
+    return stream
+
+
+class _TarMembersReader(io.RawIOBase):
+    """
+    Reads regular files of a tar archive one after another, as if they
+    were a single file, separating them by a line terminator if needed.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._archive = tarfile.open(fileobj=stream, mode="r|")
+        self._members = (member for member in self._archive if member.isfile())
+        self._member: Optional[BinaryIO] = None
+        self._last_byte = b"\n"
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while True:
+            if self._member is None:
+                member = next(self._members, None)
+
+                if member is None:
+                    return 0
+
+                self._member = self._archive.extractfile(member)
+
+                if self._last_byte != b"\n":
+                    self._last_byte = b"\n"
+                    buffer[0:1] = b"\n"
+                    return 1
+
+            chunk = self._member.read(len(buffer))
+
+            if not chunk:
+                self._member = None
+                continue
+
+            buffer[: len(chunk)] = chunk
+            self._last_byte = chunk[-1:]
+            return len(chunk)
+
+    def close(self) -> None:
+        self._archive.close()
+        super().close()
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """
+    Returns "gzip" or "zstd" for compressed files, including compressed
+    archives, "tar" for uncompressed tar archives and None for other files.
+    """
+    with open(file_path, "rb") as file:
+        compression = _compression(file)
+
+        if compression is not None:
+            return compression
+
+        return TAR if _is_tar(file) else None
+
+
+def strip_compression_suffix(file_name: str) -> str:
+    """Removes extensions of compressed files and archives from a name."""
+    while file_name.endswith(_COMPRESSION_SUFFIXES):
+        file_name = file_name.rsplit(".", 1)[0]
+
+    return file_name
+
+
+@contextmanager
+def open_jsonl(file_path: str) -> Iterator[io.BufferedIOBase]:
+    """
+    Opens a JSONL file for reading in binary mode, decompressing it on
+    the fly if it is gzip or Zstandard compressed. If the file is a tar
+    archive, possibly compressed, the files in it are read one after
+    another as a single JSONL file. Nothing is decompressed to disk.
+    """
+    with open(file_path, "rb", buffering=_CHUNK_SIZE) as file:
+        stream = _decompressed(file)
+
+        if _is_tar(stream):
+            stream = io.BufferedReader(_TarMembersReader(stream), _CHUNK_SIZE)
+
+        try:
+            yield stream
+        finally:
+            stream.close()
+
+
+def decompressed_size(file_path: str) -> int:
+    """
+    Returns the size of data read by `open_jsonl`,
+    decompressing the file without storing it.
+    """
+    size = 0
+
+    with open_jsonl(file_path) as stream:
+        for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b""):
+            size += len(chunk)
+
+    return size
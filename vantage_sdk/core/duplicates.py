@@ -0,0 +1,181 @@
+"""
+Memory-bounded detection of duplicate document IDs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+from typing import Any, List, Optional, Set
+
+import numpy
+
+
+_DIGEST_BYTES = 16
+_BLOOM_FILTER_HASHES = 7
+# Approximate size of a digest stored in a set, including the set slot.
+_SET_ENTRY_BYTES = 120
+
+
+def _digest(id: Any) -> bytes:
+    key = id if isinstance(id, str) else f"{type(id).__name__}:{id!r}"
+
+    return hashlib.blake2b(
+        key.encode("utf-8", "surrogatepass"), digest_size=_DIGEST_BYTES
+    ).digest()
+
+
+class _BloomFilter:
+    def __init__(self, size_bytes: int):
+        self._bits = bytearray(max(1, size_bytes))
+        self._size = len(self._bits) * 8
+
+    def add_many(self, digests: List[bytes]) -> None:
+        halves = numpy.frombuffer(b"".join(digests), dtype="<u8").reshape(
+            -1, 2
+        )
+        first = halves[:, 0] % self._size
+        second = (halves[:, 1] | 1) % self._size
+
+        for index in range(_BLOOM_FILTER_HASHES):
+            positions = (first + index * second) % self._size
+            numpy.bitwise_or.at(
+                numpy.frombuffer(self._bits, dtype=numpy.uint8),
+                positions >> 3,
+                (1 << (positions & 7)).astype(numpy.uint8),
+            )
+
+    def __contains__(self, digest: bytes) -> bool:
+        size = self._size
+        first = int.from_bytes(digest[:8], "little") % size
+        second = (int.from_bytes(digest[8:], "little") | 1) % size
+        bits = self._bits
+
+        for index in range(_BLOOM_FILTER_HASHES):
+            position = (first + index * second) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+
+        return True
+
+
+class DuplicateDetector:
+    """
+    Detects IDs which were already seen, using a bounded amount of memory.
+
+    Recently seen IDs are kept in memory as 16-byte digests. Once they
+    take up the memory budget, they are spilled to a sorted index in a
+    temporary SQLite database on disk, and added to a Bloom filter. The
+    filter answers most lookups of IDs which were not spilled, so disk
+    is read only to confirm likely duplicates, and for a small share of
+    false positives of the filter.
+
+    The detector holds the state of a single validation run. Temporary
+    files are removed when it is closed.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        temporary_directory: Optional[str] = None,
+    ):
+        """
+        Parameters
+        ----------
+        max_memory_bytes : int
+            Approximate memory used by the detector. A quarter of it is
+            used by the Bloom filter, the rest by IDs kept in memory.
+        temporary_directory : Optional[str], optional
+            Directory in which spilled IDs are stored. If not provided,
+            the system's temporary directory is used.
+        """
+        if max_memory_bytes < 1:
+            raise ValueError("max_memory_bytes must be at least 1.")
+
+        self._max_ids_in_memory = max(
+            1, max_memory_bytes * 3 // 4 // _SET_ENTRY_BYTES
+        )
+        self._bloom_filter_bytes = max_memory_bytes // 4
+        self._temporary_directory = temporary_directory
+
+        self._ids: Set[bytes] = set()
+        self._bloom_filter: Optional[_BloomFilter] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._spill_directory: Optional[str] = None
+
+    def __enter__(self) -> DuplicateDetector:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+        if self._spill_directory is not None:
+            shutil.rmtree(self._spill_directory, ignore_errors=True)
+            self._spill_directory = None
+
+        self._ids.clear()
+
+    def add(self, id: Any) -> bool:
+        """
+        Records an ID and returns True if it was recorded before.
+        """
+        digest = _digest(id)
+
+        if digest in self._ids:
+            return True
+
+        if (
+            self._bloom_filter is not None
+            and digest in self._bloom_filter
+            and self._is_spilled(digest)
+        ):
+            return True
+
+        self._ids.add(digest)
+        if len(self._ids) >= self._max_ids_in_memory:
+            self._spill()
+
+        return False
+
+    def _is_spilled(self, digest: bytes) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM ids WHERE digest = ?", (digest,)
+        ).fetchone()
+
+        return row is not None
+
+    def _spill(self) -> None:
+        if self._connection is None:
+            self._spill_directory = tempfile.mkdtemp(
+                prefix="vantage-ids-", dir=self._temporary_directory
+            )
+            self._connection = sqlite3.connect(
+                os.path.join(self._spill_directory, "ids.db")
+            )
+            self._connection.executescript(
+                """
+                PRAGMA journal_mode = OFF;
+                PRAGMA synchronous = OFF;
+                CREATE TABLE ids (digest BLOB PRIMARY KEY) WITHOUT ROWID;
+                """
+            )
+            self._bloom_filter = _BloomFilter(self._bloom_filter_bytes)
+
+        # Sorted digests are appended to the index sequentially.
+        digests = sorted(self._ids)
+        with self._connection as connection:
+            connection.executemany(
+                "INSERT INTO ids VALUES (?)",
+                ((digest,) for digest in digests),
+            )
+
+        self._bloom_filter.add_many(digests)
+        self._ids.clear()
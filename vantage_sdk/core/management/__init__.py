@@ -1,4 +1,7 @@
-from vantage_sdk.core.management.management import ManagementAPI
+from vantage_sdk.core.management.management import (
+    AsyncManagementAPI,
+    ManagementAPI,
+)
 
 
-__all__ = ["ManagementAPI"]
+__all__ = ["ManagementAPI", "AsyncManagementAPI"]
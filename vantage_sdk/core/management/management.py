@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from vantage_sdk.core.async_http import AsyncApi
 from vantage_sdk.core.http.api.account_management_api import (
     AccountManagementApi,
 )
@@ -111,3 +112,68 @@ class ManagementAPI:
             vantage_vibe_api=vantage_vibe_api,
             documents_api=documents_api,
         )
+
+
+class AsyncManagementAPI:
+    """
+    Class for accessing Management API asynchronously.
+
+    Each attribute exposes the same operations as its counterpart
+    in `ManagementAPI`, as coroutines.
+
+    Attributes
+    ----------
+    account_api: AsyncApi
+        Account management API component.
+    collection_api: AsyncApi
+        Collection management API component.
+    external_keys_api: AsyncApi
+        External API keys management API component.
+    vantage_api_keys_api: AsyncApi
+        Vantage API keys management API component.
+    shopping_assistant_api: AsyncApi
+        Shopping Assistant management API component.
+    vantage_vibe_api: AsyncApi
+        Vantage Vibe management API component.
+    documents_api: AsyncApi
+        Documents management API component.
+    """
+
+    def __init__(self, management_api: ManagementAPI):
+        """
+        Default constructor.
+
+        Parameters
+        ----------
+        management_api: ManagementAPI
+            Management API whose components were created
+            using an asynchronous API client.
+        """
+        self.account_api = AsyncApi(management_api.account_api)
+        self.collection_api = AsyncApi(management_api.collection_api)
+        self.external_keys_api = AsyncApi(management_api.external_keys_api)
+        self.vantage_api_keys_api = AsyncApi(
+            management_api.vantage_api_keys_api
+        )
+        self.shopping_assistant_api = AsyncApi(
+            management_api.shopping_assistant_api
+        )
+        self.vantage_vibe_api = AsyncApi(management_api.vantage_vibe_api)
+        self.documents_api = AsyncApi(management_api.documents_api)
+
+    @classmethod
+    def from_defaults(cls, api_client: ApiClient) -> AsyncManagementAPI:
+        """
+        Constructs AsyncManagementAPI instance using default values.
+
+        Parameters
+        ----------
+        api_client: ApiClient
+            Asynchronous API client component used to call the API.
+
+        Returns
+        -------
+        AsyncManagementAPI
+            AsyncManagementAPI instance.
+        """
+        return cls(management_api=ManagementAPI.from_defaults(api_client))
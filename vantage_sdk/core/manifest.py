@@ -0,0 +1,216 @@
+"""
+Local manifest of uploaded documents, used to skip unchanged documents.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from typing import Any, Dict, Iterator, Optional
+
+from vantage_sdk.config import METADATA_PREFIX
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    scope TEXT NOT NULL,
+    id TEXT NOT NULL,
+    hash BLOB NOT NULL,
+    PRIMARY KEY (scope, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS versions (
+    scope TEXT NOT NULL,
+    id TEXT NOT NULL,
+    document TEXT NOT NULL,
+    PRIMARY KEY (scope, id)
+) WITHOUT ROWID;
+CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TEMP TABLE IF NOT EXISTS pending (
+    id TEXT PRIMARY KEY,
+    hash BLOB NOT NULL,
+    document TEXT
+) WITHOUT ROWID;
+"""
+
+
+def content_hash(content: str) -> bytes:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def metadata_update(previous: str, current: str) -> Optional[Dict[str, Any]]:
+    """
+    Compares two serialized versions of a document and, if they differ
+    only in values of metadata fields, returns an "update" operation
+    containing just the changed fields. Returns None if the document
+    has to be sent in full, because its text, embeddings or variants
+    changed, or a metadata field was removed.
+    """
+    previous_document = json.loads(previous)
+    current_document = json.loads(current)
+
+    for key in previous_document.keys() | current_document.keys():
+        if key.startswith(METADATA_PREFIX):
+            if key not in current_document:
+                return None
+        elif previous_document.get(key) != current_document.get(key):
+            return None
+
+    update = {"id": current_document["id"], "operation": "update"}
+    for key, value in current_document.items():
+        if key.startswith(METADATA_PREFIX) and (
+            key not in previous_document or previous_document[key] != value
+        ):
+            update[key] = value
+
+    return update
+
+
+class DocumentManifest:
+    """
+    Records a content hash of every document upserted to a collection,
+    so that unchanged documents can be skipped by later upserts.
+
+    The manifest is stored in an SQLite database, which can hold
+    manifests of multiple collections. Hashes are computed from the
+    serialized document, so a change of any field, metadata or
+    embedding makes the document count as changed.
+
+    If `keep_documents` is True, the serialized documents are stored
+    as well, so that a later upsert can send only the metadata fields
+    which changed, using the "update" operation.
+
+    Documents observed during an upsert are staged and written to the
+    manifest only once the upsert succeeds, so a failed upsert leaves
+    the manifest as it was. A manifest must not be used by multiple
+    upserts at the same time.
+    """
+
+    def __init__(self, path: str, keep_documents: bool = False):
+        """
+        Parameters
+        ----------
+        path : str
+            Path to the SQLite database file. Created if it does not exist.
+        keep_documents : bool, optional
+            If True, the last upserted version of every document is stored
+            in the manifest, which is required for partial updates.
+            Defaults to False.
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._scope: Optional[str] = None
+        self.keep_documents = keep_documents
+
+    def __enter__(self) -> DocumentManifest:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM documents"
+        ).fetchone()
+        return count
+
+    def start(self, scope: str) -> None:
+        """
+        Starts observing a snapshot of documents of the `scope`,
+        typically identifying a collection.
+        """
+        self.rollback()
+        self._scope = scope
+
+    def observe(self, id: str, content: str) -> bool:
+        """
+        Marks a document as present in the snapshot and returns True
+        if it is new or its content changed since the last snapshot.
+        """
+        digest = content_hash(content)
+        connection = self._connection
+
+        connection.execute("INSERT OR IGNORE INTO seen VALUES (?)", (id,))
+
+        row = connection.execute(
+            "SELECT hash FROM documents WHERE scope = ? AND id = ?",
+            (self._scope, id),
+        ).fetchone()
+        if row is not None and row[0] == digest:
+            return False
+
+        connection.execute(
+            "INSERT OR REPLACE INTO pending VALUES (?, ?, ?)",
+            (id, digest, content if self.keep_documents else None),
+        )
+        return True
+
+    def previous_version(self, id: str) -> Optional[str]:
+        """
+        Returns the document as it was last recorded in the manifest,
+        or None if it is not stored.
+        """
+        row = self._connection.execute(
+            "SELECT document FROM versions WHERE scope = ? AND id = ?",
+            (self._scope, id),
+        ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def missing_ids(self) -> Iterator[str]:
+        """
+        Returns ids of documents recorded in the manifest,
+        which were not observed in the current snapshot.
+        """
+        rows = self._connection.execute(
+            "SELECT id FROM documents WHERE scope = ? "
+            "AND id NOT IN (SELECT id FROM seen)",
+            (self._scope,),
+        ).fetchall()
+
+        return (id for (id,) in rows)
+
+    def commit(self, remove_missing: bool = False) -> None:
+        """
+        Records new and changed documents of the current snapshot and,
+        if `remove_missing` is True, forgets documents not observed in it.
+        """
+        with self._connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO documents "
+                "SELECT ?, id, hash FROM pending",
+                (self._scope,),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO versions "
+                "SELECT ?, id, document FROM pending "
+                "WHERE document IS NOT NULL",
+                (self._scope,),
+            )
+            # Stored versions of documents changed without keeping
+            # documents are outdated.
+            connection.execute(
+                "DELETE FROM versions WHERE scope = ? AND id IN "
+                "(SELECT id FROM pending WHERE document IS NULL)",
+                (self._scope,),
+            )
+            if remove_missing:
+                for table in ("documents", "versions"):
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE scope = ? "
+                        "AND id NOT IN (SELECT id FROM seen)",
+                        (self._scope,),
+                    )
+
+        self.rollback()
+
+    def rollback(self) -> None:
+        """Discards the current snapshot, leaving the manifest unchanged."""
+        with self._connection as connection:
+            connection.execute("DELETE FROM seen")
+            connection.execute("DELETE FROM pending")
+
+        self._scope = None
@@ -0,0 +1,122 @@
+import io
+import math
+from typing import Iterator, List, Optional, Union
+
+import pyarrow as arrow
+import pyarrow.parquet as parquet
+
+
+def _row_group_size(metadata: parquet.FileMetaData, index: int) -> int:
+    row_group = metadata.row_group(index)
+
+    return sum(
+        row_group.column(column).total_compressed_size
+        for column in range(row_group.num_columns)
+    )
+
+
+def _write_part(schema: arrow.Schema, tables: List[arrow.Table]) -> bytes:
+    buffer = io.BytesIO()
+
+    with parquet.ParquetWriter(buffer, schema) as writer:
+        for table in tables:
+            writer.write_table(table)
+
+    return buffer.getvalue()
+
+
+def split_parquet_file(file_path: str, max_part_bytes: int) -> Iterator[bytes]:
+    """
+    Splits a parquet file into parts of roughly `max_part_bytes` each.
+
+    Consecutive row groups are combined into a part as long as their
+    compressed size fits into `max_part_bytes`. Row groups larger than
+    that are re-chunked by rows. Parts are produced one at a time, so
+    only the part being produced is kept in memory. A file without row
+    groups is produced as a single empty part.
+    """
+    if max_part_bytes < 1:
+        raise ValueError("max_part_bytes must be at least 1.")
+
+    file = parquet.ParquetFile(file_path)
+    metadata = file.metadata
+    schema = file.schema_arrow
+
+    tables: List[arrow.Table] = []
+    part_size = 0
+    parts = 0
+
+    for index in range(metadata.num_row_groups):
+        row_group_size = _row_group_size(metadata, index)
+
+        if tables and part_size + row_group_size > max_part_bytes:
+            yield _write_part(schema, tables)
+            parts += 1
+            tables = []
+            part_size = 0
+
+        if row_group_size <= max_part_bytes:
+            tables.append(file.read_row_group(index))
+            part_size += row_group_size
+            continue
+
+        table = file.read_row_group(index)
+        rows_per_part = max(
+            1,
+            math.floor(table.num_rows * max_part_bytes / row_group_size),
+        )
+        for offset in range(0, table.num_rows, rows_per_part):
+            yield _write_part(schema, [table.slice(offset, rows_per_part)])
+            parts += 1
+
+    if tables or parts == 0:
+        yield _write_part(schema, tables)
+
+
+def arrow_to_parquet_parts(
+    data: Union[arrow.Table, arrow.RecordBatchReader],
+    max_part_bytes: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Serializes a table, or a stream of record batches, into in-memory
+    parquet files.
+
+    Record batches are written as they are read, so a RecordBatchReader
+    is never fully materialized. If `max_part_bytes` is provided, a new
+    file is started once the current one reaches that size, otherwise
+    all data is written into a single file.
+    """
+    if max_part_bytes is not None and max_part_bytes < 1:
+        raise ValueError("max_part_bytes must be at least 1.")
+
+    if isinstance(data, arrow.Table):
+        max_chunksize = None
+        if max_part_bytes is not None and data.nbytes > max_part_bytes:
+            max_chunksize = max(
+                1, data.num_rows * max_part_bytes // data.nbytes
+            )
+        batches = iter(data.to_batches(max_chunksize=max_chunksize))
+    else:
+        batches = iter(data)
+
+    parts = 0
+    buffer = io.BytesIO()
+    writer = parquet.ParquetWriter(buffer, data.schema)
+    pending_rows = False
+
+    for batch in batches:
+        writer.write_batch(batch)
+        pending_rows = True
+
+        if max_part_bytes is not None and buffer.tell() >= max_part_bytes:
+            writer.close()
+            yield buffer.getvalue()
+            parts += 1
+
+            buffer = io.BytesIO()
+            writer = parquet.ParquetWriter(buffer, data.schema)
+            pending_rows = False
+
+    writer.close()
+    if pending_rows or parts == 0:
+        yield buffer.getvalue()
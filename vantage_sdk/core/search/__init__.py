@@ -1,4 +1,4 @@
-from vantage_sdk.core.search.search import SearchAPI
+from vantage_sdk.core.search.search import AsyncSearchAPI, SearchAPI
 
 
-__all__ = ["SearchAPI"]
+__all__ = ["SearchAPI", "AsyncSearchAPI"]
@@ -1,5 +1,6 @@
 """This module contains SearchAPI, a class for accessing search API."""
 
+from vantage_sdk.core.async_http import AsyncApi
 from vantage_sdk.core.http.api.search_api import SearchApi
 from vantage_sdk.core.http.api_client import ApiClient
 
@@ -24,3 +25,26 @@ class SearchAPI:
             Component used to make HTTP calls to the API.
         """
         self.api = SearchApi(api_client=api_client)
+
+
+class AsyncSearchAPI:
+    """
+    Component for accessing the search API asynchronously.
+
+    Attributes
+    ----------
+    api: AsyncApi
+        Component used to access the search API, exposing
+        the same operations as `SearchApi` as coroutines.
+    """
+
+    def __init__(self, api_client: ApiClient):
+        """
+        Default constructor.
+
+        Parameters
+        ----------
+        api_client: ApiClient
+            Asynchronous component used to make HTTP calls to the API.
+        """
+        self.api = AsyncApi(SearchApi(api_client=api_client))
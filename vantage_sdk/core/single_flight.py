@@ -0,0 +1,75 @@
+"""
+Coalescing of identical concurrent calls.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """
+    Makes sure only one call per key is in flight at a time.
+
+    The first thread calling `do` with a key executes the function, while
+    all other threads calling `do` with the same key before it finishes
+    wait for it and receive the same result, or the same exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls which were served by another call in flight."""
+        return self._coalesced
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        Executes `function`, unless a call with the same key is in flight,
+        in which case the result of that call is returned.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self._coalesced += 1
+
+        if not is_leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call.done.set()
@@ -1,4 +1,8 @@
 from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from vantage_sdk.config import DEFAULT_ENCODING
+from vantage_sdk.core.compression import open_jsonl
 
 
 LF = "\n"
@@ -11,37 +15,127 @@ def count_lines(text: str) -> int:
     return lf_count + crlf_count + 1
 
 
+def _batch_sized_lines(
+    lines: Iterable[Tuple[str, int]],
+    batch_size: int,
+    max_batch_bytes: Optional[int],
+) -> Iterator[Tuple[str, int]]:
+    batch: List[str] = []
+    batch_bytes = 0
+    skipped_bytes = 0
+
+    for line, line_bytes in lines:
+        if not line or line.isspace():
+            skipped_bytes += line_bytes
+            continue
+
+        if batch and (
+            len(batch) >= batch_size
+            or (
+                max_batch_bytes is not None
+                and batch_bytes + line_bytes > max_batch_bytes
+            )
+        ):
+            yield ''.join(batch), batch_bytes
+            batch = []
+            batch_bytes = 0
+
+        batch.append(line)
+        batch_bytes += skipped_bytes + line_bytes
+        skipped_bytes = 0
+
+    if batch:
+        yield ''.join(batch), batch_bytes
+
+
+def batch_lines(
+    lines: Iterable[str],
+    batch_size: int,
+    max_batch_bytes: Optional[int] = None,
+    encoding: str = DEFAULT_ENCODING,
+) -> Iterator[str]:
+    """
+    Joins lines into batches of at most `batch_size` lines and, if
+    `max_batch_bytes` is provided, at most `max_batch_bytes` bytes when
+    encoded. A single line larger than `max_batch_bytes` forms a batch
+    on its own. Blank lines are skipped.
+    """
+    sized_lines = (
+        (
+            line,
+            len(line.encode(encoding)) if max_batch_bytes is not None else 0,
+        )
+        for line in lines
+    )
+
+    for batch, _ in _batch_sized_lines(
+        sized_lines, batch_size, max_batch_bytes
+    ):
+        yield batch
+
+
 class BatchTextFileReader:
     def __init__(
         self,
         file_path: str,
         batch_size: int,
+        max_batch_bytes: Optional[int] = None,
+        encoding: str = DEFAULT_ENCODING,
+        start_offset: int = 0,
     ):
         self._file_path = file_path
         self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._encoding = encoding
+        self._start_offset = start_offset
 
     def __enter__(self):
-        self._fd = open(self._file_path)
+        self._file = open_jsonl(self._file_path)
+        self._fd = self._file.__enter__()
+        self._skip_to(self._start_offset)
+        self._batches = self._read_batches()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self._fd.close()
+        self._file.__exit__(exc_type, exc_value, traceback)
 
-    def next(self) -> str:
-        batch = []
-        for i in range(0, self._batch_size):
-            line = self._fd.readline()
+    def _skip_to(self, offset: int) -> None:
+        if self._fd.seekable():
+            self._fd.seek(offset)
+            return
 
-            if str.isspace(line):
-                continue
+        # Decompressed data can only be skipped by reading it.
+        while offset > 0:
+            chunk = self._fd.read(min(offset, 1024 * 1024))
+            if not chunk:
+                break
+            offset -= len(chunk)
 
-            if line is None:
-                print("End reader")
-                return ''.join(batch)
+    def __iter__(self) -> Iterator[str]:
+        return (batch for _, _, batch in self._batches)
 
-            batch.append(line)
+    def next(self) -> str:
+        _, _, batch = next(self._batches, (0, 0, ''))
+        return batch
+
+    def iter_with_offsets(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        Iterates over batches together with the byte offsets
+        in the file at which each batch starts and ends.
+        """
+        return self._batches
+
+    def _read_batches(self) -> Iterator[Tuple[int, int, str]]:
+        sized_lines = (
+            (line.decode(self._encoding), len(line)) for line in self._fd
+        )
+        offset = self._start_offset
 
-        return ''.join(batch)
+        for batch, batch_bytes in _batch_sized_lines(
+            sized_lines, self._batch_size, self._max_batch_bytes
+        ):
+            yield offset, offset + batch_bytes, batch
+            offset += batch_bytes
 
 
 class TextSplitter:
@@ -49,12 +143,24 @@ class TextSplitter:
         self,
         text: str,
         batch_size: int,
+        max_batch_bytes: Optional[int] = None,
     ):
         self._text = text
         self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
 
-    def batch(self):
+    def batch(self) -> List[str]:
         lines = self._text.splitlines(keepends=True)
+
+        if self._max_batch_bytes is not None:
+            return list(
+                batch_lines(
+                    lines=lines,
+                    batch_size=self._batch_size,
+                    max_batch_bytes=self._max_batch_bytes,
+                )
+            )
+
         iterator = iter(lines)
 
         return [
@@ -0,0 +1,237 @@
+"""
+Helpers for uploading documents.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import queue
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def upload_batches(
+    batches: Iterable[T],
+    upload: Callable[[T], None],
+    max_workers: int = 1,
+    max_pending: Optional[int] = None,
+) -> None:
+    """
+    Uploads batches using a pipeline of one reader and multiple uploaders.
+
+    The calling thread reads batches from `batches` and puts them into
+    a bounded queue, from which `max_workers` uploader threads take them
+    and pass them to `upload`. When the queue is full, reading is paused
+    until an uploader takes a batch, so at most `max_pending` batches are
+    waiting in memory, in addition to those being uploaded.
+
+    If an upload fails, no more batches are read, batches waiting in the
+    queue are discarded and the exception is raised once all uploaders
+    have stopped. Batches may be uploaded in a different order than they
+    were read.
+
+    Parameters
+    ----------
+    batches : Iterable[T]
+        Batches to upload. Consumed lazily.
+    upload : Callable[[T], None]
+        Function uploading a single batch. Must be thread-safe.
+    max_workers : int, optional
+        Number of batches uploaded at the same time.
+        If 1, batches are uploaded one after another
+        in the calling thread. Defaults to 1.
+    max_pending : Optional[int], optional
+        Maximum number of batches waiting to be uploaded.
+        If not provided, twice the number of workers is used.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    if max_workers == 1:
+        for batch in batches:
+            upload(batch)
+        return
+
+    pending: queue.Queue = queue.Queue(maxsize=max_pending or 2 * max_workers)
+    failed = threading.Event()
+    errors: List[BaseException] = []
+
+    def work() -> None:
+        while True:
+            batch = pending.get()
+
+            if batch is _DONE:
+                return
+
+            if failed.is_set():
+                continue
+
+            try:
+                upload(batch)
+            except BaseException as error:
+                errors.append(error)
+                failed.set()
+
+    workers = [
+        threading.Thread(
+            target=work,
+            name=f"vantage-upload-{index}",
+            daemon=True,
+        )
+        for index in range(max_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        for batch in batches:
+            if failed.is_set():
+                break
+
+            pending.put(batch)
+    except BaseException:
+        failed.set()
+        raise
+    finally:
+        for _ in workers:
+            pending.put(_DONE)
+
+        for worker in workers:
+            worker.join()
+
+    if errors:
+        raise errors[0]
+
+
+class ChecksumReader:
+    """
+    Wraps a binary file, computing the MD5 checksum of the data
+    as it is being read.
+
+    The wrapper exposes the size of the data through `len`, so that HTTP
+    clients can send it as a request body of known length, reading it in
+    chunks instead of loading the whole file into memory.
+    """
+
+    def __init__(self, file: BinaryIO, size: int):
+        """
+        Parameters
+        ----------
+        file : BinaryIO
+            File opened in binary mode, positioned at the start of data.
+        size : int
+            Number of bytes which will be read from the file.
+        """
+        self._file = file
+        self._size = size
+        self._md5 = hashlib.md5(usedforsecurity=False)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self._md5.update(chunk)
+        return chunk
+
+    def hexdigest(self) -> str:
+        """Returns the checksum of the data read so far."""
+        return self._md5.hexdigest()
+
+
+class _Operation:
+    __slots__ = ("line", "record")
+
+    def __init__(self, line: str, record: Dict[str, Any]):
+        self.line = line
+        self.record = record
+
+    @property
+    def kind(self) -> str:
+        return self.record.get("operation", "add")
+
+    def merge(self, update: Dict[str, Any]) -> None:
+        merged = dict(self.record)
+        merged.update(
+            (key, value) for key, value in update.items() if key != "operation"
+        )
+        self.record = merged
+        self.line = f"{json.dumps(merged)}\n"
+
+
+def jsonl_lines(text: str) -> List[str]:
+    """
+    Splits JSONL text into lines, keeping line terminators.
+
+    Only "\\n" terminates a line. Unlike `str.splitlines`, characters such
+    as U+2028, which JSON allows unescaped in strings, don't split lines.
+    """
+    return list(io.StringIO(text, newline="\n"))
+
+
+def compact_operations(lines: Iterable[str]) -> List[str]:
+    """
+    Collapses operations on the same document into as few operations as
+    possible, keeping the result of applying them in order.
+
+    An add or a delete replaces all previous operations on the document.
+    An update is merged into a preceding add or update. An update
+    following a delete is kept as a separate operation after it.
+    Lines which are not JSON objects with an id are kept unchanged.
+    Blank lines are dropped.
+
+    Operations are returned in the order in which their documents first
+    appear, with lines unchanged unless operations were merged.
+    """
+    documents: Dict[Any, List[_Operation]] = {}
+    other_lines: List[str] = []
+
+    for line in lines:
+        if not line or line.isspace():
+            continue
+
+        if not line.endswith("\n"):
+            line = f"{line}\n"
+
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+
+        if not isinstance(record, dict) or not isinstance(
+            record.get("id"), str
+        ):
+            other_lines.append(line)
+            continue
+
+        operation = _Operation(line, record)
+        previous = documents.get(record["id"])
+
+        if previous is None or operation.kind != "update":
+            documents[record["id"]] = [operation]
+        elif previous[-1].kind == "delete":
+            previous.append(operation)
+        else:
+            previous[-1].merge(record)
+
+    return [
+        operation.line
+        for operations in documents.values()
+        for operation in operations
+    ] + other_lines
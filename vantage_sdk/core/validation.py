@@ -1,21 +1,35 @@
+import io
 import json
+import os
 import re
 import string
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from itertools import islice
 from json.decoder import JSONDecodeError
-from typing import Any, Optional
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
 
+import numpy
+import pyarrow as arrow
+import pyarrow.compute as compute
 import pyarrow.parquet as parquet
 import tiktoken
 
+from vantage_sdk.core.compression import detect_compression, open_jsonl
+from vantage_sdk.core.duplicates import DuplicateDetector
 from vantage_sdk.model.validation import (
     CollectionType,
     ErrorMessage,
     ValidationError,
+    ValidationSummary,
 )
 
 
 _MAX_ID_LENGTH = 256
 _MAX_SEQUENCE_LENGTH = 8191
+_DUPLICATE_DETECTION_MEMORY_BYTES = 256 * 1024 * 1024
 _VALID_OPERATIONS = ["add", "delete", "update"]
 _VALID_META_NAME_CHARACTERS = set(
     string.ascii_lowercase + string.ascii_uppercase + string.digits + '-' + '_'
@@ -23,6 +37,32 @@ _VALID_META_NAME_CHARACTERS = set(
 _VALID_META_PRIMITIVE_VALUES = (int, float, str)
 _NUMBERS = (int, float)
 _LIST = list
+_SHARDS_PER_WORKER = 4
+_PARQUET_BATCH_SIZE = 4096
+_INVALID_ID_CHARACTERS = r"[\x00-\x1F\x7F-\x9F]"
+_SPECIAL_TOKEN_PREFIX = "<|"
+_TOKENIZATION_BATCH_SIZE = 1024
+# A token is at least one byte, and a character at most four bytes long.
+_MAX_CHARACTERS_WITHIN_SEQUENCE_LENGTH = _MAX_SEQUENCE_LENGTH // 4
+_MIN_SHARD_BYTES = 1024 * 1024
+_REPORT_BATCH_SIZE = 4096
+_REPORT_SCHEMA = arrow.schema(
+    [
+        ("document_id", arrow.string()),
+        ("line_number", arrow.int64()),
+        (
+            "errors",
+            arrow.list_(
+                arrow.struct(
+                    [
+                        ("field_name", arrow.string()),
+                        ("error_message", arrow.string()),
+                    ]
+                )
+            ),
+        ),
+    ]
+)
 
 
 def _validate_id(document: dict[str, Any]) -> Optional[ErrorMessage]:
@@ -44,7 +84,7 @@ def _validate_id(document: dict[str, Any]) -> Optional[ErrorMessage]:
             error_message=f"Maximum content length is {_MAX_ID_LENGTH}",
         )
 
-    if re.search(r"[\x00-\x1F\x7F-\x9F]", document_id) is not None:
+    if re.search(_INVALID_ID_CHARACTERS, document_id) is not None:
         return ErrorMessage(
             field_name="id",
             error_message="Field contains unsupported characters.",
@@ -55,12 +95,12 @@ def _validate_id(document: dict[str, Any]) -> Optional[ErrorMessage]:
 
 def _check_for_duplicate(
     document_id: Optional[str],
-    encountered: set[str],
+    duplicates: DuplicateDetector,
 ) -> Optional[ErrorMessage]:
     if document_id is None:
         return None
 
-    if document_id not in encountered:
+    if not duplicates.add(document_id):
         return None
 
     return ErrorMessage(
@@ -87,20 +127,40 @@ def _validate_text(
             field_name="text", error_message="Field content must be string."
         )
 
-    if not model:
+    if not model or not _may_exceed_sequence_length(document["text"]):
         return None
 
-    encoding = tiktoken.encoding_for_model(model)
+    encoding = _encoding_for_model(model)
 
     if len(encoding.encode(document["text"])) > _MAX_SEQUENCE_LENGTH:
-        return ErrorMessage(
-            field_name="text",
-            error_message="Content length exceeds maximum sequence length.",
-        )
+        return _sequence_length_error()
 
     return None
 
 
+@lru_cache(maxsize=None)
+def _encoding_for_model(model: str) -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model(model)
+
+
+def _may_exceed_sequence_length(text: str) -> bool:
+    # Special tokens are rejected by the tokenizer, which has to see them.
+    if _SPECIAL_TOKEN_PREFIX in text:
+        return True
+
+    return (
+        len(text) > _MAX_CHARACTERS_WITHIN_SEQUENCE_LENGTH
+        and len(text.encode("utf-8")) > _MAX_SEQUENCE_LENGTH
+    )
+
+
+def _sequence_length_error() -> ErrorMessage:
+    return ErrorMessage(
+        field_name="text",
+        error_message="Content length exceeds maximum sequence length.",
+    )
+
+
 def _validate_operation(document: dict[str, Any]) -> Optional[ErrorMessage]:
     if "operation" not in document.keys():
         return None
@@ -274,11 +334,377 @@ def _create_json_parsing_error(
     )
 
 
+class _TokenLengthChecker:
+    """
+    Checks token lengths of texts of validated documents in batches,
+    using the multithreaded batch encoding of the tokenizer.
+
+    Errors of documents are passed through the checker in order, and
+    are returned in the same order once token lengths of all preceding
+    texts have been checked, with sequence length errors added. At most
+    `_TOKENIZATION_BATCH_SIZE` documents are kept until they are checked.
+    """
+
+    def __init__(self, model: Optional[str]):
+        self._model = model
+        self._pending: List[
+            Tuple[Optional[ValidationError], Optional[int], Any, Optional[str]]
+        ] = []
+
+    def add(
+        self,
+        error: Optional[ValidationError],
+        document: Optional[dict[str, Any]] = None,
+        line_number: Optional[int] = None,
+    ) -> List[ValidationError]:
+        """
+        Adds errors of a document, validated without checking token
+        length of its text, and returns errors which are complete.
+        """
+        text = document.get("text") if document is not None else None
+        if (
+            not self._model
+            or not isinstance(text, str)
+            or not _may_exceed_sequence_length(text)
+        ):
+            text = None
+
+        if text is None:
+            if error is None:
+                return []
+
+            if not self._pending:
+                return [error]
+
+        document_id = document.get("id") if document is not None else None
+        self._pending.append((error, line_number, document_id, text))
+
+        if len(self._pending) < _TOKENIZATION_BATCH_SIZE:
+            return []
+
+        return self.flush()
+
+    def flush(self) -> List[ValidationError]:
+        """Checks all pending texts and returns the remaining errors."""
+        texts = [text for *_, text in self._pending if text is not None]
+        lengths = iter(
+            len(tokens)
+            for tokens in (
+                _encoding_for_model(self._model).encode_batch(texts)
+                if texts
+                else []
+            )
+        )
+
+        errors = []
+        for error, line_number, document_id, text in self._pending:
+            if text is not None and next(lengths) > _MAX_SEQUENCE_LENGTH:
+                error = _with_sequence_length_error(
+                    error, document_id, line_number
+                )
+            if error is not None:
+                errors.append(error)
+
+        self._pending = []
+
+        return errors
+
+
+def _with_sequence_length_error(
+    error: Optional[ValidationError],
+    document_id: Any,
+    line_number: int,
+) -> ValidationError:
+    if error is None:
+        return ValidationError(
+            document_id=document_id,
+            line_number=line_number,
+            errors=[_sequence_length_error()],
+        )
+
+    # The text error follows errors of the ID and the operation.
+    position = sum(
+        message.field_name in ("id", "operation") for message in error.errors
+    )
+    error.errors.insert(position, _sequence_length_error())
+    return error
+
+
+def _jsonl_shard_ranges(
+    file_path: str,
+    shards: int,
+) -> List[Tuple[int, int]]:
+    """
+    Splits a file into up to `shards` byte ranges of similar size,
+    each starting at the beginning of a line.
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+
+    with open(file_path, "rb") as file:
+        for shard in range(1, shards):
+            offset = size * shard // shards
+            if offset <= boundaries[-1]:
+                continue
+
+            file.seek(offset - 1)
+            # Moves to the start of the next line, unless the offset
+            # already is at the start of a line.
+            file.readline()
+            if file.tell() < size and file.tell() > boundaries[-1]:
+                boundaries.append(file.tell())
+
+    boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _validate_jsonl_range(
+    file_path: str,
+    start: int,
+    end: int,
+    collection_type: CollectionType,
+    model: Optional[str],
+    embeddings_dimension: Optional[int],
+) -> Tuple[List[ValidationError], List[ValidationError], List[Any]]:
+    """
+    Validates documents in a byte range of a JSONL file, without checking
+    for duplicates. Line numbers are relative to the start of the range.
+
+    Returns JSON parsing errors, document errors and IDs of all parsed
+    documents, indexed by their line number.
+    """
+    validator = DocumentValidator()
+    token_length_checker = _TokenLengthChecker(model)
+    parsing_errors = []
+    document_errors = []
+    document_ids: List[Any] = []
+
+    with open(file_path, "rb") as file:
+        file.seek(start)
+
+        while file.tell() < end:
+            line = file.readline()
+
+            try:
+                document = json.loads(line)
+            except JSONDecodeError as exception:
+                parsing_errors.append(
+                    _create_json_parsing_error(exception, len(document_ids))
+                )
+                continue
+
+            error = validator._validate_document(
+                document=document,
+                line_number=len(document_ids),
+                model=model,
+                collection_type=collection_type,
+                embeddings_dimension=embeddings_dimension,
+                check_token_length=False,
+            )
+            document_errors.extend(
+                token_length_checker.add(error, document, len(document_ids))
+            )
+            document_ids.append(document.get("id"))
+
+    document_errors.extend(token_length_checker.flush())
+
+    return parsing_errors, document_errors, document_ids
+
+
+def _is_list(data_type: arrow.DataType) -> bool:
+    return (
+        arrow.types.is_list(data_type)
+        or arrow.types.is_large_list(data_type)
+        or arrow.types.is_fixed_size_list(data_type)
+    )
+
+
+def _is_string(data_type: arrow.DataType) -> bool:
+    return arrow.types.is_string(data_type) or arrow.types.is_large_string(
+        data_type
+    )
+
+
+def _is_number(data_type: arrow.DataType) -> bool:
+    return arrow.types.is_integer(data_type) or arrow.types.is_floating(
+        data_type
+    )
+
+
+def _rows(condition: arrow.Array) -> numpy.ndarray:
+    return compute.fill_null(condition, False).to_numpy(zero_copy_only=False)
+
+
+def _all_rows(column: arrow.Array) -> numpy.ndarray:
+    return numpy.ones(len(column), dtype=bool)
+
+
+def _no_rows(column: arrow.Array) -> numpy.ndarray:
+    return numpy.zeros(len(column), dtype=bool)
+
+
+def _rows_with_null_items(column: arrow.Array) -> numpy.ndarray:
+    rows = _no_rows(column)
+    parents = compute.list_parent_indices(column)
+    null_items = compute.is_null(compute.list_flatten(column))
+    rows[compute.filter(parents, null_items).to_numpy()] = True
+    return rows
+
+
+def _suspect_ids(column: arrow.Array) -> numpy.ndarray:
+    if not _is_string(column.type):
+        return _all_rows(column)
+
+    return (
+        _rows(column.is_null())
+        | _rows(compute.greater(compute.utf8_length(column), _MAX_ID_LENGTH))
+        | _rows(compute.match_substring_regex(column, _INVALID_ID_CHARACTERS))
+    )
+
+
+def _suspect_texts(
+    column: arrow.Array,
+    model: Optional[str],
+) -> numpy.ndarray:
+    if not _is_string(column.type):
+        return _all_rows(column)
+
+    rows = _rows(column.is_null())
+
+    if model:
+        # Every token is at least one byte long, so shorter texts can't
+        # exceed the maximum sequence length. Special tokens are rejected
+        # by the tokenizer, which has to see them.
+        rows |= _rows(
+            compute.greater(
+                compute.binary_length(column), _MAX_SEQUENCE_LENGTH
+            )
+        )
+        rows |= _rows(compute.match_substring(column, _SPECIAL_TOKEN_PREFIX))
+
+    return rows
+
+
+def _suspect_operations(column: arrow.Array) -> numpy.ndarray:
+    if not _is_string(column.type):
+        return _all_rows(column)
+
+    return _rows(column.is_null()) | ~_rows(
+        compute.is_in(column, value_set=arrow.array(_VALID_OPERATIONS))
+    )
+
+
+def _suspect_meta_values(name: str, column: arrow.Array) -> numpy.ndarray:
+    data_type = column.type
+
+    if not _is_valid_meta_name(name):
+        return _all_rows(column)
+
+    # Nulls of numbers and strings are read as NaN, which is a valid
+    # value, unlike nulls of other types.
+    if _is_number(data_type):
+        return _no_rows(column)
+
+    if arrow.types.is_boolean(data_type):
+        return _rows(column.is_null())
+
+    if name.startswith("meta_ordered"):
+        return _all_rows(column)
+
+    if _is_string(data_type):
+        return _no_rows(column)
+
+    if _is_list(data_type):
+        rows = _rows(column.is_null())
+        value_type = data_type.value_type
+
+        if _is_string(value_type) or arrow.types.is_float64(value_type):
+            return rows | _rows_with_null_items(column)
+
+        return rows | _rows(
+            compute.greater(compute.list_value_length(column), 0)
+        )
+
+    return _all_rows(column)
+
+
+def _suspect_embeddings(
+    column: arrow.Array,
+    embeddings_dimension: Optional[int],
+) -> numpy.ndarray:
+    data_type = column.type
+
+    if not _is_list(data_type):
+        return _all_rows(column)
+
+    rows = _rows(column.is_null())
+
+    if not embeddings_dimension:
+        return rows
+
+    rows |= _rows(
+        compute.not_equal(
+            compute.list_value_length(column), embeddings_dimension
+        )
+    )
+
+    # Only 64-bit floats are read as Python floats.
+    if not arrow.types.is_float64(data_type.value_type):
+        return rows | _rows(
+            compute.greater(compute.list_value_length(column), 0)
+        )
+
+    return rows | _rows_with_null_items(column)
+
+
+def _suspect_rows(
+    batch: arrow.RecordBatch,
+    collection_type: CollectionType,
+    model: Optional[str],
+    embeddings_dimension: Optional[int],
+) -> numpy.ndarray:
+    """
+    Finds rows of a batch which may be invalid, using column-wise checks.
+    Every invalid row is found, but some of the rows found may be valid,
+    so they have to be validated row by row.
+    """
+    names = batch.schema.names
+    mandatory = collection_type == CollectionType.USER_PROVIDED_EMBEDDINGS
+    # Every row misses a required column.
+    all_rows = numpy.ones(batch.num_rows, dtype=bool)
+    rows = numpy.zeros(batch.num_rows, dtype=bool)
+
+    if "id" not in names:
+        return all_rows
+
+    rows |= _suspect_ids(batch.column("id"))
+
+    if "text" in names:
+        rows |= _suspect_texts(batch.column("text"), model)
+    elif mandatory:
+        return all_rows
+
+    if "operation" in names:
+        rows |= _suspect_operations(batch.column("operation"))
+
+    for name in names:
+        if name == "meta" or name.startswith("meta_"):
+            rows |= _suspect_meta_values(name, batch.column(name))
+
+    if "embeddings" in names:
+        rows |= _suspect_embeddings(
+            batch.column("embeddings"), embeddings_dimension
+        )
+    elif mandatory:
+        return all_rows
+
+    return rows
+
+
 class DocumentValidator:
     """Component for validating documents."""
 
-    _encountered_ids: set[str] = set()
-
     def _validate_document(
         self,
         document: dict[str, Any],
@@ -286,6 +712,8 @@ class DocumentValidator:
         collection_type: CollectionType,
         embeddings_dimension: Optional[int] = None,
         model: Optional[str] = None,
+        duplicates: Optional[DuplicateDetector] = None,
+        check_token_length: bool = True,
     ) -> Optional[ValidationError]:
         document_id = document.get("id")
         error_messages = []
@@ -294,12 +722,13 @@ class DocumentValidator:
         if id_error is not None:
             error_messages.append(id_error)
 
-        duplicate_document_error = _check_for_duplicate(
-            document_id=document_id,
-            encountered=self._encountered_ids,
-        )
-        if duplicate_document_error is not None:
-            error_messages.append(duplicate_document_error)
+        if duplicates is not None:
+            duplicate_document_error = _check_for_duplicate(
+                document_id=document_id,
+                duplicates=duplicates,
+            )
+            if duplicate_document_error is not None:
+                error_messages.append(duplicate_document_error)
 
         operation_error = _validate_operation(document)
         if operation_error is not None:
@@ -307,7 +736,7 @@ class DocumentValidator:
 
         text_error = _validate_text(
             document=document,
-            model=model,
+            model=model if check_token_length else None,
             mandatory=(
                 collection_type == CollectionType.USER_PROVIDED_EMBEDDINGS
             ),
@@ -329,9 +758,6 @@ class DocumentValidator:
         if embeddings_error is not None:
             error_messages.append(embeddings_error)
 
-        if document_id is not None:
-            self._encountered_ids.add(document_id)
-
         if not any(error_messages):
             return None
 
@@ -347,19 +773,31 @@ class DocumentValidator:
         collection_type: CollectionType,
         model: Optional[str] = None,
         embeddings_dimension: Optional[int] = None,
+        max_workers: int = 1,
+        max_id_memory_bytes: int = _DUPLICATE_DETECTION_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
     ) -> list[ValidationError]:
         """Validates documents from a JSONL file.
 
         Parameters
         ----------
         file_path : str
-            Path of the JSONL file in the filesystem.
+            Path of the JSONL file in the filesystem. The file may be
+            gzip or Zstandard compressed, or a tar archive of JSONL files.
         collection_type : CollectionType
             For what kind of collection are documents from this file intended.
         model : Optional[str] = None
             Which model should be used to generate embeddings (if any).
         embeddings_dimension : Optional[int] = None
             Dimension of embeddings (if provided in file).
+        max_workers : int = 1
+            Number of processes validating parts of the file in parallel.
+            Compressed files are always validated in a single process.
+        max_id_memory_bytes : int = 256 MiB
+            Approximate memory used to detect duplicate IDs. IDs which
+            don't fit are stored in a temporary file on disk.
+        max_errors : Optional[int] = None
+            Validation stops once this many errors are found.
 
         Raises
         ------
@@ -370,9 +808,68 @@ class DocumentValidator:
         -------
         List of encountered errors. If file is valid, the list will be empty.
         """
-        errors = []
+        return list(
+            self.iter_validate_jsonl(
+                file_path=file_path,
+                collection_type=collection_type,
+                model=model,
+                embeddings_dimension=embeddings_dimension,
+                max_workers=max_workers,
+                max_id_memory_bytes=max_id_memory_bytes,
+                max_errors=max_errors,
+            )
+        )
+
+    def iter_validate_jsonl(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str] = None,
+        embeddings_dimension: Optional[int] = None,
+        max_workers: int = 1,
+        max_id_memory_bytes: int = _DUPLICATE_DETECTION_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[ValidationError]:
+        """
+        Validates documents from a JSONL file, yielding errors as they
+        are found, in the same order as `validate_jsonl` returns them.
+        Validation stops when the iterator is closed, or once
+        `max_errors` errors were yielded.
+
+        See `validate_jsonl` for description of parameters.
+        """
+        with DuplicateDetector(max_id_memory_bytes) as duplicates:
+            if max_workers > 1 and detect_compression(file_path) is None:
+                errors = self._validate_jsonl_parallel(
+                    file_path=file_path,
+                    collection_type=collection_type,
+                    model=model,
+                    embeddings_dimension=embeddings_dimension,
+                    max_workers=max_workers,
+                    duplicates=duplicates,
+                )
+            else:
+                errors = self._validate_jsonl_sequential(
+                    file_path=file_path,
+                    collection_type=collection_type,
+                    model=model,
+                    embeddings_dimension=embeddings_dimension,
+                    duplicates=duplicates,
+                )
+
+            yield from _limited(errors, max_errors)
+
+    def _validate_jsonl_sequential(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str],
+        embeddings_dimension: Optional[int],
+        duplicates: DuplicateDetector,
+    ) -> Iterator[ValidationError]:
         line_number = 0
-        with open(file_path, 'r') as file:
+        token_length_checker = _TokenLengthChecker(model)
+        with open_jsonl(file_path) as stream, io.TextIOWrapper(stream) as file:
             document = None
             line = None
             while True:
@@ -385,7 +882,7 @@ class DocumentValidator:
                 try:
                     document = json.loads(line)
                 except JSONDecodeError as exception:
-                    errors.append(
+                    yield from token_length_checker.add(
                         _create_json_parsing_error(
                             exception,
                             line_number,
@@ -399,12 +896,152 @@ class DocumentValidator:
                     model=model,
                     collection_type=collection_type,
                     embeddings_dimension=embeddings_dimension,
+                    duplicates=duplicates,
+                    check_token_length=False,
+                )
+                yield from token_length_checker.add(
+                    error, document, line_number
                 )
-                if error is not None:
-                    errors.append(error)
                 line_number += 1
 
-        return errors
+        yield from token_length_checker.flush()
+
+    def _validate_jsonl_parallel(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str],
+        embeddings_dimension: Optional[int],
+        max_workers: int,
+        duplicates: DuplicateDetector,
+    ) -> Iterator[ValidationError]:
+        """
+        Validates byte ranges of a JSONL file in a pool of processes and
+        merges their errors, checking for duplicates across all ranges.
+        Errors are the same, and in the same order, as if the file was
+        validated in a single process.
+        """
+        shards = max(
+            1,
+            min(
+                max_workers * _SHARDS_PER_WORKER,
+                os.path.getsize(file_path) // _MIN_SHARD_BYTES,
+            ),
+        )
+        ranges = _jsonl_shard_ranges(file_path, shards)
+        line_offset = 0
+
+        ranges = iter(ranges)
+        pending: Deque[Future] = deque()
+
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                # Only as many ranges as there are workers are submitted
+                # ahead, so that results of later ranges don't pile up
+                # while an earlier range is being validated.
+                for start, end in islice(ranges, max_workers - len(pending)):
+                    pending.append(
+                        executor.submit(
+                            _validate_jsonl_range,
+                            file_path,
+                            start,
+                            end,
+                            collection_type,
+                            model,
+                            embeddings_dimension,
+                        )
+                    )
+
+                if not pending:
+                    break
+
+                (
+                    parsing_errors,
+                    document_errors,
+                    document_ids,
+                ) = pending.popleft().result()
+                yield from self._merge_shard_errors(
+                    parsing_errors=parsing_errors,
+                    document_errors=document_errors,
+                    document_ids=document_ids,
+                    line_offset=line_offset,
+                    duplicates=duplicates,
+                )
+                line_offset += len(document_ids)
+        finally:
+            # Submitted ranges which are not validated yet are skipped
+            # if iteration stops early.
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
+
+    def _with_duplicate_error(
+        self,
+        error: Optional[ValidationError],
+        document_id: Any,
+        line_number: int,
+        duplicates: DuplicateDetector,
+    ) -> Optional[ValidationError]:
+        """
+        Checks a document validated without checking for duplicates
+        for a duplicate ID and adds the error to the document's errors.
+        """
+        duplicate_error = _check_for_duplicate(
+            document_id=document_id,
+            duplicates=duplicates,
+        )
+
+        if duplicate_error is None:
+            return error
+
+        if error is None:
+            return ValidationError(
+                document_id=document_id,
+                line_number=line_number,
+                errors=[duplicate_error],
+            )
+
+        # The duplicate error follows an error of the ID itself.
+        position = 1 if _validate_id({"id": document_id}) else 0
+        error.errors.insert(position, duplicate_error)
+        return error
+
+    def _merge_shard_errors(
+        self,
+        parsing_errors: List[ValidationError],
+        document_errors: List[ValidationError],
+        document_ids: List[Any],
+        line_offset: int,
+        duplicates: DuplicateDetector,
+    ) -> List[ValidationError]:
+        errors_by_line = {
+            error.line_number: error for error in document_errors
+        }
+
+        for line_number, document_id in enumerate(document_ids):
+            error = self._with_duplicate_error(
+                error=errors_by_line.get(line_number),
+                document_id=document_id,
+                line_number=line_number,
+                duplicates=duplicates,
+            )
+            if error is not None:
+                errors_by_line[line_number] = error
+
+        # A parsing error is numbered as the document following it.
+        ordered = sorted(
+            [(error.line_number, 0, error) for error in parsing_errors]
+            + [(line, 1, error) for line, error in errors_by_line.items()],
+            key=lambda item: item[:2],
+        )
+
+        return [
+            error.model_copy(
+                update={"line_number": error.line_number + line_offset}
+            )
+            for _, _, error in ordered
+        ]
 
     """
     Validates documents from a Parquet file.
@@ -419,6 +1056,11 @@ class DocumentValidator:
         Which model should be used to generate embeddings (if any).
     embeddings_dimension : Optional[int] = None
         Dimension of embeddings (if provided in file).
+    max_id_memory_bytes : int = 256 MiB
+        Approximate memory used to detect duplicate IDs. IDs which
+        don't fit are stored in a temporary file on disk.
+    max_errors : Optional[int] = None
+        Validation stops once this many errors are found.
 
     Raises
     ------
@@ -436,27 +1078,204 @@ class DocumentValidator:
         collection_type: CollectionType,
         model: Optional[str] = None,
         embeddings_dimension: Optional[int] = None,
+        max_id_memory_bytes: int = _DUPLICATE_DETECTION_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
     ) -> list[ValidationError]:
-        parquet_file = parquet.ParquetFile(file_path)
-        batches = parquet_file.iter_batches(batch_size=4096)
+        return list(
+            self.iter_validate_parquet(
+                file_path=file_path,
+                collection_type=collection_type,
+                model=model,
+                embeddings_dimension=embeddings_dimension,
+                max_id_memory_bytes=max_id_memory_bytes,
+                max_errors=max_errors,
+            )
+        )
+
+    def iter_validate_parquet(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str] = None,
+        embeddings_dimension: Optional[int] = None,
+        max_id_memory_bytes: int = _DUPLICATE_DETECTION_MEMORY_BYTES,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[ValidationError]:
+        """
+        Validates documents from a Parquet file, yielding errors of each
+        batch of rows as soon as it is validated. Validation stops when
+        the iterator is closed, or once `max_errors` errors were yielded.
+
+        See `validate_parquet` for description of parameters.
+        """
+        with DuplicateDetector(max_id_memory_bytes) as duplicates:
+            yield from _limited(
+                self._validate_parquet_batches(
+                    file_path=file_path,
+                    collection_type=collection_type,
+                    model=model,
+                    embeddings_dimension=embeddings_dimension,
+                    duplicates=duplicates,
+                ),
+                max_errors,
+            )
+
+    def _validate_parquet_batches(
+        self,
+        file_path: str,
+        collection_type: CollectionType,
+        model: Optional[str],
+        embeddings_dimension: Optional[int],
+        duplicates: DuplicateDetector,
+    ) -> Iterator[ValidationError]:
+        parquet_file = parquet.ParquetFile(file_path, memory_map=True)
+        batches = parquet_file.iter_batches(batch_size=_PARQUET_BATCH_SIZE)
         line_number = 0
-        errors = []
 
         for batch in batches:
-            items = batch.to_pandas().to_dict(orient="records")
-            for document in items:
+            yield from self._validate_parquet_batch(
+                batch=batch,
+                first_line_number=line_number,
+                collection_type=collection_type,
+                model=model,
+                embeddings_dimension=embeddings_dimension,
+                duplicates=duplicates,
+            )
+            line_number += batch.num_rows
+
+    def _validate_parquet_batch(
+        self,
+        batch: arrow.RecordBatch,
+        first_line_number: int,
+        collection_type: CollectionType,
+        model: Optional[str],
+        embeddings_dimension: Optional[int],
+        duplicates: DuplicateDetector,
+    ) -> List[ValidationError]:
+        """
+        Validates a batch column by column, and only rows which may be
+        invalid row by row, so that their errors are reported exactly
+        as if all rows were validated one by one.
+        """
+        suspect_rows = _suspect_rows(
+            batch=batch,
+            collection_type=collection_type,
+            model=model,
+            embeddings_dimension=embeddings_dimension,
+        )
+
+        documents = {}
+        if suspect_rows.any():
+            # Rows are converted within the whole batch, so that values
+            # are read exactly as when all rows are validated.
+            indexes = numpy.flatnonzero(suspect_rows)
+            records = batch.to_pandas().iloc[indexes].to_dict(orient="records")
+            documents = dict(zip(indexes.tolist(), records))
+
+        if len(documents) < batch.num_rows:
+            ids = batch.column("id").to_pylist()
+
+        errors = []
+        token_length_checker = _TokenLengthChecker(model)
+        for index in range(batch.num_rows):
+            line_number = first_line_number + index
+            document = documents.get(index)
+            error = None
+
+            if document is not None:
                 error = self._validate_document(
                     document=document,
                     line_number=line_number,
                     model=model,
                     collection_type=collection_type,
                     embeddings_dimension=embeddings_dimension,
+                    check_token_length=False,
                 )
-                if error is not None:
-                    errors.append(error)
-                line_number += 1
+
+            error = self._with_duplicate_error(
+                error=error,
+                document_id=(
+                    document.get("id") if document is not None else ids[index]
+                ),
+                line_number=line_number,
+                duplicates=duplicates,
+            )
+            errors.extend(
+                token_length_checker.add(error, document, line_number)
+            )
+
+        errors.extend(token_length_checker.flush())
 
         return errors
 
 
+def _limited(
+    errors: Iterator[ValidationError],
+    max_errors: Optional[int],
+) -> Iterator[ValidationError]:
+    if max_errors is not None and max_errors < 1:
+        raise ValueError("max_errors must be at least 1.")
+
+    # Closing stops validation, which may be running in other processes.
+    with closing(errors):
+        yield from islice(errors, max_errors)
+
+
+def _report_batches(
+    errors: Iterable[ValidationError],
+    summary: ValidationSummary,
+) -> Iterator[List[dict[str, Any]]]:
+    batch = []
+
+    for error in errors:
+        summary.add(error)
+        batch.append(error.to_dict())
+
+        if len(batch) == _REPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def write_validation_report(
+    errors: Iterable[ValidationError],
+    report_path: str,
+) -> ValidationSummary:
+    """
+    Writes validation errors to a report file as they are produced,
+    without keeping them in memory.
+
+    Parameters
+    ----------
+    errors : Iterable[ValidationError]
+        Validation errors, e.g. from `iter_validate_jsonl`.
+    report_path : str
+        Path of the report. If it ends with ".parquet", the report is
+        written as a Parquet file, and as a JSONL file otherwise. Each
+        row of the report is the dictionary of a `ValidationError`.
+
+    Returns
+    -------
+    ValidationSummary
+        Counts of written errors.
+    """
+    summary = ValidationSummary()
+    batches = _report_batches(errors, summary)
+
+    if report_path.lower().endswith(".parquet"):
+        with parquet.ParquetWriter(report_path, _REPORT_SCHEMA) as writer:
+            for batch in batches:
+                writer.write_batch(
+                    arrow.RecordBatch.from_pylist(batch, schema=_REPORT_SCHEMA)
+                )
+    else:
+        with open(report_path, "w", encoding="utf-8") as report:
+            for batch in batches:
+                report.writelines(f"{json.dumps(row)}\n" for row in batch)
+
+    return summary
+
+
 VALIDATOR = DocumentValidator()
@@ -0,0 +1,77 @@
+from typing import Optional
+
+import numpy
+
+from vantage_sdk.config import UNIT_VECTOR_TOLERANCE
+
+
+def as_embeddings_matrix(
+    embeddings, dtype: Optional[numpy.dtype] = None
+) -> numpy.ndarray:
+    """
+    Converts embeddings to a contiguous matrix of the given type. If no
+    type is given, floating point embeddings keep their precision and
+    other embeddings are converted to float32.
+    """
+    if dtype is None:
+        dtype = numpy.asarray(embeddings).dtype
+        if not numpy.issubdtype(dtype, numpy.floating):
+            dtype = numpy.float32
+
+    matrix = numpy.ascontiguousarray(embeddings, dtype=dtype)
+
+    if matrix.ndim != 2:
+        raise ValueError(
+            "Embeddings must be a matrix with one row per vector."
+        )
+
+    return matrix
+
+
+def vector_magnitudes(embeddings: numpy.ndarray) -> numpy.ndarray:
+    """
+    Computes magnitude of each row of the matrix,
+    accumulating in double precision.
+    """
+    return numpy.sqrt(
+        numpy.einsum("ij,ij->i", embeddings, embeddings, dtype=numpy.float64)
+    )
+
+
+def non_unit_vectors(
+    embeddings: numpy.ndarray,
+    tolerance: float = UNIT_VECTOR_TOLERANCE,
+) -> numpy.ndarray:
+    """Returns indexes of rows which are not unit vectors."""
+    magnitudes = vector_magnitudes(embeddings)
+
+    return numpy.flatnonzero(~(numpy.abs(magnitudes - 1.0) < tolerance))
+
+
+def check_unit_vectors(
+    embeddings: numpy.ndarray,
+    tolerance: float = UNIT_VECTOR_TOLERANCE,
+) -> None:
+    """Raises ValueError if any row of the matrix is not a unit vector."""
+    invalid = non_unit_vectors(embeddings, tolerance)
+
+    if invalid.size:
+        raise ValueError(
+            f"Provided embedding vector is not a unit vector "
+            f"for {invalid.size} rows, e.g. row {int(invalid[0])}."
+        )
+
+
+def normalize_vectors(embeddings: numpy.ndarray) -> numpy.ndarray:
+    """
+    Scales each row of the matrix to a unit vector,
+    returning a new matrix of the same type.
+    """
+    magnitudes = vector_magnitudes(embeddings)
+
+    if not numpy.all(magnitudes > 0):
+        raise ValueError("Zero vectors can't be normalized.")
+
+    normalized = embeddings / magnitudes[:, numpy.newaxis]
+
+    return normalized.astype(embeddings.dtype, copy=False)
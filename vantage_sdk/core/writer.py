@@ -0,0 +1,235 @@
+"""
+Write-behind buffering of document upserts and deletes.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import Future, wait
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from vantage_sdk.config import DEFAULT_ENCODING
+from vantage_sdk.model.document import (
+    UserProvidedEmbeddingsDocument,
+    VantageManagedEmbeddingsDocument,
+)
+
+
+class _Buffer:
+    __slots__ = ("lines", "futures", "size", "created")
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.futures: List[Future] = []
+        self.size = 0
+        self.created = time.monotonic()
+
+
+class DocumentWriter:
+    """
+    Buffers documents written from any number of threads and uploads
+    them in batches from a background thread.
+
+    Documents are buffered per collection. A buffer is uploaded by a
+    background thread once it holds `max_batch_documents` documents or
+    `max_batch_bytes` bytes, or once its oldest document has waited for
+    `max_latency_seconds`. All buffers are uploaded on `flush` and on
+    `close`.
+
+    Every write returns a future, which completes once the batch
+    containing the document has been accepted by the API, or fails with
+    the exception raised while uploading it. Operations on the same
+    document are uploaded in the order in which they were written.
+    """
+
+    def __init__(
+        self,
+        upload: Callable[[str, str], None],
+        max_batch_documents: int,
+        max_batch_bytes: int,
+        max_latency_seconds: float,
+        encoding: str = DEFAULT_ENCODING,
+    ):
+        """
+        Parameters
+        ----------
+        upload : Callable[[str, str], None]
+            Function uploading a JSONL batch to a collection,
+            called with the collection ID and the batch.
+        max_batch_documents : int
+            Number of buffered documents which triggers an upload.
+        max_batch_bytes : int
+            Size of buffered documents in bytes which triggers an upload.
+        max_latency_seconds : float
+            Longest time a document is kept in the buffer.
+        encoding : str, optional
+            Encoding used to measure the size of documents.
+        """
+        if max_batch_documents < 1:
+            raise ValueError("max_batch_documents must be at least 1.")
+
+        if max_latency_seconds <= 0:
+            raise ValueError("max_latency_seconds must be positive.")
+
+        self._upload = upload
+        self._max_batch_documents = max_batch_documents
+        self._max_batch_bytes = max_batch_bytes
+        self._max_latency_seconds = max_latency_seconds
+        self._encoding = encoding
+
+        self._condition = threading.Condition()
+        self._buffers: Dict[str, _Buffer] = {}
+        self._ready: List[Tuple[str, _Buffer]] = []
+        self._flush_requested = False
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="vantage-document-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self) -> DocumentWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def upsert(
+        self,
+        collection_id: str,
+        document: Union[
+            VantageManagedEmbeddingsDocument,
+            UserProvidedEmbeddingsDocument,
+        ],
+    ) -> Future:
+        """
+        Buffers a document to be upserted to the collection.
+        The document is not checked for compatibility with the collection.
+        """
+        return self._write(
+            collection_id, json.dumps(document.to_vantage_dict())
+        )
+
+    def delete(self, collection_id: str, document_id: str) -> Future:
+        """Buffers deletion of a document from the collection."""
+        return self._write(
+            collection_id,
+            json.dumps({"id": document_id, "operation": "delete"}),
+        )
+
+    def flush(self) -> None:
+        """
+        Uploads all buffered documents and waits until they are uploaded.
+        Does not raise upload errors, which are reported by the futures.
+        """
+        with self._condition:
+            buffers = chain(
+                self._buffers.values(),
+                (buffer for _, buffer in self._ready),
+            )
+            futures = [
+                future for buffer in buffers for future in buffer.futures
+            ]
+            self._flush_requested = True
+            self._condition.notify()
+
+        wait(futures)
+
+    def close(self) -> None:
+        """
+        Uploads all buffered documents and stops the background thread.
+        No documents can be written afterwards.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        self._thread.join()
+
+    def _write(self, collection_id: str, line: str) -> Future:
+        future: Future = Future()
+        line = f"{line}\n"
+        size = len(line.encode(self._encoding))
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Document writer is closed.")
+
+            buffer = self._buffers.get(collection_id)
+            if buffer is None:
+                buffer = self._buffers[collection_id] = _Buffer()
+                # Wakes up the background thread to start the timer.
+                self._condition.notify()
+
+            buffer.lines.append(line)
+            buffer.futures.append(future)
+            buffer.size += size
+
+            if self._is_full(buffer):
+                del self._buffers[collection_id]
+                self._ready.append((collection_id, buffer))
+                self._condition.notify()
+
+        return future
+
+    def _is_full(self, buffer: _Buffer) -> bool:
+        return (
+            len(buffer.lines) >= self._max_batch_documents
+            or buffer.size >= self._max_batch_bytes
+        )
+
+    def _take_ready_buffers(self) -> List[Tuple[str, _Buffer]]:
+        """
+        Waits until some buffers are ready for upload and removes them,
+        in the order in which they have to be uploaded. Returns an empty
+        list once the writer is closed and all buffers were taken.
+        """
+        with self._condition:
+            while True:
+                flush_all = self._closed or self._flush_requested
+                self._flush_requested = False
+
+                now = time.monotonic()
+                for collection_id, buffer in list(self._buffers.items()):
+                    if (
+                        flush_all
+                        or now - buffer.created >= self._max_latency_seconds
+                    ):
+                        del self._buffers[collection_id]
+                        self._ready.append((collection_id, buffer))
+
+                if self._ready or self._closed:
+                    ready, self._ready = self._ready, []
+                    return ready
+
+                timeout: Optional[float] = None
+                if self._buffers:
+                    oldest = min(
+                        buffer.created for buffer in self._buffers.values()
+                    )
+                    timeout = oldest + self._max_latency_seconds - now
+
+                self._condition.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            ready = self._take_ready_buffers()
+
+            if not ready:
+                return
+
+            for collection_id, buffer in ready:
+                try:
+                    self._upload(collection_id, "".join(buffer.lines))
+                except BaseException as error:
+                    for future in buffer.futures:
+                        future.set_exception(error)
+                    continue
+
+                for future in buffer.futures:
+                    future.set_result(None)
@@ -0,0 +1,41 @@
+"""
+Models for the SDK caches.
+"""
+
+from pydantic import BaseModel, StrictInt
+
+
+class CacheStats(BaseModel):
+    """
+    Snapshot of cache counters.
+
+    Attributes
+    ----------
+    hits : StrictInt
+        Number of lookups which found a valid entry.
+    misses : StrictInt
+        Number of lookups which found no valid entry.
+    evictions : StrictInt
+        Number of entries removed to stay within cache limits.
+    expirations : StrictInt
+        Number of entries removed because they outlived their TTL.
+    invalidations : StrictInt
+        Number of entries removed by explicit invalidation.
+    entries : StrictInt
+        Number of entries currently in the cache.
+    size_bytes : StrictInt
+        Approximate size of entries currently in the cache, in bytes.
+    """
+
+    hits: StrictInt = 0
+    misses: StrictInt = 0
+    evictions: StrictInt = 0
+    expirations: StrictInt = 0
+    invalidations: StrictInt = 0
+    entries: StrictInt = 0
+    size_bytes: StrictInt = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -3,9 +3,12 @@ Models for the Documents API.
 """
 
 import math
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Mapping, Optional, Sequence, Union
 from uuid import uuid4
 
+import numpy
+import pyarrow as arrow
+import pyarrow.compute as compute
 from pydantic import (
     BaseModel,
     Field,
@@ -21,6 +24,12 @@ from vantage_sdk.config import (
     METADATA_PREFIX,
     UNIT_VECTOR_TOLERANCE,
 )
+from vantage_sdk.core.vector_util import (
+    as_embeddings_matrix,
+    check_unit_vectors,
+    non_unit_vectors,
+    normalize_vectors,
+)
 
 
 class MetadataItem(BaseModel):
@@ -161,11 +170,212 @@ class UserProvidedEmbeddingsDocument(VantageDocument):
     def embedding_vector_unit_vector_validation(cls, cls_values):
         embedding_vector = cls_values.get("embeddings")
 
-        sum_of_squares = sum(x**2 for x in embedding_vector)
-
-        magnitude = math.sqrt(sum_of_squares)
+        magnitude = math.hypot(*embedding_vector)
 
         if not abs(magnitude - 1.0) < UNIT_VECTOR_TOLERANCE:
             raise ValueError('Provided embedding vector is not a unit vector.')
 
         return cls_values
+
+    @classmethod
+    def from_embeddings_matrix(
+        cls,
+        ids: Sequence[str],
+        embeddings: numpy.ndarray,
+        texts: Optional[Sequence[Optional[str]]] = None,
+        normalize: bool = False,
+    ) -> List["UserProvidedEmbeddingsDocument"]:
+        """
+        Creates documents from a matrix of embeddings, one row per document.
+
+        Unit length of all vectors is checked at once, or, if `normalize`
+        is True, all vectors are scaled to unit length. Documents are then
+        created without validating each of them again.
+
+        Parameters
+        ----------
+        ids : Sequence[str]
+            Unique identifiers of the documents.
+        embeddings : numpy.ndarray
+            Matrix of embeddings with one row per document. Floating
+            point embeddings are sent with their own precision, other
+            types are converted to float32.
+        texts : Optional[Sequence[Optional[str]]], optional
+            Text of each document. Defaults to None.
+        normalize : bool, optional
+            If True, vectors are scaled to unit length instead of being
+            checked. Defaults to False.
+
+        Returns
+        -------
+        List[UserProvidedEmbeddingsDocument]
+            Documents in the same order as `ids`.
+        """
+        matrix = as_embeddings_matrix(embeddings)
+
+        if len(matrix) != len(ids) or (
+            texts is not None and len(texts) != len(ids)
+        ):
+            raise ValueError("Number of ids, embeddings and texts must match.")
+
+        if normalize:
+            matrix = normalize_vectors(matrix)
+        else:
+            check_unit_vectors(matrix)
+
+        return [
+            cls.model_construct(id=id, embeddings=vector, text=text)
+            for id, vector, text in zip(
+                ids, matrix.tolist(), texts or [None] * len(ids)
+            )
+        ]
+
+
+class DocumentBatch:
+    """
+    Columnar container of many documents of the same type.
+
+    Instead of one model per document, ids, text and metadata are stored
+    as Arrow columns and embeddings as a single float32 matrix. All
+    columns are validated at once when the batch is created, and the
+    batch is encoded to JSONL or Parquet without creating per-document
+    objects.
+
+    A batch with embeddings is meant for user-provided embeddings
+    collections, a batch without them for Vantage-managed embeddings
+    collections, in which case text is required.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        text: Optional[Sequence[str]] = None,
+        embeddings: Optional[numpy.ndarray] = None,
+        metadata: Optional[Mapping[str, Sequence]] = None,
+        sortable_metadata: Optional[Mapping[str, Sequence[float]]] = None,
+        normalize: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        ids : Sequence[str]
+            Unique identifiers of the documents.
+        text : Optional[Sequence[str]], optional
+            Text of each document. Required if `embeddings`
+            are not provided.
+        embeddings : Optional[numpy.ndarray], optional
+            Matrix of embeddings with one unit vector per document.
+        metadata : Optional[Mapping[str, Sequence]], optional
+            Metadata columns, keyed by metadata key without prefix.
+            Values must be strings, integers, floats or booleans.
+        sortable_metadata : Optional[Mapping[str, Sequence[float]]], optional
+            Sortable metadata columns, keyed by metadata key without
+            prefix. Values must be floats.
+        normalize : bool, optional
+            If True, embeddings are scaled to unit vectors instead of
+            being checked to be unit vectors. Defaults to False.
+        """
+        columns: Dict[str, arrow.Array] = {
+            "id": arrow.array(ids, type=arrow.string()),
+        }
+
+        if text is not None:
+            columns["text"] = arrow.array(text, type=arrow.string())
+
+        for key, values in (metadata or {}).items():
+            columns[METADATA_PREFIX + key] = arrow.array(values)
+
+        for key, values in (sortable_metadata or {}).items():
+            column = arrow.array(values)
+            if not arrow.types.is_floating(column.type):
+                raise ValueError(
+                    f"Values of sortable metadata {key} must be floats."
+                )
+            columns[METADATA_ORDERED_PREFIX + key] = column
+
+        if embeddings is not None:
+            embeddings = as_embeddings_matrix(embeddings, numpy.float32)
+            if normalize:
+                embeddings = normalize_vectors(embeddings)
+
+        self._table = arrow.table(columns)
+        self._embeddings = embeddings
+
+        self._validate()
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    @property
+    def user_provided_embeddings(self) -> bool:
+        return self._embeddings is not None
+
+    @property
+    def ids(self) -> arrow.Array:
+        return self._table.column("id").combine_chunks()
+
+    @property
+    def embeddings(self) -> Optional[numpy.ndarray]:
+        return self._embeddings
+
+    def to_arrow(self) -> arrow.Table:
+        """
+        Returns the batch as a table with one column per document field,
+        named the same way as in a Vantage parquet file.
+        """
+        if self._embeddings is None:
+            return self._table
+
+        _, dimension = self._embeddings.shape
+        embeddings = arrow.FixedSizeListArray.from_arrays(
+            arrow.array(self._embeddings.reshape(-1)), dimension
+        )
+
+        return self._table.append_column("embeddings", embeddings)
+
+    def to_jsonl(self) -> str:
+        """Encodes the batch as JSONL, one document per line."""
+        dataframe = self._table.to_pandas()
+
+        if self._embeddings is not None:
+            dataframe["embeddings"] = list(self._embeddings)
+
+        return dataframe.to_json(
+            orient="records",
+            lines=True,
+            double_precision=10,
+            force_ascii=False,
+        ).rstrip("\n")
+
+    def _validate(self) -> None:
+        rows = self._table.num_rows
+
+        if rows == 0:
+            raise ValueError("Document batch can't be empty.")
+
+        for name, column in zip(self._table.column_names, self._table.columns):
+            if column.null_count:
+                raise ValueError(f"Column {name} contains missing values.")
+
+        if compute.count_distinct(self._table.column("id")).as_py() != rows:
+            raise ValueError("Document ids must be unique.")
+
+        if self._embeddings is None:
+            if "text" not in self._table.column_names:
+                raise ValueError(
+                    "Text is required for documents without embeddings."
+                )
+            return
+
+        if len(self._embeddings) != rows:
+            raise ValueError(
+                "Embeddings must be a matrix with one row per document."
+            )
+
+        invalid = non_unit_vectors(self._embeddings)
+        if invalid.size:
+            raise ValueError(
+                f"Provided embedding vector is not a unit vector "
+                f"for {invalid.size} documents, "
+                f"e.g. {self._table.column('id')[int(invalid[0])]}."
+            )
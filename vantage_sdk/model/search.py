@@ -294,3 +294,132 @@ class TotalCountsOptions(BaseModel):
 
     min_score_threshold: Optional[Union[StrictFloat, StrictInt]] = None
     max_score_threshold: Optional[Union[StrictFloat, StrictInt]] = None
+
+
+class SearchRequest(BaseModel):
+    """
+    Base class of search requests executed using `batch_search`.
+
+    Attributes
+    ----------
+    collection_id : StrictStr
+        The ID of the collection to search within.
+    accuracy : Optional[float], optional
+        The accuracy threshold for the search.
+    pagination : Optional[Pagination], optional
+        Pagination settings for the search results.
+    filter : Optional[Filter], optional
+        Filter settings to narrow down the search results.
+    sort : Optional[Sort], optional
+        Sorting settings for the search results.
+    field_value_weighting : Optional[FieldValueWeighting], optional
+        Weighting settings for specific field values in the search.
+    facets : Optional[List[Facet]], optional
+        Array of objects defining specific attributes of the data.
+    vantage_api_key : Optional[StrictStr], optional
+        The Vantage API key used for authentication.
+        If not provided, the client's API key is used.
+    account_id : Optional[StrictStr], optional
+        The account ID associated with the search.
+        If not provided, the client's account ID is used.
+    """
+
+    collection_id: StrictStr
+    accuracy: Optional[float] = None
+    pagination: Optional[Pagination] = None
+    filter: Optional[Filter] = None
+    sort: Optional[Sort] = None
+    field_value_weighting: Optional[FieldValueWeighting] = None
+    facets: Optional[List[Facet]] = None
+    vantage_api_key: Optional[StrictStr] = None
+    account_id: Optional[StrictStr] = None
+
+
+class SemanticSearchRequest(SearchRequest):
+    """
+    Semantic search request, executed the same way as `semantic_search`.
+
+    Attributes
+    ----------
+    text : StrictStr
+        The text query for the semantic search.
+    total_counts : Optional[TotalCountsOptions], optional
+        Similarity score range used to calculate the total
+        number of documents that match it.
+    """
+
+    text: StrictStr
+    total_counts: Optional[TotalCountsOptions] = None
+
+
+class EmbeddingSearchRequest(SearchRequest):
+    """
+    Embedding search request, executed the same way as `embedding_search`.
+
+    Attributes
+    ----------
+    embedding : List[Union[StrictInt, StrictFloat]]
+        The embedding used for the search.
+    """
+
+    embedding: List[Union[StrictInt, StrictFloat]]
+
+
+class MoreLikeThisSearchRequest(SearchRequest):
+    """
+    "More Like This" search request, executed the same
+    way as `more_like_this_search`.
+
+    Attributes
+    ----------
+    document_id : StrictStr
+        The ID of the document to find similar documents to.
+    """
+
+    document_id: StrictStr
+
+
+class VantageVibeSearchRequest(SearchRequest):
+    """
+    Vantage Vibe search request, executed the same
+    way as `vantage_vibe_search`.
+
+    Attributes
+    ----------
+    vibe_id : StrictStr
+        The ID of the Vantage vibe.
+    images : List[Union[VantageVibeImageUrl, VantageVibeImageBase64]]
+        The images to find documents with the same vibe.
+    text : Optional[StrictStr], optional
+        The text query for the search.
+    """
+
+    vibe_id: StrictStr
+    images: List[Union[VantageVibeImageUrl, VantageVibeImageBase64]]
+    text: Optional[StrictStr] = None
+
+
+class BatchSearchResult(BaseModel):
+    """
+    Represents the outcome of a single request executed by `batch_search`.
+
+    Exactly one of `result` and `error` is set.
+
+    Attributes
+    ----------
+    result : Optional[SearchResult], optional
+        Search result, if the request has succeeded.
+    error : Optional[Exception], optional
+        Exception raised while executing the request, if it has failed.
+    """
+
+    result: Optional[SearchResult] = None
+    error: Optional[Exception] = None
+
+    # Pydantic Config
+    class Config:
+        arbitrary_types_allowed = True
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
@@ -52,3 +52,45 @@ class ValidationError(BaseModel):
             "line_number": self.line_number,
             "errors": [error.__dict__ for error in self.errors],
         }
+
+
+class ValidationSummary(BaseModel):
+    """
+    Counts of validation errors, kept without storing the errors.
+
+    Arguments
+    ---------
+    documents_with_errors: int
+        Number of documents, and lines which are not valid JSON,
+        with at least one error.
+    error_count: int
+        Number of error messages.
+    error_counts: dict[str, int]
+        Number of error messages per error type. Type of an error is
+        the name of the erroneous field, "meta" for all meta fields,
+        or "json" for lines which are not valid JSON.
+    """
+
+    documents_with_errors: int = 0
+    error_count: int = 0
+    error_counts: dict[str, int] = {}
+
+    def add(self, error: ValidationError) -> None:
+        self.documents_with_errors += 1
+        self.error_count += len(error.errors)
+
+        for message in error.errors:
+            error_type = _error_type(message)
+            self.error_counts[error_type] = (
+                self.error_counts.get(error_type, 0) + 1
+            )
+
+
+def _error_type(message: ErrorMessage) -> str:
+    if message.field_name is None:
+        return "json"
+
+    if message.field_name == "meta" or message.field_name.startswith("meta_"):
+        return "meta"
+
+    return message.field_name